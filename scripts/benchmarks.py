@@ -0,0 +1,770 @@
+"""
+Small benchmarks for the data processing pipeline.
+
+Usage (from the repository root):
+    python scripts/benchmarks.py import_time
+    python scripts/benchmarks.py clean_text
+    python scripts/benchmarks.py aggregations
+    python scripts/benchmarks.py topics
+    python scripts/benchmarks.py loader
+    python scripts/benchmarks.py cache
+    python scripts/benchmarks.py turns
+    python scripts/benchmarks.py aggregates
+    python scripts/benchmarks.py term_index
+    python scripts/benchmarks.py scraper --pages 100 --latency 0.2
+    python scripts/benchmarks.py refresh --pages 200 --new 5
+    python scripts/benchmarks.py checkpoint --articles 500
+    python scripts/benchmarks.py parse --pages 200
+    python scripts/benchmarks.py response_cache --pages 200
+    python scripts/benchmarks.py sentiment --date 2025-10-08   (needs pysentimiento)
+    python scripts/benchmarks.py backends --onnx sentiment.onnx  (needs pysentimiento)
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+CHECKPOINT_CSV = os.path.join(REPO_ROOT, "data", "raw", "article_transcripts_checkpoint.csv")
+
+# Make sure we benchmark src/data_processing.py (and not the copy in scripts/)
+sys.path.insert(0, SRC_DIR)
+
+
+def _timeit(func, repeat=3):
+    """Return the best wall time (in seconds) of `repeat` calls to func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_checkpoint_df():
+    """Load article_transcripts_checkpoint.csv as the flattened paragraph table."""
+    from data_processing import load_transcripts
+
+    return load_transcripts(CHECKPOINT_CSV)
+
+
+def bench_import_time(args):
+    """
+    Time `import data_processing` in a fresh interpreter.
+
+    Dependencies (pandas, unidecode) are imported first, so the reported
+    number is the cost of the module itself. It should not include loading
+    the sentiment model, which only happens on the first sentiment call.
+    That the import stays off the network is checked in tests/test_import.py.
+    """
+    code = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {SRC_DIR!r})\n"
+        "import pandas, unidecode\n"
+        "start = time.perf_counter()\n"
+        "import data_processing\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(f'{elapsed:.4f}', data_processing.analyzer_status()[0], "
+        "'torch' in sys.modules)\n"
+    )
+    timings = []
+    for _ in range(args.repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(out[0]))
+        status, torch_loaded = out[1], out[2]
+
+    print(f"import data_processing: best {min(timings) * 1000:.1f} ms "
+          f"over {args.repeat} runs")
+    print(f"analyzer status after import: {status}, torch imported: {torch_loaded}")
+
+
+def bench_clean_text(args):
+    """Compare row-wise clean_text with the batch clean_text_series."""
+    from data_processing import clean_text, clean_text_series
+
+    df = load_checkpoint_df()
+    texts = df["text"]
+    print(f"{len(texts):,} paragraphs, {texts.str.len().sum() / 1e6:.1f}M characters")
+
+    for remove_stopwords in (True, False):
+        expected = texts.apply(clean_text, remove_stopwords=remove_stopwords)
+        got = clean_text_series(texts, remove_stopwords=remove_stopwords)
+        assert expected.equals(got), "clean_text_series output differs from clean_text"
+
+    t_apply = _timeit(lambda: texts.apply(clean_text), args.repeat)
+    t_series = _timeit(lambda: clean_text_series(texts), args.repeat)
+    print(f"series.apply(clean_text): {t_apply:.3f} s")
+    print(f"clean_text_series:        {t_series:.3f} s  ({t_apply / t_series:.1f}x faster)")
+
+
+def _run_chart_aggregations(df):
+    """The aggregations behind the charts in static-viz/static_final.ipynb."""
+    import data_processing as dp
+
+    weekdays = df[df["date"].dt.dayofweek < 5]
+    dp.get_daily_lengths_by_actor(df)
+    dp.get_turn_taking_tables(weekdays)
+    dp.get_top_speakers(df)
+    dp.get_top_speakers_by_words(df)
+    dp.get_avg_length_by_weekday(df)
+    dp.count_state_mentions_by_group(df)
+
+
+def bench_aggregations(args):
+    """Wall time and peak memory of the chart aggregations, raw vs enriched input."""
+    from data_processing import enrich
+
+    df = load_checkpoint_df()
+
+    def run_raw():
+        _run_chart_aggregations(df)
+
+    def run_enriched():
+        _run_chart_aggregations(enrich(df))
+
+    for name, func in [("raw frame", run_raw), ("enrich() once", run_enriched)]:
+        elapsed = _timeit(func, args.repeat)
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name:15s} {elapsed:.3f} s, peak {peak / 1e6:.1f} MB")
+
+
+def _synthetic_topics(clean_texts, n_topics, n_keywords=45, seed=0):
+    """Build n_topics topics of corpus words and two-word phrases."""
+    rng = random.Random(seed)
+    tokens = " ".join(clean_texts[:2000]).split()
+    vocab = sorted(set(tokens))
+    topics = {}
+    for t in range(n_topics):
+        words = []
+        for _ in range(n_keywords):
+            if rng.random() < 0.2:
+                i = rng.randrange(len(tokens) - 1)
+                words.append(f"{tokens[i]} {tokens[i + 1]}")
+            else:
+                words.append(rng.choice(vocab))
+        topics[f"topic_{t}"] = words
+    return topics
+
+
+def bench_topics(args):
+    """Per-keyword str.count vs the compiled topic matcher, 8 vs 80 topics."""
+    import numpy as np
+    from data_processing import clean_text_series, compile_topics, count_topic_matrix
+
+    df = load_checkpoint_df()
+    clean = clean_text_series(df["text"]).tolist()
+
+    def count_naive(topics):
+        return np.array([[sum(t.count(w) for w in words) for words in topics.values()]
+                         for t in clean])
+
+    for n_topics in (8, 80):
+        topics = _synthetic_topics(clean, n_topics)
+        matcher = compile_topics(topics)
+        assert (count_naive(topics) == count_topic_matrix(clean, matcher)).all()
+
+        t_naive = _timeit(lambda: count_naive(topics), args.repeat)
+        t_matcher = _timeit(lambda: count_topic_matrix(clean, compile_topics(topics)), args.repeat)
+        print(f"{n_topics:3d} topics: str.count {t_naive:.3f} s, "
+              f"compiled matcher {t_matcher:.3f} s")
+
+
+def _peak_memory(func):
+    """Return func's result and the peak memory (in bytes) it allocated."""
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def bench_loader(args):
+    """json.load + flatten_data vs the streaming load_transcripts, and chunked aggregation."""
+    import pandas as pd
+    from data_processing import flatten_data, iter_articles, load_transcripts, update_aggregate_store
+
+    # Same layout as data/processed/article_transcripts.json
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "article_transcripts.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(list(iter_articles(CHECKPOINT_CSV)), f, ensure_ascii=False, indent=2)
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB of JSON")
+
+        def json_load():
+            with open(path, encoding="utf-8") as f:
+                return flatten_data(json.load(f))
+
+        def streamed():
+            return load_transcripts(path)
+
+        def chunked():
+            return sum(len(batch) for batch in load_transcripts(path, chunksize=args.chunksize))
+
+        expected = json_load()
+        assert expected.equals(streamed()), "load_transcripts differs from flatten_data"
+        batches = list(load_transcripts(path, chunksize=args.chunksize))
+        assert expected.equals(pd.concat(batches, ignore_index=True))
+
+        for name, func in [("json.load + flatten_data", json_load),
+                           ("load_transcripts", streamed),
+                           (f"chunksize={args.chunksize}", chunked)]:
+            elapsed = _timeit(func, args.repeat)
+            _, peak = _peak_memory(func)
+            print(f"{name:25s} {elapsed:.3f} s, peak {peak / 1e6:.1f} MB")
+
+        # Aggregate store from the whole table vs one batch at a time
+        def aggregate(chunksize):
+            store_path = os.path.join(tmp, f"aggregates_{chunksize}.sqlite")
+            if os.path.exists(store_path):
+                os.remove(store_path)
+            return update_aggregate_store(load_transcripts(path, chunksize=chunksize),
+                                          store_path, STORE_TOPICS)
+
+        print("aggregate store (lengths, turns, topics):")
+        results = {}
+        for name, chunksize in [("whole table", None), (f"chunksize={args.chunksize}", args.chunksize)]:
+            elapsed = _timeit(lambda: aggregate(chunksize), args.repeat)
+            results[name], peak = _peak_memory(lambda: aggregate(chunksize))
+            print(f"  {name:23s} {elapsed:.3f} s, peak {peak / 1e6:.1f} MB")
+        whole, chunked_partials = results.values()
+        assert whole.equals(chunked_partials), "chunked aggregation differs from the whole table"
+
+
+def bench_cache(args):
+    """Cold start (parse + enrich) vs reading the Parquet transcript cache."""
+    from data_processing import enrich, load_transcript_table, load_transcripts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "article_transcripts.parquet")
+
+        def parse_everything():
+            return enrich(load_transcripts(CHECKPOINT_CSV))
+
+        def cached():
+            return load_transcript_table(CHECKPOINT_CSV, cache_path)
+
+        def cached_filtered():
+            return load_transcript_table(CHECKPOINT_CSV, cache_path, columns=["date", "n_words"],
+                                         speaker_groups=["Journalist"])
+
+        expected = parse_everything()
+        assert expected.equals(cached()), "cached table differs from enrich(load_transcripts())"
+
+        for name, func in [("parse + enrich", parse_everything),
+                           ("parquet cache", cached),
+                           ("cache, 2 cols, 1 group", cached_filtered)]:
+            elapsed = _timeit(func, args.repeat)
+            _, peak = _peak_memory(func)
+            print(f"{name:23s} {elapsed:.3f} s, peak {peak / 1e6:.1f} MB")
+
+
+def bench_turns(args):
+    """Paragraphs vs conversation turns: how many rows, and what counting turns costs."""
+    import data_processing as dp
+
+    df = dp.enrich(load_checkpoint_df())
+    turns = dp.collapse_turns(df)
+    print(f"{len(df):,} paragraphs -> {len(turns):,} turns "
+          f"({len(df) / len(turns):.1f} paragraphs per turn)")
+
+    paragraph_counts = dp.get_turn_taking_stats(df)
+    turn_counts = dp.get_turn_taking_stats(df, turns=True)
+    print(f"mean turns per conference: {paragraph_counts['total_turns'].mean():.0f} "
+          f"counting paragraphs, {turn_counts['total_turns'].mean():.0f} counting turns")
+    assert dp.get_turn_taking_stats(turns).equals(turn_counts)
+
+    for name, kwargs in [("paragraphs", {}), ("turns=True", {"turns": True})]:
+        elapsed = _timeit(lambda: dp.get_turn_taking_tables(df, **kwargs), args.repeat)
+        print(f"turn taking, {name:10s} {elapsed * 1000:.1f} ms")
+
+
+# Topics of the aggregate store benchmarks
+STORE_TOPICS = {"security": ["seguridad", "violencia", "homicidios"],
+                "health": ["salud", "hospital", "medicamentos"],
+                "education": ["educacion", "escuela", "Secretaría de Educación"]}
+
+
+def _store_aggregations(df, topics):
+    """The length, turn-taking and weekly topic tables the aggregate store serves."""
+    import data_processing as dp
+
+    return [
+        dp.get_conference_lengths(df),
+        dp.get_daily_lengths_by_actor(df),
+        dp.get_avg_length_by_weekday(df),
+        *dp.get_turn_taking_tables(df),
+        dp.get_topics_by_week(df, topics),
+        dp.get_topics_by_week_by_group(df, topics),
+    ]
+
+
+def bench_aggregates(args):
+    """Full recomputation vs the incremental aggregate store, after one new conference."""
+    import data_processing as dp
+
+    df = dp.enrich(load_checkpoint_df())
+    topics = STORE_TOPICS
+    # The newest conference plays the one that just arrived
+    history = df[df["url"] != df["url"].iloc[0]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "aggregates.sqlite")
+
+        def append_one():
+            if os.path.exists(store_path):
+                os.remove(store_path)
+            dp.update_aggregate_store(history, store_path, topics)
+            start = time.perf_counter()
+            partials = dp.update_aggregate_store(df, store_path, topics)
+            return partials, time.perf_counter() - start
+
+        partials, _ = append_one()
+        for expected, derived in zip(_store_aggregations(df, topics),
+                                     _store_aggregations(partials, topics)):
+            assert expected.equals(derived), "store results differ from the paragraph table"
+
+        t_full = _timeit(lambda: _store_aggregations(df, topics), args.repeat)
+        t_append = min(append_one()[1] for _ in range(args.repeat))
+        t_load = _timeit(lambda: dp.load_aggregate_partials(store_path), args.repeat)
+        t_derive = _timeit(lambda: _store_aggregations(partials, topics), args.repeat)
+        print(f"{df['url'].nunique()} conferences -> {len(partials)} partial rows")
+        print(f"full recomputation      {t_full * 1000:8.1f} ms")
+        print(f"append one conference   {t_append * 1000:8.1f} ms")
+        print(f"load partials           {t_load * 1000:8.1f} ms")
+        print(f"tables from partials    {t_derive * 1000:8.1f} ms")
+
+
+def bench_term_index(args):
+    """Weekly topic shares by rescanning the paragraphs vs from the term index."""
+    import data_processing as dp
+
+    df = dp.enrich(load_checkpoint_df())
+    clean = dp.clean_text_series(df["text"]).tolist()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "term_index.npz")
+        t_build = _timeit(lambda: dp.build_term_index(df, index_path), args.repeat)
+        t_load = _timeit(lambda: dp.load_term_index(index_path), args.repeat)
+        index = dp.load_term_index(index_path)
+        print(f"{index['matrix'].shape[0]:,} paragraphs x {index['matrix'].shape[1]:,} terms, "
+              f"{os.path.getsize(index_path) / 1e6:.1f} MB; "
+              f"build {t_build:.3f} s, load {t_load * 1000:.1f} ms")
+
+    for n_topics in (8, 80):
+        # Corpus words and phrases, matched as whole words by both paths
+        topics = _synthetic_topics(clean, n_topics)
+        expected = dp.get_topics_by_week_by_group(df, topics, whole_words=True)
+        assert expected.equals(dp.get_topics_by_week_by_group_from_index(index, topics))
+
+        t_scan = _timeit(lambda: dp.get_topics_by_week_by_group(df, topics, whole_words=True),
+                         args.repeat)
+        t_index = _timeit(lambda: dp.get_topics_by_week_by_group_from_index(index, topics),
+                          args.repeat)
+        print(f"{n_topics:3d} topics: rescan {t_scan:.3f} s, term index {t_index:.3f} s")
+
+
+def bench_scraper(args):
+    """Sequential get_transcript_structured vs fetch_transcripts, against the stub server."""
+    from data_processing import iter_articles
+    import scraper
+    from stub_server import start_stub_server, write_fixture_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        articles = write_fixture_pages(iter_articles(CHECKPOINT_CSV), tmp, n_pages=args.pages)
+        server, base_url = start_stub_server(tmp, latency=args.latency, drop_every=args.drop_every)
+        urls = [base_url + article["url"] for article in articles]
+        try:
+            start = time.perf_counter()
+            expected = [scraper.get_transcript_structured(url, backoff_factor=args.backoff)
+                        for url in urls]
+            t_sequential = time.perf_counter() - start
+            requests_sequential = server.requests
+
+            results, stats = scraper.fetch_transcripts(
+                urls, rate=args.rate, burst=args.burst, concurrency=args.concurrency,
+                backoff_factor=args.backoff
+            )
+        finally:
+            server.shutdown()
+
+    assert results == expected, "fetch_transcripts differs from get_transcript_structured"
+    print(f"{len(urls)} pages, {args.latency * 1000:.0f} ms latency, "
+          f"every {args.drop_every}th request dropped")
+    print(f"sequential        {len(urls) / t_sequential:6.1f} pages/s "
+          f"({requests_sequential} requests)")
+    print(f"fetch_transcripts {stats['pages_per_sec']:6.1f} pages/s "
+          f"({server.requests - requests_sequential} requests, {stats['retries']} retries, "
+          f"{stats['failed']} failed)")
+
+
+def bench_refresh(args):
+    """Full re-scrape vs incremental refresh after a few new articles, against the stub server."""
+    from data_processing import iter_articles
+    import scraper
+    from stub_server import ARCHIVE_PAGE_SIZE, start_stub_server, write_fixture_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pages = os.path.join(tmp, "pages")
+        articles = write_fixture_pages(iter_articles(CHECKPOINT_CSV), os.path.join(tmp, "all"),
+                                       n_pages=args.pages + args.new)
+        write_fixture_pages(articles[args.new:], pages)
+        server, base_url = start_stub_server(pages, latency=args.latency)
+        # Archive pages of the grown site, plus the empty one after them
+        max_pages = -(-len(articles) // ARCHIVE_PAGE_SIZE) + 1
+        fetch = dict(rate=args.rate, burst=args.burst, concurrency=args.concurrency)
+
+        def scrape(name, incremental):
+            out = os.path.join(tmp, name)
+            server.requests = 0
+            start = time.perf_counter()
+            df = scraper.scrape_all_articles(max_pages, output_path=f"{out}.csv", base_url=base_url,
+                                             incremental=incremental, delay=(0, 0))
+            data = scraper.scrape_transcripts(df, output_path=f"{out}.json",
+                                              checkpoint_path=f"{out}_checkpoint.jsonl",
+                                              cache_path=f"{out}_responses",
+                                              incremental=incremental, **fetch)
+            return data, time.perf_counter() - start, server.requests
+
+        try:
+            scrape("refresh", incremental=False)
+            # The site gains args.new articles on top of the archive
+            write_fixture_pages(articles, pages)
+            full, t_full, requests_full = scrape("full", incremental=False)
+            refreshed, t_refresh, requests_refresh = scrape("refresh", incremental=True)
+        finally:
+            server.shutdown()
+
+    assert refreshed == full, "incremental refresh differs from a full scrape"
+    print(f"{args.pages} known + {args.new} new articles, {args.latency * 1000:.0f} ms latency")
+    print(f"full scrape  {t_full:6.2f} s ({requests_full} requests)")
+    print(f"incremental  {t_refresh:6.2f} s ({requests_refresh} requests)")
+
+
+def bench_checkpoint(args):
+    """Rewriting the whole JSON every 10 articles vs the JSON Lines checkpoint."""
+    from data_processing import iter_articles
+    import scraper
+
+    source = list(iter_articles(CHECKPOINT_CSV))
+    articles = [dict(source[i % len(source)], url=f"{source[i % len(source)]['url']}-{i}")
+                for i in range(args.articles)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "checkpoint.json")
+        jsonl_path = os.path.join(tmp, "checkpoint.jsonl")
+
+        start = time.perf_counter()
+        data = []
+        for article in articles:
+            data.append(article)
+            if len(data) % 10 == 0:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        t_rewrite = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with scraper.CheckpointWriter(jsonl_path) as checkpoint:
+            for article in articles:
+                checkpoint.write(article)
+        t_append = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resumed = scraper.read_checkpoint(jsonl_path)
+        t_read = time.perf_counter() - start
+        start = time.perf_counter()
+        compacted = scraper.compact_checkpoint(jsonl_path, os.path.join(tmp, "transcripts.json"))
+        t_compact = time.perf_counter() - start
+
+    assert resumed == articles and compacted == articles
+    print(f"{len(articles)} articles")
+    print(f"json.dump every 10 articles      {t_rewrite:7.2f} s")
+    print(f"JSONL append + fsync per article {t_append:7.2f} s")
+    print(f"read back {t_read:.2f} s, compact {t_compact:.2f} s")
+
+
+def bench_parse(args):
+    """parse_transcript / parse_articles_page per HTML parser, on fixture pages."""
+    from data_processing import iter_articles
+    import scraper
+    from stub_server import ARCHIVE_PAGE_SIZE, page_filename, write_fixture_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        articles = write_fixture_pages(iter_articles(CHECKPOINT_CSV), tmp, n_pages=args.pages)
+
+        def read(url):
+            with open(os.path.join(tmp, page_filename(url)), encoding="utf-8") as f:
+                return f.read()
+
+        transcripts = [read(article["url"]) for article in articles]
+        n_archive = -(-len(articles) // ARCHIVE_PAGE_SIZE)
+        archives = [read(f"{scraper.ARCHIVE_PATH}{page}") for page in range(1, n_archive + 1)]
+    size = sum(len(t) for t in transcripts) / 1e6
+    print(f"{len(transcripts)} transcript pages ({size:.1f} MB), {len(archives)} archive pages")
+
+    previous = scraper.get_html_parser()
+    outputs = {}
+    try:
+        for parser in scraper.HTML_PARSERS:
+            scraper.set_html_parser(parser)
+            parse_transcripts = lambda: [scraper.parse_transcript(t) for t in transcripts]
+            parse_archives = lambda: [scraper.parse_articles_page(t) for t in archives]
+            t_transcripts = _timeit(parse_transcripts, args.repeat)
+            t_archives = _timeit(parse_archives, args.repeat)
+            outputs[parser] = (parse_transcripts(), parse_archives())
+            print(f"{parser:<12s} transcripts {len(transcripts) / t_transcripts:7.1f} pages/s "
+                  f"({size / t_transcripts:5.1f} MB/s), archive {len(archives) / t_archives:7.1f} pages/s")
+    finally:
+        scraper.set_html_parser(previous)
+
+    reference = outputs["html.parser"]
+    for parser, output in outputs.items():
+        assert output == reference, f"{parser} output differs from html.parser"
+    print("speaker/text entries and archive cards identical across parsers")
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+def bench_response_cache(args):
+    """Download, revalidate (conditional GETs) and re-parse offline with the response cache."""
+    from data_processing import iter_articles
+    import scraper
+    from stub_server import start_stub_server, write_fixture_pages
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pages = os.path.join(tmp, "pages")
+        cache_path = os.path.join(tmp, "responses")
+        articles = write_fixture_pages(iter_articles(CHECKPOINT_CSV), pages, n_pages=args.pages)
+        server, base_url = start_stub_server(pages, latency=args.latency)
+        urls = [base_url + article["url"] for article in articles]
+        fetch = dict(rate=args.rate, burst=args.burst, concurrency=args.concurrency,
+                     cache_path=cache_path)
+        try:
+            downloaded, cold = scraper.fetch_transcripts(urls, **fetch)
+            requests_cold = server.requests
+            revalidated, warm = scraper.fetch_transcripts(urls, **fetch)
+            requests_warm = server.requests - requests_cold
+            not_modified = server.not_modified
+        finally:
+            server.shutdown()
+
+        # The server is down: everything below comes from the cache
+        start = time.perf_counter()
+        with scraper.ResponseCache(cache_path) as cache:
+            reparsed = [scraper.parse_transcript(cache.get(url), url) for url in urls]
+        t_reparse = time.perf_counter() - start
+        raw_size, cache_size = _dir_size(pages), _dir_size(cache_path)
+        n_bodies = sum(len(names) for _, _, names in os.walk(os.path.join(cache_path, "objects")))
+
+    assert revalidated == downloaded and reparsed == downloaded, "cached pages parse differently"
+    print(f"{len(urls)} pages, {args.latency * 1000:.0f} ms latency, "
+          f"{raw_size / 1e6:.1f} MB of HTML -> {cache_size / 1e6:.1f} MB cached "
+          f"({n_bodies} distinct bodies)")
+    print(f"download      {cold['seconds']:6.2f} s ({requests_cold} requests)")
+    print(f"revalidate    {warm['seconds']:6.2f} s ({requests_warm} requests, "
+          f"{not_modified} answered 304)")
+    print(f"re-parse      {t_reparse:6.2f} s (no requests, {scraper.get_html_parser()})")
+
+
+def bench_sentiment(args):
+    """One-by-one _predict_sentiment loop vs batched inference on one conference."""
+    import numpy as np
+    import data_processing as dp
+
+    df = dp.enrich(load_checkpoint_df())
+    texts = df.loc[df["date"] == args.date, "text"].fillna("").astype(str).tolist()
+    if not texts:
+        sys.exit(f"No interventions on {args.date} in {CHECKPOINT_CSV}")
+    if not dp.warmup():
+        sys.exit("pysentimiento is needed for this benchmark.")
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+    print(f"{args.date}: {len(texts)} interventions")
+
+    def loop():
+        results = [dp._predict_sentiment(t) for t in texts]
+        labels = [lab for lab, _, _ in results]
+        probs = np.array([[prob.get(c, 0.0) for c in dp._SENTIMENT_CLASSES]
+                          for _, _, prob in results])
+        return labels, probs
+
+    start = time.perf_counter()
+    ref_labels, ref_probs = loop()
+    t_loop = time.perf_counter() - start
+    print(f"loop:          {t_loop:7.2f} s")
+
+    # Truncate like the loop does, so outputs are comparable
+    for batch_size in (8, 32, 64):
+        start = time.perf_counter()
+        labels, probs = dp._predict_sentiment_batch(texts, batch_size=batch_size, split_long=False)
+        elapsed = time.perf_counter() - start
+        same = sum(a == b for a, b in zip(labels, ref_labels))
+        print(f"batch_size={batch_size:<3d} {elapsed:7.2f} s ({t_loop / elapsed:.1f}x), "
+              f"labels {same}/{len(texts)} identical, "
+              f"max |dp| {np.abs(probs - ref_probs).max():.1e}")
+
+    # Long interventions split into windows instead of truncated
+    stats = dp.sentiment_token_stats(texts)
+    print(f"{stats['long_texts']}/{stats['texts']} interventions over the token limit; "
+          f"tokens dropped: {stats['dropped_truncation']:,} of {stats['tokens']:,} truncating, "
+          f"{stats['dropped_windows']:,} with {stats['windows']:,} windows")
+    start = time.perf_counter()
+    labels, _ = dp._predict_sentiment_batch(texts)
+    elapsed = time.perf_counter() - start
+    same = sum(a == b for a, b in zip(labels, ref_labels))
+    print(f"windows:       {elapsed:7.2f} s, labels {same}/{len(texts)} same as truncating")
+
+    if args.workers > 1:
+        start = time.perf_counter()
+        labels, _ = dp._score_sentiment(texts, workers=args.workers)
+        elapsed = time.perf_counter() - start
+        print(f"workers={args.workers:<5d} {elapsed:7.2f} s ({t_loop / elapsed:.1f}x, "
+              f"windows, includes worker start-up)")
+
+
+def bench_backends(args):
+    """Label agreement and throughput of each sentiment backend vs the torch model."""
+    import numpy as np
+    import data_processing as dp
+
+    df = load_checkpoint_df()
+    texts = df["text"].dropna().astype(str)
+    texts = texts[texts.str.strip() != ""]
+    texts = texts.sample(min(args.sample, len(texts)), random_state=0).tolist()
+    print(f"{len(texts)} paragraphs sampled from {CHECKPOINT_CSV}")
+
+    backends = [("torch", None), ("torch-int8", None)]
+    if args.onnx:
+        if not os.path.exists(args.onnx):
+            print(f"Exporting the model to {args.onnx}")
+            dp.export_sentiment_onnx(args.onnx)
+        backends.append(("onnx", args.onnx))
+
+    reference = None
+    for backend, onnx_path in backends:
+        dp.set_sentiment_backend(backend, onnx_path)
+        if not dp.warmup():
+            print(f"{backend:11s} not available")
+            continue
+        start = time.perf_counter()
+        labels, probs = dp._predict_sentiment_batch(texts, num_threads=args.threads)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = labels, probs
+        ref_labels, ref_probs = reference
+        agreement = np.mean([a == b for a, b in zip(labels, ref_labels)])
+        print(f"{backend:11s} {len(texts) / elapsed:7.1f} paragraphs/s, "
+              f"label agreement {agreement:.2%}, "
+              f"mean |dp| {np.abs(probs - ref_probs).mean():.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("import_time", help="Cost of importing data_processing")
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_import_time)
+
+    p = sub.add_parser("clean_text", help="clean_text vs clean_text_series")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_clean_text)
+
+    p = sub.add_parser("aggregations", help="Chart aggregations, raw vs enriched frame")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_aggregations)
+
+    p = sub.add_parser("topics", help="Topic keyword counting, 8 vs 80 topics")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_topics)
+
+    p = sub.add_parser("loader", help="json.load + flatten_data vs load_transcripts")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--chunksize", type=int, default=2000)
+    p.set_defaults(func=bench_loader)
+
+    p = sub.add_parser("cache", help="Parse + enrich vs the Parquet transcript cache")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_cache)
+
+    p = sub.add_parser("turns", help="Paragraph vs conversation-turn counts")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_turns)
+
+    p = sub.add_parser("aggregates", help="Full recomputation vs the incremental aggregate store")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_aggregates)
+
+    p = sub.add_parser("term_index", help="Weekly topic shares: rescan vs term index")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_term_index)
+
+    p = sub.add_parser("scraper", help="Sequential vs concurrent transcript fetching (offline)")
+    p.add_argument("--pages", type=int, default=100, help="Transcript pages to serve")
+    p.add_argument("--latency", type=float, default=0.2, help="Stub server seconds per response")
+    p.add_argument("--drop-every", type=int, default=20, help="Stub drops every n-th request")
+    p.add_argument("--rate", type=float, default=50.0, help="Requests per second")
+    p.add_argument("--burst", type=int, default=8)
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--backoff", type=float, default=0.05, help="Backoff factor for retries")
+    p.set_defaults(func=bench_scraper)
+
+    p = sub.add_parser("refresh", help="Full re-scrape vs incremental refresh (offline)")
+    p.add_argument("--pages", type=int, default=200, help="Articles already scraped")
+    p.add_argument("--new", type=int, default=5, help="Articles published since")
+    p.add_argument("--latency", type=float, default=0.05, help="Stub server seconds per response")
+    p.add_argument("--rate", type=float, default=50.0, help="Requests per second")
+    p.add_argument("--burst", type=int, default=8)
+    p.add_argument("--concurrency", type=int, default=8)
+    p.set_defaults(func=bench_refresh)
+
+    p = sub.add_parser("checkpoint", help="Whole-file JSON checkpoints vs JSON Lines appends")
+    p.add_argument("--articles", type=int, default=500)
+    p.set_defaults(func=bench_checkpoint)
+
+    p = sub.add_parser("parse", help="HTML parsing throughput per parser, on fixture pages")
+    p.add_argument("--pages", type=int, default=200, help="Transcript pages to parse")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=bench_parse)
+
+    p = sub.add_parser("response_cache", help="Raw response cache: download, 304s, offline re-parse")
+    p.add_argument("--pages", type=int, default=200, help="Transcript pages to serve")
+    p.add_argument("--latency", type=float, default=0.2, help="Stub server seconds per response")
+    p.add_argument("--rate", type=float, default=50.0, help="Requests per second")
+    p.add_argument("--burst", type=int, default=8)
+    p.add_argument("--concurrency", type=int, default=8)
+    p.set_defaults(func=bench_response_cache)
+
+    p = sub.add_parser("sentiment", help="Per-intervention loop vs batched sentiment")
+    p.add_argument("--date", default="2025-10-08", help="Conference date (YYYY-MM-DD)")
+    p.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    p.add_argument("--workers", type=int, default=1, help="Also time N worker processes")
+    p.set_defaults(func=bench_sentiment)
+
+    p = sub.add_parser("backends", help="Agreement and throughput of sentiment backends")
+    p.add_argument("--onnx", default=None, help="ONNX model file (exported if missing)")
+    p.add_argument("--sample", type=int, default=500, help="Paragraphs to score")
+    p.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    p.set_defaults(func=bench_backends)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
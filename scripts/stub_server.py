@@ -0,0 +1,239 @@
+"""
+Local stand-in for gob.mx, to run the scraper offline.
+
+Serves saved pages from a directory. Each page is stored under a file name
+made from the path and query of its URL (see page_filename), so both
+transcript pages (/presidencia/es/articulos/...?idiom=es) and archive pages
+(...articulos?...&page=N) can be saved as they are.
+
+write_fixture_pages renders gob.mx-like pages from the articles of a
+transcript file, for when no saved pages are at hand.
+
+Pages are served with ETag and Last-Modified headers, and conditional
+requests for an unchanged page get a 304.
+
+Usage (from the repository root):
+    python scripts/stub_server.py PAGES_DIR [--port 8000] [--latency 0.2] [--drop-every 20]
+    python scripts/stub_server.py PAGES_DIR --fixtures data/raw/article_transcripts_checkpoint.csv
+"""
+import argparse
+import hashlib
+import html
+import itertools
+import os
+import sys
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, urlsplit
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+sys.path.insert(0, SRC_DIR)
+
+ARCHIVE_PAGE_SIZE = 10
+
+
+def page_filename(url):
+    """File name of a saved page: its URL path and query, percent-encoded."""
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    return quote(target, safe="")
+
+
+def _transcript_page(article):
+    """HTML of an article page with one <p> per transcript entry."""
+    paragraphs = []
+    for entry in article["transcript"]:
+        speaker, text = entry.get("speaker"), entry.get("text") or ""
+        if speaker:
+            rest = text[len(speaker):] if text.startswith(speaker) else text
+            paragraphs.append(f"<p><strong>{html.escape(speaker)}</strong> {html.escape(rest)}</p>")
+        else:
+            paragraphs.append(f"<p>{html.escape(text)}</p>")
+    return (
+        "<!DOCTYPE html>\n<html lang=\"es\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(article['title'] or '')}</title></head><body>\n"
+        "<nav><ul><li><a href=\"/presidencia\">Presidencia</a></li></ul></nav>\n"
+        "<main><div class=\"article-header\"><h1>"
+        f"{html.escape(article['title'] or '')}</h1></div>\n"
+        "<div class=\"article-body\">\n" + "\n".join(paragraphs) + "\n</div></main>\n"
+        "<footer><p>Gobierno de México</p></footer></body></html>\n"
+    )
+
+
+def _archive_page(articles):
+    """HTML of an archive page: article cards appended by inline JavaScript."""
+    appends = []
+    for article in articles:
+        card = (
+            "<article><h2>" + html.escape(article["title"] or "") + "</h2>"
+            "<time>" + html.escape(article["date"] or "") + "</time>"
+            "<a class=\"small-link\" href=\"" + urlsplit(article["url"]).path
+            + "?idiom=es\">Leer más</a></article>"
+        )
+        card = card.replace("\\", "\\\\").replace('"', '\\"').replace("'", "\\'")
+        appends.append(f"$('#prensa').append('{card}');")
+    return (
+        "<!DOCTYPE html>\n<html lang=\"es\"><head><meta charset=\"utf-8\"></head><body>\n"
+        "<div id=\"prensa\"></div>\n<script>\n" + "\n".join(appends) + "\n</script>\n</body></html>\n"
+    )
+
+
+def write_fixture_pages(articles, root, n_pages=None):
+    """
+    Write gob.mx-like transcript and archive pages for articles to root.
+
+    Args:
+        articles (iterable of dict): Articles with date, title, url and
+            transcript (see data_processing.iter_articles).
+        root (str): Directory to write the pages to.
+        n_pages (int, optional): Number of transcript pages; articles are
+            repeated (with numbered URLs) to reach it.
+    Returns:
+        list[dict]: The articles written, with the URLs they are served at
+        (paths relative to the server), newest first like the archive.
+    """
+    articles = list(articles)
+    if n_pages is not None:
+        articles = [
+            dict(article, url=f"{urlsplit(article['url']).path}-{i}?idiom=es") if i >= len(articles) else article
+            for i, article in zip(range(n_pages), itertools.cycle(articles))
+        ]
+    os.makedirs(root, exist_ok=True)
+
+    written = []
+    for article in articles:
+        parts = urlsplit(article["url"])
+        url = parts.path + (f"?{parts.query}" if parts.query else "")
+        with open(os.path.join(root, page_filename(url)), "w", encoding="utf-8") as f:
+            f.write(_transcript_page(article))
+        written.append(dict(article, url=url))
+
+    # Archive pages 1..N, plus an empty page after the last one
+    archive = "/presidencia/es/archivo/articulos?filter_origin=archive&idiom=es&order=DESC&page="
+    n_archive = -(-len(written) // ARCHIVE_PAGE_SIZE)
+    for page in range(1, n_archive + 2):
+        cards = written[(page - 1) * ARCHIVE_PAGE_SIZE:page * ARCHIVE_PAGE_SIZE]
+        with open(os.path.join(root, page_filename(f"{archive}{page}")), "w", encoding="utf-8") as f:
+            f.write(_archive_page(cards))
+    return written
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serve files from server.root; see start_stub_server for the options."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            count = server.requests
+        if server.latency:
+            time.sleep(server.latency)
+        if server.drop_every and count % server.drop_every == 0:
+            # Close without answering, like a dropped connection
+            self.close_connection = True
+            return
+
+        if self.path in server.statuses:
+            self.send_error(server.statuses[self.path])
+            return
+        path = os.path.join(server.root, page_filename(self.path))
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        mtime = int(os.path.getmtime(path))
+        if self._not_modified(etag, mtime):
+            with server.lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(mtime, usegmt=True))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self, etag, mtime):
+        """Whether the request's If-None-Match / If-Modified-Since still hold."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")]
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            try:
+                return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(root, port=0, latency=0.0, drop_every=0, statuses=None):
+    """
+    Serve the pages in root on localhost from a background thread.
+
+    Args:
+        root (str): Directory of saved pages (see page_filename).
+        port (int): Port to listen on (0 picks a free one).
+        latency (float): Seconds to wait before answering each request.
+        drop_every (int): Drop every n-th request without answering
+            (0 never), to exercise the scraper's retries.
+        statuses (dict, optional): path -> HTTP error status to answer
+            instead of the page (e.g. 503); server.statuses can be changed
+            while the server runs.
+    Returns:
+        tuple: (server, base_url); call server.shutdown() to stop it.
+        server.requests and server.not_modified count the requests and
+        the 304 responses. Pages missing from root are a 404.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+    server.daemon_threads = True
+    server.root = root
+    server.latency = latency
+    server.drop_every = drop_every
+    server.statuses = dict(statuses or {})
+    server.requests = 0
+    server.not_modified = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", help="Directory of saved pages")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--drop-every", type=int, default=0, help="Drop every n-th request")
+    parser.add_argument("--fixtures", default=None,
+                        help="Transcript file to render fixture pages from first")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        from data_processing import iter_articles
+        written = write_fixture_pages(iter_articles(args.fixtures), args.root)
+        print(f"Wrote {len(written)} transcript pages to {args.root}")
+
+    server, base_url = start_stub_server(args.root, args.port, args.latency, args.drop_every)
+    print(f"Serving {args.root} at {base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
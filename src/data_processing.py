@@ -1,34 +1,251 @@
 import pandas as pd
+import numpy as np
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import sqlite3
+import sys
+import threading
 
 import unidecode
 import unicodedata
-from collections import Counter
+from collections import Counter, deque
+from functools import lru_cache
 
 import string
-import nltk
-from nltk.corpus import stopwords
 
 from typing import Optional
 
-# Load analyzer once (Spanish sentiment)
-try:
+# Spanish sentiment analyzer, built lazily the first time it is needed.
+# Importing pysentimiento pulls in torch and the transformer weights, so we
+# only pay that cost in processes that actually compute sentiment.
+_ANALYZER_NOT_LOADED = "not_loaded"
+_ANALYZER_LOADED = "loaded"
+_ANALYZER_FAILED = "failed"
+
+_analyzer_es = None
+_analyzer_state = _ANALYZER_NOT_LOADED
+_analyzer_error = None
+_analyzer_lock = threading.Lock()
+
+# Inference backend for the sentiment model:
+#   - "torch": the pysentimiento model as published (reference)
+#   - "torch-int8": the same model with Linear layers dynamically quantized to int8
+#   - "onnx": an ONNX export of the model (see export_sentiment_onnx) run with
+#     ONNX Runtime, read from SENTIMENT_ONNX_PATH
+# Configured with the SENTIMENT_BACKEND / SENTIMENT_ONNX_PATH environment
+# variables or set_sentiment_backend().
+SENTIMENT_BACKENDS = ("torch", "torch-int8", "onnx")
+_sentiment_backend = os.environ.get("SENTIMENT_BACKEND", "torch")
+_sentiment_onnx_path = os.environ.get("SENTIMENT_ONNX_PATH")
+
+class _OnnxSequenceClassifier:
+    """
+    Stand-in for the torch model that runs an ONNX export with ONNX Runtime.
+
+    Called like the transformers model (input_ids, attention_mask) and
+    returns an object with .logits, so pysentimiento's predict() and
+    _predict_sentiment_batch work unchanged.
+    """
+
+    def __init__(self, path):
+        import onnxruntime
+        import torch
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = torch.get_num_threads()
+        self.session = onnxruntime.InferenceSession(
+            path, options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def __call__(self, input_ids, attention_mask=None, **kwargs):
+        import torch
+        from types import SimpleNamespace
+
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        feeds = {name: feeds[name].cpu().numpy() for name in self.input_names}
+        logits = self.session.run(None, feeds)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+def _check_sentiment_backend():
+    """Raise if the configured backend cannot be built (before loading anything)."""
+    if _sentiment_backend not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend {_sentiment_backend!r}, "
+                         f"expected one of {SENTIMENT_BACKENDS}")
+    if _sentiment_backend == "onnx" and (
+        not _sentiment_onnx_path or not os.path.exists(_sentiment_onnx_path)
+    ):
+        raise FileNotFoundError(f"ONNX sentiment model not found: {_sentiment_onnx_path!r} "
+                                "(set SENTIMENT_ONNX_PATH, see export_sentiment_onnx)")
+
+def _build_analyzer():
+    """Create the pysentimiento Spanish sentiment analyzer on the configured backend."""
+    _check_sentiment_backend()
     from pysentimiento import create_analyzer
-    _analyzer_es = create_analyzer(task="sentiment", lang="es")
-except Exception as e:
-    _analyzer_es = None
-    print("Could not load pysentimiento analyzer. "
-          "Install/verify `pysentimiento`, `transformers`, and `torch`.\n", e)
+    analyzer = create_analyzer(task="sentiment", lang="es")
+
+    if _sentiment_backend == "torch-int8":
+        import torch
+        analyzer.model = torch.quantization.quantize_dynamic(
+            analyzer.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    elif _sentiment_backend == "onnx":
+        analyzer.model = _OnnxSequenceClassifier(_sentiment_onnx_path)
+    return analyzer
+
+def set_sentiment_backend(backend, onnx_path=None):
+    """
+    Choose the sentiment inference backend (see SENTIMENT_BACKENDS).
+
+    The analyzer is rebuilt on its next use. Worker processes started by
+    compute_sentiment_corpus(..., workers=N) use the same backend.
+
+    Args:
+        backend (str): 'torch', 'torch-int8' or 'onnx'.
+        onnx_path (str, optional): ONNX model file, required for 'onnx'.
+    """
+    global _analyzer_es, _analyzer_state, _analyzer_error
+    global _sentiment_backend, _sentiment_onnx_path
+
+    if backend not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend {backend!r}, expected one of {SENTIMENT_BACKENDS}")
+    if backend == "onnx" and not onnx_path:
+        raise ValueError("The 'onnx' backend needs onnx_path")
+
+    with _analyzer_lock:
+        _sentiment_backend = backend
+        _sentiment_onnx_path = onnx_path
+        _analyzer_es = None
+        _analyzer_state = _ANALYZER_NOT_LOADED
+        _analyzer_error = None
+
+def get_sentiment_backend():
+    """Return the configured (backend, onnx_path)."""
+    return _sentiment_backend, _sentiment_onnx_path
+
+def export_sentiment_onnx(path, opset_version=17):
+    """
+    Export the pysentimiento Spanish sentiment model to ONNX, for the 'onnx' backend.
+
+    Args:
+        path (str): Output .onnx file.
+        opset_version (int): ONNX opset to export with.
+    """
+    import torch
+    from pysentimiento import create_analyzer
+
+    analyzer = create_analyzer(task="sentiment", lang="es")
+    model = analyzer.model.eval()
+    sample = analyzer.tokenizer(["Buenos días"], return_tensors="pt")
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=opset_version,
+        )
+
+def get_analyzer():
+    """
+    Return the process-wide Spanish sentiment analyzer, building it on first use.
+
+    The analyzer is built at most once per process. If building fails, the
+    error is remembered and re-raised on every later call instead of retrying.
+
+    Returns:
+        pysentimiento analyzer.
+    Raises:
+        RuntimeError: If pysentimiento (or transformers/torch) could not be loaded.
+    """
+    global _analyzer_es, _analyzer_state, _analyzer_error
+
+    if _analyzer_state == _ANALYZER_NOT_LOADED:
+        with _analyzer_lock:
+            # Another thread may have finished loading while we waited
+            if _analyzer_state == _ANALYZER_NOT_LOADED:
+                try:
+                    _analyzer_es = _build_analyzer()
+                    _analyzer_state = _ANALYZER_LOADED
+                except Exception as e:
+                    _analyzer_error = e
+                    _analyzer_state = _ANALYZER_FAILED
+
+    if _analyzer_state == _ANALYZER_FAILED:
+        raise RuntimeError("Spanish sentiment analyzer not available. "
+                           "Install/verify pysentimiento, transformers, and torch.") from _analyzer_error
+    return _analyzer_es
+
+def analyzer_status():
+    """
+    Report the state of the sentiment analyzer without triggering a load.
+
+    Returns:
+        tuple[str, Exception or None]: ('not_loaded' | 'loaded' | 'failed', error).
+    """
+    return _analyzer_state, _analyzer_error
 
-# Small helpers 
+def warmup():
+    """
+    Load the sentiment analyzer eagerly (e.g., at worker start-up).
+
+    Returns:
+        bool: True if the analyzer is ready, False if it failed to load.
+    """
+    try:
+        get_analyzer()
+    except RuntimeError as e:
+        print("Could not load pysentimiento analyzer. "
+              "Install/verify `pysentimiento`, `transformers`, and `torch`.\n", e.__cause__)
+        return False
+    return True
+
+# Small helpers
 _LABEL_TO_SCORE = {"POS": 1.0, "NEU": 0.0, "NEG": -1.0}
 _SPANISH_LABEL = {"POS": "Positive", "NEU": "Neutral", "NEG": "Negative"}
 
-# Download Spanish stopwords (only once)
-nltk.download('stopwords')
+# Spanish stopword list shipped with the code (same words as NLTK's 'spanish' corpus)
+_STOPWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spanish_stopwords.txt")
+
+def load_spanish_stopwords():
+    """
+    Load the Spanish stopword list without touching the network.
+
+    Looks first for the bundled `spanish_stopwords.txt`, then for an already
+    installed NLTK stopwords corpus. Nothing is ever downloaded.
 
-# Define global Spanish stopword list
-SPANISH_STOPWORDS = set(stopwords.words('spanish'))
+    Returns:
+        frozenset: Spanish stopwords (empty if no source is available).
+    """
+    # 1. Bundled word list
+    try:
+        with open(_STOPWORDS_FILE, encoding="utf-8") as f:
+            return frozenset(line.strip() for line in f if line.strip())
+    except OSError:
+        pass
+
+    # 2. Local NLTK corpus (e.g., installed with `python -m nltk.downloader stopwords`)
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words("spanish"))
+    except (ImportError, LookupError):
+        print("No Spanish stopword list found. Stopwords will not be removed.")
+        return frozenset()
+
+# Define global Spanish stopword list (built once, read-only)
+SPANISH_STOPWORDS = load_spanish_stopwords()
 
 MEXICO_STATES = [
     "Aguascalientes", "Baja California", "Baja California Sur", "Campeche", 
@@ -40,35 +257,27 @@ MEXICO_STATES = [
     "Veracruz", "Yucatan", "Zacatecas"
 ]
 
-def parse_spanish_date(raw_date):
-    """
-    Convert a messy Spanish date string (e.g., 
-    'jueves, 16 de octubre de 2025Fecha de publicación')
-    into a standard datetime.date object.
-    Parameters:
-        raw_date (str): Raw date string in Spanish.
-    Returns:
-        pd.Timestamp or pd.NaT: Parsed date or NaT if parsing fails.
-    """
-    if not isinstance(raw_date, str):
-        return pd.NaT
-
+# Spanish month names, and the patterns used to read dates like
+# 'jueves, 16 de octubre de 2025Fecha de publicación'
+_SPANISH_MONTHS = {
+    "enero": 1, "febrero": 2, "marzo": 3, "abril": 4,
+    "mayo": 5, "junio": 6, "julio": 7, "agosto": 8,
+    "septiembre": 9, "setiembre": 9, "octubre": 10,
+    "noviembre": 11, "diciembre": 12
+}
+_DATE_SUFFIX_RE = re.compile(r"fecha.*")
+_SPANISH_DATE_RE = re.compile(r"(\d{1,2})\s+de\s+([a-záéíóú]+)\s+de\s+(\d{4})")
+
+@lru_cache(maxsize=4096)
+def _parse_spanish_date_str(raw_date):
+    """parse_spanish_date for a string; cached since each date repeats across pages."""
     # 1. Clean unwanted text
     clean = raw_date.lower()
-    clean = re.sub(r"fecha.*", "", clean).strip()  # remove "Fecha de publicación" and after
-    clean = re.sub(r"[,]", "", clean)  # remove commas
-
-    # 2. Map month names in spanish to numbers
-    months = {
-        "enero": 1, "febrero": 2, "marzo": 3, "abril": 4,
-        "mayo": 5, "junio": 6, "julio": 7, "agosto": 8,
-        "septiembre": 9, "setiembre": 9, "octubre": 10,
-        "noviembre": 11, "diciembre": 12
-    }
+    clean = _DATE_SUFFIX_RE.sub("", clean).strip()  # remove "Fecha de publicación" and after
+    clean = clean.replace(",", "")  # remove commas
 
-    # 3. Extract day, month, year
-    pattern = r"(\d{1,2})\s+de\s+([a-záéíóú]+)\s+de\s+(\d{4})"
-    match = re.search(pattern, clean)
+    # 2. Extract day, month, year
+    match = _SPANISH_DATE_RE.search(clean)
     if not match:
         return pd.NaT
 
@@ -76,17 +285,80 @@ def parse_spanish_date(raw_date):
     month_str = match.group(2)
     year = int(match.group(3))
 
-    # 4. Normalize month
-    month = months.get(month_str, None)
+    # 3. Normalize month
+    month = _SPANISH_MONTHS.get(month_str, None)
     if not month:
         return pd.NaT
 
-    # 5. Return datetime
+    # 4. Return datetime
     try:
         return pd.Timestamp(year=year, month=month, day=day).date()
     except Exception:
         return pd.NaT
-    
+
+def parse_spanish_date(raw_date):
+    """
+    Convert a messy Spanish date string (e.g., 
+    'jueves, 16 de octubre de 2025Fecha de publicación')
+    into a standard datetime.date object.
+    Parameters:
+        raw_date (str): Raw date string in Spanish.
+    Returns:
+        datetime.date or pd.NaT: Parsed date or NaT if parsing fails.
+    """
+    if not isinstance(raw_date, str):
+        return pd.NaT
+    return _parse_spanish_date_str(raw_date)
+
+def parse_spanish_dates(raw_dates):
+    """
+    Parse a column of raw Spanish date strings into datetime64[ns].
+
+    Each distinct string is parsed once and the result is broadcast back,
+    so the output can be used with .dt and date comparisons directly.
+    Parameters:
+        raw_dates (pd.Series or list): Raw date strings in Spanish.
+    Returns:
+        pd.Series: datetime64[ns] dates (NaT where parsing fails), same index.
+    """
+    raw_dates = pd.Series(raw_dates, dtype=object)
+    codes, uniques = pd.factorize(raw_dates)
+    parsed = pd.to_datetime([parse_spanish_date(d) for d in uniques] + [pd.NaT]).to_numpy("datetime64[ns]")
+    return pd.Series(parsed[codes], index=raw_dates.index, name=raw_dates.name)
+
+def _flatten_columns(articles, last_speaker=None):
+    """
+    Flatten articles into columns, parsing each article's date once.
+
+    Missing speakers are forward-filled, starting from last_speaker so that
+    consecutive batches fill exactly like a single flatten_data call.
+
+    Returns:
+        tuple: (dict of columns, with datetime64 dates, last speaker seen)
+    """
+    cols = {"title": [], "url": [], "speaker": [], "text": []}
+    raw_dates, counts = [], []
+    for article in articles:
+        transcript = article["transcript"]
+        n = len(transcript)
+        if not n:
+            continue
+        raw_dates.append(article["date"])
+        counts.append(n)
+        cols["title"].extend([article["title"]] * n)
+        cols["url"].extend([article["url"]] * n)
+        for t in transcript:
+            speaker = t["speaker"]
+            if speaker is None or speaker != speaker:
+                speaker = last_speaker
+            else:
+                last_speaker = speaker
+            cols["speaker"].append(speaker)
+            cols["text"].append(t["text"])
+    # Dates are parsed once per article, then repeated for its paragraphs
+    dates = np.repeat(parse_spanish_dates(raw_dates).to_numpy(), counts)
+    return {"date": dates, **cols}, last_speaker
+
 def flatten_data(data):
     """
     Flatten nested JSON data into a pandas DataFrame.
@@ -94,48 +366,703 @@ def flatten_data(data):
     Parameters:
         data (list): List of articles with nested transcript data.
     Returns:
-        pd.DataFrame: Flattened DataFrame with columns for date, title, url, speaker, and text.
-    """
-    # Flatten transcript-level data
-    rows = []
-    for article in data:
-        for t in article["transcript"]:
-            rows.append({
-                "date": parse_spanish_date(article["date"]),
-                "title": article["title"],
-                "url": article["url"],
-                "speaker": t["speaker"],
-                "text": t["text"]
-            })
+        pd.DataFrame: Flattened DataFrame with columns for date (datetime64), title, url, speaker, and text.
+    """
+    cols, _ = _flatten_columns(data)
+    return pd.DataFrame(cols)
+
+def _iter_json_array(path, block_size=1 << 16):
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in small blocks and only the element being decoded is
+    kept in memory, so peak memory is about one article rather than the whole
+    file. Decoded elements are skipped by position rather than sliced off the
+    buffer, which would copy the rest of the block for every article.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buf = f.read(block_size).lstrip()
+        if not buf.startswith("["):
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos = 1
+        eof = False
+        while True:
+            # Skip separators between elements
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                buf, pos = f.read(block_size), 0
+                eof = not buf
+            if pos >= len(buf):
+                raise ValueError(f"{path} ends before the JSON array is closed")
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Element continues past the current block: read more,
+                # doubling the buffer so a large article is retried only a few times
+                more = f.read(max(block_size, len(buf) - pos))
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield obj
+            pos = end
+
+def _iter_checkpoint_csv(path):
+    """Yield articles from the scraper checkpoint CSV (one row per article)."""
+    # transcript_json cells can be larger than the csv module's default limit
+    csv.field_size_limit(sys.maxsize)
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            raw = row.get("transcript_json") or "[]"
+            yield {
+                "date": row["date"],
+                "title": row["title"],
+                "url": row["url"],
+                "transcript": json.loads(raw),
+            }
+
+def _iter_jsonl(path):
+    """Yield articles from the scraper's JSON Lines checkpoint (one per line)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            # A last line cut short by a crash is skipped
+            if line.endswith("\n"):
+                yield json.loads(line)
+
+def iter_articles(path):
+    """
+    Read articles one at a time from a transcript file.
+
+    Parameters:
+        path (str): data/processed/article_transcripts.json (a JSON array of
+            articles), data/raw/article_transcripts_checkpoint.csv (one row
+            per article with a transcript_json column) or a JSON Lines
+            checkpoint of the scraper (.jsonl, one article per line).
+    Yields:
+        dict: article with date, title, url and transcript keys.
+    """
+    lower = str(path).lower()
+    if lower.endswith(".csv"):
+        return _iter_checkpoint_csv(path)
+    if lower.endswith(".jsonl"):
+        return _iter_jsonl(path)
+    return _iter_json_array(path)
+
+def iter_transcript_batches(path, chunksize=10000):
+    """
+    Yield the flattened paragraph table in DataFrames of whole articles.
+
+    Each batch holds at least chunksize paragraphs (except the last one) and
+    never splits an article, so per-conference aggregations stay correct.
+    Speaker names are forward-filled across batches, so concatenating the
+    batches gives the same table as flatten_data on the whole file.
+
+    Parameters:
+        path (str): JSON or checkpoint CSV file, see iter_articles().
+        chunksize (int): Minimum number of paragraphs per batch.
+    Yields:
+        pd.DataFrame: Columns date, title, url, speaker, and text.
+    """
+    last_speaker = None
+    pending, n_pending = [], 0
+    for article in iter_articles(path):
+        pending.append(article)
+        n_pending += len(article["transcript"])
+        if n_pending >= chunksize:
+            cols, last_speaker = _flatten_columns(pending, last_speaker)
+            yield pd.DataFrame(cols)
+            pending, n_pending = [], 0
+    if n_pending:
+        cols, _ = _flatten_columns(pending, last_speaker)
+        yield pd.DataFrame(cols)
+
+def load_transcripts(path, chunksize=None):
+    """
+    Load a transcript file as the flattened paragraph table.
+
+    Equivalent to flatten_data(json.load(f)), but articles are streamed from
+    disk and flattened straight into columns, so the nested data is never
+    held in memory all at once.
+
+    Parameters:
+        path (str): JSON or checkpoint CSV file, see iter_articles().
+        chunksize (int, optional): If given, return an iterator of DataFrames
+            (see iter_transcript_batches) instead of one DataFrame, e.g. to
+            feed update_aggregate_store without loading the whole file.
+    Returns:
+        pd.DataFrame or iterator of pd.DataFrame
+    """
+    if chunksize is not None:
+        return iter_transcript_batches(path, chunksize)
+    cols, _ = _flatten_columns(iter_articles(path))
+    return pd.DataFrame(cols)
+
+# Speaker groups used across the analysis (alphabetical, as groupby sorts them)
+SPEAKER_GROUPS = ["Journalist", "President/Official"]
+
+# Columns added by enrich()
+ENRICHED_COLUMNS = ["speaker_clean", "speaker_group", "n_words"]
+
+def count_words(texts):
+    """
+    Count whitespace-separated words in each text of a Series.
+    Missing texts count as 0 words.
+    Args:
+        texts (pd.Series): Texts.
+    Returns:
+        np.ndarray: int32 word counts.
+    """
+    return np.fromiter(
+        (len(t.split()) if isinstance(t, str) else (0 if pd.isna(t) else len(str(t).split()))
+         for t in texts),
+        dtype=np.int32, count=len(texts)
+    )
+
+def enrich(df):
+    """
+    Add the derived columns shared by all aggregation functions, once.
 
-    df = pd.DataFrame(rows)
+    Adds:
+        - speaker_clean: clean_speaker(speaker), categorical
+        - speaker_group: 'Journalist' or 'President/Official', categorical
+        - n_words: words per paragraph, int32
+    and converts 'date' to datetime64 if it is not already (flatten_data
+    and load_transcripts produce datetime64 dates).
 
-    # Forward fill missing speaker names
-    df["speaker"] = df["speaker"].ffill()
+    Aggregation functions reuse these columns when present instead of
+    copying the frame and recomputing them, so enrich once and pass the
+    result to every function.
 
+    Args:
+        df (pd.DataFrame): Flattened transcripts (see flatten_data).
+    Returns:
+        pd.DataFrame: Enriched copy of df.
+    """
+    df = df.copy()
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    speaker_clean = clean_speakers(df["speaker"])
+    df["speaker_clean"] = speaker_clean.astype("category")
+    df["speaker_group"] = pd.Categorical(
+        np.where(speaker_clean == "PERIODISTA/PREGUNTA", "Journalist", "President/Official"),
+        categories=SPEAKER_GROUPS
+    )
+    df["n_words"] = count_words(df["text"])
     return df
-    
+
+def is_enriched(df):
+    """Return True if df already has the columns added by enrich()."""
+    return (
+        all(col in df.columns for col in ENRICHED_COLUMNS)
+        and pd.api.types.is_datetime64_any_dtype(df["date"])
+    )
+
+def _ensure_enriched(df):
+    """Return df itself if already enriched, else an enriched copy."""
+    return df if is_enriched(df) else enrich(df)
+
+# Parquet cache of the enriched paragraph table (see load_transcript_table)
+TRANSCRIPT_CACHE_VERSION = 1
+TRANSCRIPT_CACHE_COLUMNS = ["date", "title", "url", "speaker", "text"] + ENRICHED_COLUMNS
+_CACHE_METADATA_KEY = b"transcript_cache"
+
+def _file_digest(path, block_size=1 << 20):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _cache_fingerprint(sources):
+    """Cache key: format version plus the content hash of every source file."""
+    return {
+        "version": TRANSCRIPT_CACHE_VERSION,
+        "sources": [_file_digest(path) for path in sources],
+    }
+
+def read_cache_fingerprint(cache_path):
+    """Return the fingerprint stored in a transcript cache, or None if unreadable."""
+    import pyarrow.parquet as pq
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        return json.loads(metadata[_CACHE_METADATA_KEY])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def build_transcript_cache(sources, cache_path, row_group_size=2000):
+    """
+    Flatten and enrich the source files and write them to a Parquet cache.
+
+    Rows are stored sorted by speaker group and date, so row-group statistics
+    let date-range and speaker-group filters skip whole row groups. A 'row'
+    column keeps the original order, which load_transcript_table restores.
+    speaker, speaker_clean and speaker_group are dictionary-encoded.
+
+    Args:
+        sources (list): Transcript files, read in order (see iter_articles).
+        cache_path (str): Parquet file to write.
+        row_group_size (int): Rows per row group.
+    Returns:
+        pd.DataFrame: The enriched table that was written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    articles = (article for path in sources for article in iter_articles(path))
+    cols, _ = _flatten_columns(articles)
+    df = enrich(pd.DataFrame(cols))
+
+    order = np.lexsort((df["date"].to_numpy(), df["speaker_group"].cat.codes.to_numpy()))
+    stored = df.iloc[order].copy()
+    stored["speaker"] = stored["speaker"].astype("category")
+    stored.insert(0, "row", order.astype(np.int64))
+
+    table = pa.Table.from_pandas(stored, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_CACHE_METADATA_KEY] = json.dumps(_cache_fingerprint(sources)).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = f"{cache_path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    pq.write_table(table, tmp_path, row_group_size=row_group_size)
+    os.replace(tmp_path, cache_path)
+    return df
+
+def load_transcript_table(sources, cache_path, columns=None, start=None, end=None,
+                          speaker_groups=None):
+    """
+    Load the enriched paragraph table, from the Parquet cache when it is fresh.
+
+    The cache stores the content hashes of the source files; if any source
+    changed (or the cache is missing), it is rebuilt from the sources first.
+    Otherwise the file is memory-mapped and only the requested columns and
+    the row groups that can match the filters are read.
+
+    Args:
+        sources (str or list): Transcript file(s), see iter_articles().
+        cache_path (str): Parquet cache file.
+        columns (list, optional): Subset of TRANSCRIPT_CACHE_COLUMNS to load.
+        start, end (date-like, optional): Keep paragraphs with start <= date <= end.
+        speaker_groups (list, optional): Keep only these speaker groups.
+    Returns:
+        pd.DataFrame: Same columns and order as enrich(flatten_data(...)),
+        restricted to the requested columns and rows.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+
+    if read_cache_fingerprint(cache_path) != _cache_fingerprint(sources):
+        build_transcript_cache(sources, cache_path)
+
+    columns = list(columns) if columns is not None else TRANSCRIPT_CACHE_COLUMNS
+    filters = []
+    if start is not None:
+        filters.append(("date", ">=", pd.Timestamp(start)))
+    if end is not None:
+        filters.append(("date", "<=", pd.Timestamp(end)))
+    if speaker_groups is not None:
+        filters.append(("speaker_group", "in", list(speaker_groups)))
+
+    table = pq.read_table(cache_path, columns=["row"] + columns,
+                          filters=filters or None, memory_map=True)
+    table = table.take(pc.sort_indices(table["row"]))
+
+    # Filtered rows keep their position in the full table as index, like df[mask]
+    df = table.to_pandas()
+    rows = df.pop("row")
+    df.index = pd.Index(rows.to_numpy()) if filters else pd.RangeIndex(len(df))
+    if "speaker" in df.columns:
+        df["speaker"] = df["speaker"].astype(object)
+    if "speaker_group" in df.columns:
+        df["speaker_group"] = df["speaker_group"].cat.set_categories(SPEAKER_GROUPS)
+    return df
+
+# Columns of the turn table built by collapse_turns()
+TURN_TABLE_COLUMNS = ["date", "title", "url", "speaker_clean", "speaker_group",
+                      "para_start", "para_end", "n_paragraphs", "n_words",
+                      "text_start", "text_end"]
+
+# Separator between paragraphs when the texts of a turn are joined
+TURN_TEXT_SEP = "\n"
+
+def collapse_turns(df, with_text=False):
+    """
+    Merge consecutive paragraphs of the same speaker into conversation turns.
+
+    flatten_data has one row per <p> tag, so a long answer split across
+    many paragraphs counts as many turns. Runs of paragraphs with the same
+    cleaned speaker within one conference (url) become one row here.
+
+    The texts are not copied: each turn records the positions of its
+    paragraphs in df (para_start to para_end, exclusive) and the character
+    span of its text (text_start to text_end) in the corpus text joined with
+    TURN_TEXT_SEP. Use turn_texts() to materialize them when needed.
+
+    The turn table has the columns of an enriched frame (date, speaker_clean,
+    speaker_group, n_words), so the turn-taking functions accept it as is
+    (get_turn_taking_tables(df, turns=True) builds it for you). With
+    with_text=True it also gets a 'text' column, for the sentiment and topic
+    functions.
+
+    Args:
+        df (pd.DataFrame): Flattened (or enriched) paragraphs.
+        with_text (bool): Add each turn's joined text as a 'text' column.
+    Returns:
+        pd.DataFrame: One row per turn with TURN_TABLE_COLUMNS (+ 'text').
+    """
+    df = _ensure_enriched(df)
+    n = len(df)
+
+    # A new turn starts when the speaker or the conference changes
+    speaker_codes = pd.factorize(df["speaker_clean"].astype(object))[0]
+    conference_codes = pd.factorize(df["url"])[0]
+    starts_turn = np.ones(n, dtype=bool)
+    starts_turn[1:] = (
+        (speaker_codes[1:] != speaker_codes[:-1]) | (conference_codes[1:] != conference_codes[:-1])
+    )
+    para_start = np.flatnonzero(starts_turn)
+    para_end = np.append(para_start[1:], n) if n else para_start
+
+    # Character offsets of each paragraph in TURN_TEXT_SEP.join(texts)
+    text_len = df["text"].str.len().fillna(0).to_numpy(dtype=np.int64)
+    text_offset = np.concatenate([[0], np.cumsum(text_len + len(TURN_TEXT_SEP))])
+
+    turns = df.iloc[para_start][["date", "title", "url", "speaker_clean", "speaker_group"]]
+    turns = turns.reset_index(drop=True)
+    turns["para_start"] = para_start
+    turns["para_end"] = para_end
+    turns["n_paragraphs"] = para_end - para_start
+    turns["n_words"] = np.add.reduceat(df["n_words"].to_numpy(), para_start) if n else 0
+    turns["text_start"] = text_offset[para_start]
+    turns["text_end"] = text_offset[para_end] - len(TURN_TEXT_SEP)
+
+    if with_text:
+        turns["text"] = turn_texts(turns, df)
+    return turns
+
+def turn_texts(turns, paragraphs):
+    """
+    Text of each turn: its paragraphs joined with TURN_TEXT_SEP.
+
+    Args:
+        turns (pd.DataFrame): Turn table from collapse_turns(paragraphs).
+        paragraphs (pd.DataFrame): The frame the turn table was built from.
+    Returns:
+        pd.Series: One string per turn, indexed like turns.
+    """
+    corpus = TURN_TEXT_SEP.join(paragraphs["text"].fillna("").astype(str))
+    return pd.Series(
+        [corpus[a:b] for a, b in zip(turns["text_start"], turns["text_end"])],
+        index=turns.index, dtype=object
+    )
+
+def is_turn_table(df):
+    """Return True if df is a turn table from collapse_turns()."""
+    return all(col in df.columns for col in TURN_TABLE_COLUMNS)
+
+# Incremental store of per-conference partial sums (see update_aggregate_store).
+# Bump AGGREGATE_STORE_VERSION when the partials change, so old stores are rebuilt.
+AGGREGATE_STORE_VERSION = 1
+
+# Partial sums kept for each conference and speaker group
+AGGREGATE_SUMS = ["n_rows", "n_text_rows", "n_words", "clean_words",
+                  "total_turns", "president_turns", "journalist_turns",
+                  "after_total_turns", "after_president_turns", "after_journalist_turns"]
+
+# Columns of the partials table (followed by one '<topic>_count' column per topic)
+AGGREGATE_COLUMNS = ["date", "title", "url", "conf_id", "speaker_group"] + AGGREGATE_SUMS
+
+_TURN_SUMS = ["total_turns", "president_turns", "journalist_turns"]
+_AFTER_TURN_SUMS = [f"after_{col}" for col in _TURN_SUMS]
+
+def _open_aggregate_store(store_path):
+    """Open (creating if needed) the SQLite aggregate store."""
+    os.makedirs(os.path.dirname(os.path.abspath(store_path)), exist_ok=True)
+    con = sqlite3.connect(store_path)
+    sums = ", ".join(f"{col} INTEGER NOT NULL" for col in AGGREGATE_SUMS)
+    con.executescript(
+        "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        "CREATE TABLE IF NOT EXISTS conferences ("
+        "conf_id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, "
+        "date TEXT, title TEXT, url TEXT, digest TEXT NOT NULL);"
+        "CREATE TABLE IF NOT EXISTS partials ("
+        f"conf_id INTEGER NOT NULL, speaker_group TEXT NOT NULL, {sums}, "
+        "PRIMARY KEY (conf_id, speaker_group));"
+        "CREATE TABLE IF NOT EXISTS topic_counts ("
+        "conf_id INTEGER NOT NULL, speaker_group TEXT NOT NULL, topic TEXT NOT NULL, "
+        "mentions INTEGER NOT NULL, PRIMARY KEY (conf_id, speaker_group, topic));"
+    )
+    return con
+
+def _conference_key(date, title, url):
+    """Identity of a conference in the store: its date, title and url."""
+    return "\x1f".join("" if pd.isna(v) else str(v) for v in (date, title, url))
+
+def _conference_partials(df, conf_ids, matcher):
+    """
+    Partial sums of the paragraphs of df, per conference (conf_ids, one per
+    row) and speaker group, as update_aggregate_store stores them.
+
+    'after_*' turns are counted from the first journalist of each conference;
+    get_turn_taking_tables combines them across the conferences of a day.
+    """
+    speaker = df["speaker_clean"]
+    president = (speaker == "CLAUDIA SHEINBAUM PARDO").to_numpy()
+    journalist = (speaker == "PERIODISTA/PREGUNTA").to_numpy()
+    counted = speaker.notna().to_numpy()
+    after = pd.Series(journalist).groupby(conf_ids, sort=False).cummax().to_numpy(dtype=bool)
+
+    clean = clean_text_series(df["text"])
+    rows = pd.DataFrame({
+        "conf_id": conf_ids,
+        "speaker_group": df["speaker_group"].to_numpy(),
+        "n_rows": 1,
+        "n_text_rows": df["text"].notna().to_numpy(),
+        "n_words": df["n_words"].to_numpy(dtype=np.int64),
+        "clean_words": clean.str.split().apply(len).to_numpy(),
+        "total_turns": counted,
+        "president_turns": president,
+        "journalist_turns": journalist,
+        "after_total_turns": counted & after,
+        "after_president_turns": president & after,
+        "after_journalist_turns": journalist & after,
+    })
+    topic_cols = [f"{t}_count" for t in matcher["topics"]]
+    rows[topic_cols] = count_topic_matrix(clean, matcher)
+
+    sums = rows.groupby(["conf_id", "speaker_group"], observed=True).sum()
+    return sums[AGGREGATE_SUMS].astype(np.int64), sums[topic_cols].astype(np.int64)
+
+def _write_conference_partials(con, stale, heads, digests, sums, mentions):
+    """Replace the stored partitions of the stale (conf_id, key, position) conferences."""
+    ids = [(conf_id,) for conf_id, _, _ in stale]
+    con.executemany("DELETE FROM partials WHERE conf_id = ?", ids)
+    con.executemany("DELETE FROM topic_counts WHERE conf_id = ?", ids)
+    con.executemany(
+        "INSERT OR REPLACE INTO conferences VALUES (?, ?, ?, ?, ?, ?)",
+        [(conf_id, key, heads[c][0] and heads[c][0].isoformat(), heads[c][1], heads[c][2],
+          digests[c]) for conf_id, key, c in stale]
+    )
+    con.executemany(
+        f"INSERT INTO partials VALUES ({','.join('?' * (2 + len(AGGREGATE_SUMS)))})",
+        [(int(conf_id), group, *map(int, values))
+         for (conf_id, group), values in zip(sums.index, sums.to_numpy())]
+    )
+    # Only non-zero mentions are stored
+    topics = [col[:-len("_count")] for col in mentions.columns]
+    counts = mentions.to_numpy()
+    con.executemany(
+        "INSERT INTO topic_counts VALUES (?, ?, ?, ?)",
+        [(int(mentions.index[i][0]), mentions.index[i][1], topics[j], int(counts[i, j]))
+         for i, j in zip(*counts.nonzero())]
+    )
+
+def update_aggregate_store(df, store_path, topics: dict, whole_words=False):
+    """
+    Bring the aggregate store up to date with df and return its partials.
+
+    The store (a SQLite file) keeps partial sums for every conference
+    (date, title, url) and speaker group: paragraphs, words, cleaned words,
+    turn counts and mentions of each topic. Each conference is stored with a
+    hash of its paragraphs, so only conferences that are new or whose
+    paragraphs changed are recomputed; the others are left untouched.
+    Conferences missing from df are kept.
+
+    The partials stand in for the paragraph table in get_conference_lengths,
+    get_daily_lengths, get_daily_lengths_by_actor, get_avg_length_by_weekday,
+    get_turn_taking_tables (and stats) and the weekly topic functions, which
+    then give the same results without touching the paragraphs.
+
+    Topic counts are stored for the given topics; updating with different
+    topics (or whole_words) rebuilds the whole store.
+
+    df can also be an iterable of DataFrames that never split a conference,
+    such as load_transcripts(path, chunksize=...): the store is then updated
+    one batch at a time, so a transcript file larger than memory can be
+    aggregated without building the whole paragraph table.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): Flattened (or
+            enriched) paragraphs.
+        store_path (str): SQLite file of the store.
+        topics (dict): Mapping of topic names to lists of keywords.
+        whole_words (bool): Match keywords as whole words only (see compile_topics).
+    Returns:
+        pd.DataFrame: The store's partials (see load_aggregate_partials).
+    """
+    settings = json.dumps({
+        "version": AGGREGATE_STORE_VERSION,
+        "topics": {name: list(keywords) for name, keywords in topics.items()},
+        "whole_words": bool(whole_words),
+    }, sort_keys=True)
+    matcher = []    # compiled on the first batch that needs it
+
+    def compiled():
+        if not matcher:
+            matcher.append(compile_topics(topics, whole_words))
+        return matcher[0]
+
+    batches = [df] if isinstance(df, pd.DataFrame) else df
+    for batch in batches:
+        _update_aggregate_store_batch(batch, store_path, settings, compiled)
+    return load_aggregate_partials(store_path)
+
+def _update_aggregate_store_batch(df, store_path, settings, compiled):
+    """update_aggregate_store for one DataFrame; compiled() gives the topic matcher."""
+    df = _ensure_enriched(df)
+
+    # Conferences of df in order of appearance, with a hash of their paragraphs
+    conference = df.groupby(["date", "title", "url"], dropna=False, sort=False).ngroup().to_numpy()
+    n_conf = conference.max() + 1 if len(conference) else 0
+    order = np.argsort(conference, kind="stable")
+    bounds = np.searchsorted(conference[order], np.arange(n_conf + 1))
+    speakers = df["speaker_clean"].astype(object).to_numpy()
+    texts = df["text"].to_numpy()
+    digests = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        digest = hashlib.sha256()
+        for i in order[start:end]:
+            digest.update(f"{speakers[i]}\x1f{texts[i]}\x1e".encode())
+        digests.append(digest.hexdigest())
+    heads = df.iloc[order[bounds[:-1]]][["date", "title", "url"]]
+    heads = [tuple(None if pd.isna(v) else v for v in row) for row in heads.itertuples(index=False)]
+
+    con = _open_aggregate_store(store_path)
+    try:
+        with con:
+            row = con.execute("SELECT value FROM settings WHERE key = 'settings'").fetchone()
+            if row is None or row[0] != settings:
+                con.execute("DELETE FROM conferences")
+                con.execute("DELETE FROM partials")
+                con.execute("DELETE FROM topic_counts")
+                con.execute("INSERT OR REPLACE INTO settings VALUES ('settings', ?)", (settings,))
+
+            stored = {key: (conf_id, digest) for conf_id, key, digest
+                      in con.execute("SELECT conf_id, key, digest FROM conferences")}
+            next_id = con.execute("SELECT COALESCE(MAX(conf_id), 0) + 1 FROM conferences").fetchone()[0]
+
+            # Conferences to (re)compute; new ones get ids in the order of df
+            conf_ids = np.zeros(n_conf, dtype=np.int64)
+            stale = []
+            for c, (head, digest) in enumerate(zip(heads, digests)):
+                key = _conference_key(*head)
+                conf_id, stored_digest = stored.get(key, (None, None))
+                if stored_digest == digest:
+                    continue
+                if conf_id is None:
+                    conf_id, next_id = next_id, next_id + 1
+                conf_ids[c] = conf_id
+                stale.append((conf_id, key, c))
+
+            if stale:
+                rows = np.isin(conference, [c for _, _, c in stale])
+                sums, mentions = _conference_partials(
+                    df[rows], conf_ids[conference[rows]], compiled()
+                )
+                _write_conference_partials(con, stale, heads, digests, sums, mentions)
+    finally:
+        con.close()
+
+def load_aggregate_partials(store_path):
+    """
+    Read the partials of an aggregate store built by update_aggregate_store.
+
+    Args:
+        store_path (str): SQLite file of the store.
+    Returns:
+        pd.DataFrame: One row per conference and speaker group, with
+        AGGREGATE_COLUMNS and a '<topic>_count' column per stored topic,
+        ordered by conf_id (the order conferences were added in). The
+        stored topics and whole_words are kept in .attrs.
+    """
+    con = _open_aggregate_store(store_path)
+    try:
+        row = con.execute("SELECT value FROM settings WHERE key = 'settings'").fetchone()
+        settings = json.loads(row[0]) if row else {"topics": {}, "whole_words": False}
+        conferences = pd.read_sql_query("SELECT conf_id, date, title, url FROM conferences", con)
+        sums = pd.read_sql_query("SELECT * FROM partials ORDER BY conf_id, speaker_group", con)
+        mentions = pd.read_sql_query("SELECT * FROM topic_counts", con)
+    finally:
+        con.close()
+
+    topics = list(settings["topics"])
+    counts = (
+        mentions.pivot(index=["conf_id", "speaker_group"], columns="topic", values="mentions")
+        .reindex(index=pd.MultiIndex.from_frame(sums[["conf_id", "speaker_group"]]), columns=topics)
+        .fillna(0)
+        .astype(np.int64)
+    )
+
+    partials = conferences.merge(sums, on="conf_id", how="right")
+    partials["date"] = pd.to_datetime(partials["date"], format="ISO8601")
+    partials["speaker_group"] = pd.Categorical(partials["speaker_group"], categories=SPEAKER_GROUPS)
+    partials[AGGREGATE_SUMS] = partials[AGGREGATE_SUMS].astype(np.int64)
+    # Same dtype as the paragraph word counts (see count_words)
+    partials["n_words"] = partials["n_words"].astype(np.int32)
+    partials[[f"{t}_count" for t in topics]] = counts.to_numpy()
+
+    partials.attrs["topics"] = settings["topics"]
+    partials.attrs["whole_words"] = settings["whole_words"]
+    return partials
+
+def is_aggregate_partials(df):
+    """Return True if df is a partials table from load_aggregate_partials()."""
+    return all(col in df.columns for col in AGGREGATE_COLUMNS)
+
+def _ensure_word_table(df):
+    """
+    Return partials as they are, else enriched paragraphs: both have the
+    'date', 'speaker_group' and 'n_words' columns the length functions sum.
+    """
+    return df if is_aggregate_partials(df) else _ensure_enriched(df)
+
+def _stored_topic_columns(partials, topics, whole_words):
+    """Count columns of topics in partials; the store must hold the same keywords."""
+    stored = partials.attrs.get("topics", {})
+    if (partials.attrs.get("whole_words") != bool(whole_words)
+            or any(stored.get(name) != list(keywords) for name, keywords in topics.items())):
+        raise ValueError(
+            "The aggregate store holds counts for other topics; "
+            "update it with these topics first (update_aggregate_store)"
+        )
+    return [f"{t}_count" for t in topics]
+
 def get_conference_lengths(df):
     """
     Compute length (word count) for each unique speech (title/url) and date.
-    
+
     Args:
-        df (pd.DataFrame): Must contain columns ['date', 'title', 'url', 'text']
+        df (pd.DataFrame): Must contain columns ['date', 'title', 'url', 'text'],
+            or aggregate partials (see load_aggregate_partials).
     Returns:
         pd.DataFrame: tidy DataFrame with ['date', 'title', 'url', 'length_words']
     """
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df = df.dropna(subset=["text"])
+    if is_aggregate_partials(df):
+        # Word sums per conference and group, without groups that only had empty paragraphs
+        words = df.loc[df["n_text_rows"] > 0, ["date", "title", "url", "n_words"]]
+    else:
+        df = _ensure_enriched(df)
 
-    # Compute word count per paragraph
-    df["word_count"] = df["text"].apply(lambda x: len(str(x).split()))
+        # Paragraph word counts, without empty (missing) paragraphs
+        words = df.loc[df["text"].notna(), ["date", "title", "url", "n_words"]]
 
     # Aggregate by date + title + url
     result = (
-        df.groupby(["date", "title", "url"], as_index=False)["word_count"]
+        words.groupby(["date", "title", "url"], as_index=False)["n_words"]
           .sum()
-          .rename(columns={"word_count": "length_words"})
+          .rename(columns={"n_words": "length_words"})
           .sort_values(["date", "title"])
           .reset_index(drop=True)
     )
@@ -147,12 +1074,75 @@ def get_conference_lengths(df):
 
     return result
 
+# Calendar labels, Monday (0) to Sunday (6) and January to December
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_NAMES = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+@lru_cache(maxsize=8)
+def _calendar_range(start, end):
+    """Calendar rows for every day from start to end (cached per range)."""
+    days = pd.date_range(start, end, freq="D")
+    iso = days.isocalendar()
+    year = iso["year"].to_numpy(dtype=np.int64)
+    week = iso["week"].to_numpy(dtype=np.int64)
+    day_idx = days.dayofweek.to_numpy(dtype=np.int64)
+
+    return pd.DataFrame({
+        "date": days,
+        "week": iso["week"].array,
+        "year": iso["year"].array,
+        # Built once per distinct week, not per row
+        "yearweek": pd.Series(year * 100 + week).map(
+            {yw: f"{yw // 100}-{yw % 100:02d}" for yw in set(year * 100 + week)}
+        ).to_numpy(dtype=object),
+        "day_of_week": np.array(WEEKDAY_NAMES, dtype=object)[day_idx],
+        "day_idx": day_idx,
+        "month": pd.Categorical.from_codes(days.month - 1, categories=MONTH_NAMES, ordered=True),
+    })
+
+def get_calendar(dates):
+    """
+    Calendar dimension table for the date range covered by dates.
+
+    One row per day from the first to the last date, with:
+        - week, year (ISO), yearweek ('2025-07')
+        - day_of_week ('Monday'...), day_idx (Monday = 0)
+        - month (ordered categorical, January to December)
+
+    Tables are cached per date range, so the heatmap helpers derive these
+    columns once for the corpus and merge them in.
+
+    Args:
+        dates (pd.Series): datetime64 dates.
+    Returns:
+        pd.DataFrame: Calendar rows keyed by 'date'.
+    """
+    dates = dates.dropna()
+    if dates.empty:
+        return _calendar_range(pd.Timestamp(0), pd.Timestamp(0)).iloc[:0]
+    return _calendar_range(dates.min().normalize(), dates.max().normalize())
+
+def _slice_bounds(table, day_idx, conf_rank, n_conf):
+    """
+    Horizontal slice bounds inside a day cell: conference conf_rank of n_conf
+    spans [day_idx + (conf_rank - 1) / n_conf, day_idx + conf_rank / n_conf].
+    Numerators are integers, so each bound is a single division.
+    """
+    n = table[n_conf].to_numpy()
+    left = table[day_idx].to_numpy() * n + table[conf_rank].to_numpy() - 1
+    table["x0"] = left / n
+    table["x1"] = (left + 1) / n
+
 def get_daily_lengths(df):
     """
     Compute daily conference lengths and visualization attributes for heatmaps.
 
     Args:
-        df (pd.DataFrame): Must contain columns ['date', 'title', 'url', 'text']
+        df (pd.DataFrame): Must contain columns ['date', 'title', 'url', 'text'],
+            or aggregate partials (see load_aggregate_partials).
     
     Returns a tidy DataFrame with:
         - date
@@ -164,31 +1154,20 @@ def get_daily_lengths(df):
     """
     # Get conference lengths
     df_lengths = get_conference_lengths(df)
-    daily_split = df_lengths.copy() # to avoid modifying original
-    daily_split["date"] = pd.to_datetime(daily_split["date"], errors="coerce")
-
-    # Add week and year
-    daily_split["week"] = daily_split["date"].dt.isocalendar().week
-    daily_split["year"] = daily_split["date"].dt.isocalendar().year
 
-    # Combine to get a unique "year-week" identifier
-    daily_split["yearweek"] = (
-        daily_split["year"].astype(str) + "-" + daily_split["week"].astype(str).str.zfill(2)
+    # Week, year and weekday from the calendar table
+    calendar = get_calendar(df_lengths["date"])
+    daily_split = df_lengths.merge(
+        calendar[["date", "week", "year", "yearweek", "day_of_week", "day_idx"]],
+        on="date", how="left"
     )
 
-    # weekday index, so we go from Monday (0) to Sunday (6)
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    day_to_idx = {d: i for i, d in enumerate(day_order)}
-    daily_split["day_of_week"] = daily_split["date"].dt.day_name()
-    daily_split["day_idx"] = daily_split["day_of_week"].map(day_to_idx)
-
     # rank conferences within the same date and total per date
     daily_split["conf_rank"] = daily_split.groupby("date").cumcount() + 1
     daily_split["n_conf"] = daily_split.groupby("date")["title"].transform("count")
 
     # compute horizontal slice bounds inside the day cell
-    daily_split["x0"] = daily_split["day_idx"] + (daily_split["conf_rank"] - 1) / daily_split["n_conf"]
-    daily_split["x1"] = daily_split["day_idx"] + daily_split["conf_rank"] / daily_split["n_conf"]
+    _slice_bounds(daily_split, "day_idx", "conf_rank", "n_conf")
 
     # rename for clarity
     daily_split = daily_split.rename(columns={"length_words": "words"})
@@ -201,7 +1180,8 @@ def get_daily_lengths_by_actor(df):
     plus visualization attributes for heatmaps.
 
     Args:
-        df (pd.DataFrame): Must contain at least ['date', 'speaker_clean', 'text']
+        df (pd.DataFrame): Must contain at least ['date', 'speaker_clean', 'text'],
+            or aggregate partials (see load_aggregate_partials).
 
     Returns:
         pd.DataFrame with columns:
@@ -214,137 +1194,132 @@ def get_daily_lengths_by_actor(df):
             - x0, x1 (for horizontal slice plotting)
     """
 
-    # Prepare data
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-
-    # Define speaker grouping
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
-    df["speaker_group"] = df["speaker_clean"].apply(
-    lambda s: "Journalist" if s == "PERIODISTA/PREGUNTA" else "President/Official"
-    )
+    # Prepare data (speaker grouping and word counts)
+    df = _ensure_word_table(df)
 
     # Compute total words per date and actor
-    df["words"] = df["text"].fillna("").str.split().str.len()
     daily_actor = (
-        df.groupby(["date", "speaker_group"], as_index=False)["words"]
+        df.groupby(["date", "speaker_group"], as_index=False, observed=True)["n_words"]
         .sum()
-        .rename(columns={"words": "total_words"})
-    )
-
-    # Week and year info
-    daily_actor["week"] = daily_actor["date"].dt.isocalendar().week
-    daily_actor["year"] = daily_actor["date"].dt.isocalendar().year
-    daily_actor["yearweek"] = (
-        daily_actor["year"].astype(str) + "-" + daily_actor["week"].astype(str).str.zfill(2)
+        .rename(columns={"n_words": "total_words"})
     )
 
-    # Weekday and index for plotting
-    # Asked ChatGPT to do this:
-    day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    day_to_idx = {d: i for i, d in enumerate(day_order)}
-    daily_actor["day_of_week"] = daily_actor["date"].dt.day_name()
-    daily_actor["day_idx"] = daily_actor["day_of_week"].map(day_to_idx)
-
-    daily_actor["month"] = daily_actor["date"].dt.strftime("%B")
-    daily_actor["month"] = pd.Categorical(
-        daily_actor["month"],
-        categories=[
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ],
-        ordered=True
+    # Week, year, weekday and month from the calendar table
+    calendar = get_calendar(daily_actor["date"])
+    daily_actor = daily_actor.merge(
+        calendar[["date", "week", "year", "yearweek", "day_of_week", "day_idx", "month"]],
+        on="date", how="left"
     )
 
     # Handle multiple conferences per day
-    daily_actor["conf_rank"] = daily_actor.groupby(["date", "speaker_group"]).cumcount() + 1
-    daily_actor["n_conf"] = daily_actor.groupby(["date", "speaker_group"])["total_words"].transform("count")
+    daily_actor["conf_rank"] = daily_actor.groupby(["date", "speaker_group"], observed=True).cumcount() + 1
+    daily_actor["n_conf"] = daily_actor.groupby(["date", "speaker_group"], observed=True)["total_words"].transform("count")
 
     # Compute slice bounds (same logic as before)
-    daily_actor["x0"] = daily_actor["day_idx"] + (daily_actor["conf_rank"] - 1) / daily_actor["n_conf"]
-    daily_actor["x1"] = daily_actor["day_idx"] + daily_actor["conf_rank"] / daily_actor["n_conf"]
+    _slice_bounds(daily_actor, "day_idx", "conf_rank", "n_conf")
 
     return daily_actor
 
+# Speaker cleaning rules, checked in order (first match wins).
+# Each rule is (pattern, how, label): "match" rules must match at the start
+# of the label, "search" rules anywhere in it. A label of None drops the row.
+SPEAKER_RULES = [
+    # Drop transcript markers like —000—
+    (r"^[-—_ ]*0+[-—_ ]*$", "match", None),
+    # Drop administrative / non-speech labels
+    (r"\(?\bFIRMA DE DECRETO\b\)?", "search", None),
+    (r"\(?\bFINALIZA VIDEO\b\)?", "search", None),
+    (r"\(?INICIA VIDEO\b\)?", "search", None),
+    (r"\(?Gracias\b\)?", "search", None),
+    # Group related roles
+    (r"^SECRETARI[AO]", "match", "SECRETARIA/SECRETARIO"),
+    (r"SECRETARI[AO]", "search", "SECRETARIA/SECRETARIO"),
+    (r"^SUBSECRETARI[AO]", "match", "SUBSECRETARIA/SUBSECRETARIO"),
+    (r"^CONSEJER[AO]", "match", "CONSEJERA/CONSEJERO"),
+    (r"^PROCURADOR(?:A)?", "match", "PROCURADOR/PROCURADORA"),
+    (r"^DIRECTOR(?:A)?", "match", "DIRECTOR/DIRECTORA"),
+    (r"DIRECTOR(?:A)?", "search", "DIRECTOR/DIRECTORA"),
+    (r"^TITULAR(?:A)?", "match", "TITULAR"),
+    (r"^FISCAL(?:A)?", "match", "FISCAL"),
+    (r"^INTERLOCUTOR(?:A)?", "match", "INTERLOCUTOR/INTERLOCUTORA"),
+    (r"^DIVULGADOR(?:A)?", "match", "DIVULGADOR/DIVULGADORA"),
+    (r"^JEF[EA]", "match", "JRFE/JEFA"),
+    (r"^COMANDANT[EA]", "match", "COMANDANTE/COMANDANTA"),
+    (r"^VOCAL", "match", "VOCAL"),
+    (r"^GOBERNADOR(?:A)?", "match", "GOBERNADOR/GOEBERNADORA"),
+    (r"^COORDINADOR(?:A)?", "match", "COORDINADOR/COORDINADORA"),
+    (r"^PRESIDENTA", "match", "CLAUDIA SHEINBAUM PARDO"),
+    (r"^PREGUNTA", "match", "PERIODISTA/PREGUNTA"),
+    (r"^VOZ DE (?:MUJER|HOMBRE)", "match", "VOZ ANÓNIMA"),
+    (r"^VOZ (?:MUJER|HOMBRE)", "match", "VOZ ANÓNIMA"),
+    (r"^INTERVENCIÓN", "match", "VOZ ANÓNIMA"),
+    (r"^MODERADOR", "match", "MODERADOR"),
+    (r"^[-–—_]+$", "match", "Unknown"),
+]
+
+def _compile_speaker_rules(rules):
+    """
+    Compile the rule table into a single regex with one named group per rule.
+
+    All alternatives are anchored at the start of the label ("search" rules
+    get a lazy `.*?` prefix), so the regex engine tries them in table order
+    and the first alternative that matches is the first matching rule.
+    """
+    alternatives = []
+    for i, (pattern, how, _) in enumerate(rules):
+        prefix = ".*?" if how == "search" else ""
+        alternatives.append(f"(?P<rule{i}>{prefix}{pattern})")
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+_SPEAKER_RE = _compile_speaker_rules(SPEAKER_RULES)
+_SPEAKER_LABELS = {f"rule{i}": label for i, (_, _, label) in enumerate(SPEAKER_RULES)}
+
+@lru_cache(maxsize=4096)
+def _clean_speaker_label(s):
+    """Apply the speaker rules to one raw (string) label. Memoized."""
+    s = s.strip()
+    if s == "":
+        return None
+    s = _SPACES_RE.sub(" ", s)
+    s = re.sub(r":$", "", s)  # remove trailing colon
+
+    match = _SPEAKER_RE.match(s)
+    if match:
+        return _SPEAKER_LABELS[match.lastgroup]
+    return s
+
 def clean_speaker(s):
     """
     Clean and standardize speaker names/labels.
-    Groups related roles into unified labels.
+    Groups related roles into unified labels (see SPEAKER_RULES).
     Args:
         s (str): Raw speaker label.
     Returns:
         str or None: Cleaned speaker label or None if to be dropped.
     """
-    if pd.isna(s) or str(s).strip() == "":
+    if pd.isna(s):
         return None
+    return _clean_speaker_label(str(s))
 
-    s = str(s).strip()
-    s = re.sub(r"\s+", " ", s)
-    s = re.sub(r":$", "", s)  # remove trailing colon
+def clean_speakers(series):
+    """
+    Apply clean_speaker to a whole pandas Series.
 
-    # Drop transcript markers like —000—
-    if re.match(r"^[-—_ ]*0+[-—_ ]*$", s):
-        return None
-    # Drop administrative / non-speech labels
-    if re.search(r"\(?\bFIRMA DE DECRETO\b\)?", s, re.IGNORECASE):
-        return None
-    if re.search(r"\(?\bFINALIZA VIDEO\b\)?", s, re.IGNORECASE):
-        return None
-    if re.search(r"\(?INICIA VIDEO\b\)?", s, re.IGNORECASE):
-        return None
-    if re.search(r"\(?Gracias\b\)?", s, re.IGNORECASE):
-        return None
+    Raw speaker labels repeat a lot, so each distinct label is cleaned once
+    and the result is broadcast back to all rows.
+
+    Args:
+        series (pd.Series): Raw speaker labels.
+    Returns:
+        pd.Series: Cleaned labels (None for dropped ones), same index as input.
+    """
+    codes, uniques = pd.factorize(series)
+    cleaned = [clean_speaker(s) for s in uniques]
+    # Missing values get code -1, which picks the trailing None below
+    cleaned.append(None)
+    values = np.array(cleaned, dtype=object)[codes]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
 
-    # --- Group related patterns ---
-    if re.match(r"^SECRETARI[AO]", s, re.IGNORECASE):
-        return "SECRETARIA/SECRETARIO"
-    if re.search(r"SECRETARI[AO]", s, re.IGNORECASE):
-        return "SECRETARIA/SECRETARIO"
-    elif re.match(r"^SUBSECRETARI[AO]", s, re.IGNORECASE):
-        return "SUBSECRETARIA/SUBSECRETARIO"
-    elif re.match(r"^CONSEJER[AO]", s, re.IGNORECASE):
-        return "CONSEJERA/CONSEJERO"
-    elif re.match(r"^PROCURADOR(A)?", s, re.IGNORECASE):
-        return "PROCURADOR/PROCURADORA"
-    elif re.match(r"^DIRECTOR(A)?", s, re.IGNORECASE):
-        return "DIRECTOR/DIRECTORA"
-    if re.search(r"DIRECTOR(A)?", s, re.IGNORECASE):
-        return "DIRECTOR/DIRECTORA"
-    elif re.match(r"^TITULAR(A)?", s, re.IGNORECASE):
-        return "TITULAR"
-    elif re.match(r"^FISCAL(A)?", s, re.IGNORECASE):
-        return "FISCAL"
-    elif re.match(r"^INTERLOCUTOR(A)?", s, re.IGNORECASE):
-        return "INTERLOCUTOR/INTERLOCUTORA"
-    elif re.match(r"^DIVULGADOR(A)?", s, re.IGNORECASE):
-        return "DIVULGADOR/DIVULGADORA"
-    elif re.match(r"^JEF[EA]", s, re.IGNORECASE):
-        return "JRFE/JEFA"
-    elif re.match(r"^COMANDANT[EA]", s, re.IGNORECASE):
-        return "COMANDANTE/COMANDANTA"
-    elif re.match(r"^VOCAL", s, re.IGNORECASE):
-        return "VOCAL"
-    elif re.match(r"^GOBERNADOR(A)?", s, re.IGNORECASE):
-        return "GOBERNADOR/GOEBERNADORA"
-    elif re.match(r"^COORDINADOR(A)?", s, re.IGNORECASE):
-        return "COORDINADOR/COORDINADORA"
-    elif re.match(r"^PRESIDENTA", s, re.IGNORECASE):
-        return "CLAUDIA SHEINBAUM PARDO"
-    elif re.match(r"^PREGUNTA", s, re.IGNORECASE):
-        return "PERIODISTA/PREGUNTA"
-    elif re.match(r"^VOZ DE (MUJER|HOMBRE)", s, re.IGNORECASE):
-        return "VOZ ANÓNIMA"
-    elif re.match(r"^VOZ (MUJER|HOMBRE)", s, re.IGNORECASE):
-        return "VOZ ANÓNIMA"
-    elif re.match(r"^INTERVENCIÓN", s, re.IGNORECASE):
-        return "VOZ ANÓNIMA"
-    elif re.match(r"^MODERADOR", s, re.IGNORECASE):
-        return "MODERADOR"
-    elif re.match(r"^[-–—_]+$", s.strip()):
-        return "Unknown"
-    else:
-        return s
-        
 def get_top_speakers(df, n=20):
     """
     Return a tidy dataframe with the top N speakers across all transcripts.
@@ -359,12 +1334,12 @@ def get_top_speakers(df, n=20):
     """
 
     # Apply cleaning
-    df = df.copy()
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
+    df = _ensure_enriched(df)
 
-    # Count frequencies
+    # Count frequencies (as plain labels, so only speakers present are counted)
     counts = (
         df["speaker_clean"]
+        .astype(object)
         .dropna()
         .value_counts()
         .reset_index()
@@ -389,16 +1364,12 @@ def get_top_speakers_by_words(df, n=20):
         pd.DataFrame with columns ['speaker', 'total_words', 'pct_of_total']
     """    
         
-    # Apply cleaning
-    df = df.copy()
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
-
-    # Compute word counts per intervention
-    df["n_words"] = df["text"].fillna("").apply(lambda x: len(str(x).split()))
+    # Apply cleaning and word counts per intervention
+    df = _ensure_enriched(df)
 
     # Aggregate by speaker
     word_stats = (
-        df.groupby("speaker_clean", dropna=True)["n_words"]
+        df.groupby("speaker_clean", dropna=True, observed=True)["n_words"]
         .sum()
         .reset_index()
         .rename(columns={"n_words": "total_words"})
@@ -411,109 +1382,145 @@ def get_top_speakers_by_words(df, n=20):
 
     return word_stats.head(n)
 
-def get_turn_taking_stats(df):
+_TURN_COLUMNS = ["date", "total_turns", "president_turns",
+                 "journalist_turns", "ratio_president_journalist"]
+
+def _finish_turn_stats(counts):
+    """Add the president/journalist ratio, dropping conferences without journalists."""
+    turn_stats = counts.reset_index()
+
+    # Compute ratio (handle division by zero)
+    turn_stats["ratio_president_journalist"] = (
+        turn_stats["president_turns"] / turn_stats["journalist_turns"].replace(0, pd.NA)
+    )
+
+    return turn_stats.dropna(subset=["ratio_president_journalist"])
+
+def get_turn_taking_tables(df, turns=False):
     """
-    Compute turn-taking structure metrics for each conference.
+    Compute both turn-taking tables in a single pass over the paragraphs:
+    over the whole conference (get_turn_taking_stats) and only after the
+    first journalist speaks (get_turn_taking_stats_interact).
+
+    By default every paragraph counts as a turn, so a long answer split
+    across many <p> tags counts many times. With turns=True, consecutive
+    paragraphs of the same speaker in a conference count once (see
+    collapse_turns).
+
     Args:
-        df (pd.DataFrame): Must contain 'date' and 'speaker' columns.   
+        df (pd.DataFrame): Must contain 'date' and 'speaker' columns,
+            or aggregate partials (see load_aggregate_partials).
+            With turns=True, also 'url' and 'text' (or a turn table).
+        turns (bool): Count conversation turns instead of paragraphs.
 
-    Returns a tidy DataFrame with:
-        - date
-        - total_turns
-        - president_turns
-        - journalist_turns
-        - ratio_president_journalist
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: (whole conference, after first journalist),
+        one row per date, with datetime64 dates
     """
-    df = df.copy()
-    # Apply cleaning
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
+    if is_aggregate_partials(df):
+        if turns:
+            raise ValueError("The aggregate store counts paragraphs; "
+                             "pass the paragraph table to count turns")
+        return _split_turn_counts(_turn_counts_from_partials(df))
+
+    # Apply cleaning (a turn table has one row per turn already)
+    df = _ensure_enriched(df)
+    if turns and not is_turn_table(df):
+        df = collapse_turns(df)
 
     # Ensure necessary columns exist
     assert "date" in df.columns and "speaker_clean" in df.columns, \
         "DataFrame must contain 'date' and 'speaker_clean' columns."
 
-    # Group by conference date
-    turn_stats = (
-        df.groupby("date")
-        .agg(
-            total_turns=("speaker_clean", "count"),
-            president_turns=("speaker_clean", lambda x: (x == "CLAUDIA SHEINBAUM PARDO").sum()),
-            journalist_turns=("speaker_clean", lambda x: (x == "PERIODISTA/PREGUNTA").sum())
-        )
-        .reset_index()
+    # Indicator columns, computed once
+    speaker = df["speaker_clean"]
+    counted = speaker.notna().to_numpy()
+    president = (speaker == "CLAUDIA SHEINBAUM PARDO").to_numpy()
+    journalist = (speaker == "PERIODISTA/PREGUNTA").to_numpy()
+
+    # Rows at or after the first journalist of each conference
+    # (running max of "journalist seen", in row order within each date)
+    after = (
+        pd.Series(journalist, index=df.index)
+        .groupby(df["date"], sort=False)
+        .cummax()
+        .fillna(False)
+        .to_numpy(dtype=bool)
     )
 
-    # Compute ratio (handle division by zero)
-    turn_stats["ratio_president_journalist"] = (
-        turn_stats["president_turns"] / turn_stats["journalist_turns"].replace(0, pd.NA)
+    indicators = pd.DataFrame({
+        "date": df["date"].to_numpy(),
+        "total_turns": counted,
+        "president_turns": president,
+        "journalist_turns": journalist,
+        "after_total_turns": counted & after,
+        "after_president_turns": president & after,
+        "after_journalist_turns": journalist & after,
+    })
+    return _split_turn_counts(indicators.groupby("date").sum())
+
+def _turn_counts_from_partials(partials):
+    """
+    Daily turn counts (as summed in get_turn_taking_tables) from conference partials.
+
+    The 'after' counts of a conference start at its own first journalist;
+    when a journalist already spoke in an earlier conference of the same day
+    (in conf_id order), all of its turns count instead.
+    """
+    sums = _TURN_SUMS + _AFTER_TURN_SUMS
+    conf = partials.groupby(["date", "conf_id"])[sums].sum()
+    earlier = conf.groupby(level="date")["journalist_turns"].cumsum() - conf["journalist_turns"]
+    conf[_AFTER_TURN_SUMS] = np.where(
+        (earlier > 0).to_numpy()[:, None], conf[_TURN_SUMS].to_numpy(), conf[_AFTER_TURN_SUMS].to_numpy()
     )
+    return conf.groupby(level="date").sum()
+
+def _split_turn_counts(counts):
+    """Whole-conference and after-first-journalist stats from daily turn counts."""
+    whole = counts[_TURN_SUMS]
+
+    # Conferences where no journalist spoke have no rows after the first one
+    interact = counts.loc[counts["after_total_turns"] > 0, _AFTER_TURN_SUMS]
+    interact.columns = _TURN_SUMS
+
+    return _finish_turn_stats(whole), _finish_turn_stats(interact)
+
+def get_turn_taking_stats(df, turns=False):
+    """
+    Compute turn-taking structure metrics for each conference.
+    Args:
+        df (pd.DataFrame): Must contain 'date' and 'speaker' columns.   
+        turns (bool): Count conversation turns instead of paragraphs
+            (see get_turn_taking_tables).
 
-    return  turn_stats.dropna(subset=['ratio_president_journalist'])
+    Returns a tidy DataFrame with:
+        - date (datetime64)
+        - total_turns
+        - president_turns
+        - journalist_turns
+        - ratio_president_journalist
+    """
+    return get_turn_taking_tables(df, turns)[0]
 
-def get_turn_taking_stats_interact(df):
+def get_turn_taking_stats_interact(df, turns=False):
     """
     Compute turn-taking structure metrics for each conference,
     considering ONLY the conversation after the first journalist speaks.
 
     Args:
         df (pd.DataFrame): Must contain 'date' and 'speaker' columns.   
+        turns (bool): Count conversation turns instead of paragraphs
+            (see get_turn_taking_tables).
 
     Returns:
         pd.DataFrame with:
-        - date
+        - date (datetime64)
         - total_turns (after first journalist)
         - president_turns
         - journalist_turns
         - ratio_president_journalist
     """
-    df = df.copy()
-    # Clean speaker names
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
-
-    # Ensure necessary columns exist
-    assert "date" in df.columns and "speaker_clean" in df.columns, \
-        "DataFrame must contain 'date' and 'speaker_clean' columns."
-
-    filtered = []
-
-    # Loop through each conference and trim before first journalist
-    for date, group in df.groupby("date"):
-        group = group.reset_index(drop=True)
-        # Find the first journalist index
-        first_journalist_idx = group.index[group["speaker_clean"] == "PERIODISTA/PREGUNTA"]
-
-        if len(first_journalist_idx) == 0:
-            # Skip if no journalist spoke
-            continue
-
-        # Keep only rows after the first journalist intervention
-        trimmed = group.loc[first_journalist_idx[0]:].copy()
-        trimmed["date"] = date
-        filtered.append(trimmed)
-
-    if not filtered:
-        return pd.DataFrame(columns=["date", "total_turns", "president_turns",
-                                     "journalist_turns", "ratio_president_journalist"])
-
-    df_filtered = pd.concat(filtered, ignore_index=True)
-
-    # Compute stats
-    turn_stats = (
-        df_filtered.groupby("date")
-        .agg(
-            total_turns=("speaker_clean", "count"),
-            president_turns=("speaker_clean", lambda x: (x == "CLAUDIA SHEINBAUM PARDO").sum()),
-            journalist_turns=("speaker_clean", lambda x: (x == "PERIODISTA/PREGUNTA").sum())
-        )
-        .reset_index()
-    )
-
-    # Compute ratio
-    turn_stats["ratio_president_journalist"] = (
-        turn_stats["president_turns"] / turn_stats["journalist_turns"].replace(0, pd.NA)
-    )
-
-    return turn_stats.dropna(subset=['ratio_president_journalist'])
+    return get_turn_taking_tables(df, turns)[1]
 
 def get_avg_length_by_weekday(df):
     """
@@ -521,19 +1528,15 @@ def get_avg_length_by_weekday(df):
     by day of the week.
 
     Args:
-        df (pd.DataFrame): Must contain 'date' and 'text' columns.
+        df (pd.DataFrame): Must contain 'date' and 'text' columns,
+            or aggregate partials (see load_aggregate_partials).
 
     Returns:
         pd.DataFrame with columns ['weekday', 'avg_words', 'n_conferences']
     """
 
-    df = df.copy()
-
-    # Ensure date is datetime
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-
-    # Compute word count per intervention
-    df["n_words"] = df["text"].fillna("").apply(lambda x: len(str(x).split()))
+    # Datetime dates and word count per intervention
+    df = _ensure_word_table(df)
 
     # Total words per conference (sum across all speakers)
     daily_length = (
@@ -566,6 +1569,23 @@ def get_avg_length_by_weekday(df):
 
     return weekday_stats
 
+# Punctuation removed by clean_text (including Spanish marks).
+# Compiled once instead of on every call.
+_EXTRA_PUNCT = "¿¡…“”«»—–−–"
+_ALL_PUNCT = string.punctuation + _EXTRA_PUNCT
+_PUNCT_RE = re.compile(r"[{}]".format(re.escape(_ALL_PUNCT)))
+_SPACES_RE = re.compile(r"\s+")
+_PUNCT_TABLE = str.maketrans({c: " " for c in _ALL_PUNCT})
+
+# Accent-stripping table (non-ASCII char -> unidecode output), grown lazily
+# with every new character seen by clean_text_series. Non-ASCII characters
+# are rare, so we find them with a regex and look them up in the table.
+_ASCII_TABLE = {}
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+def _to_ascii(match):
+    return _ASCII_TABLE[match.group()]
+
 def clean_text(text, remove_stopwords=True, extra_stopwords=None):
     """
     Clean Spanish text for NLP analysis.
@@ -599,46 +1619,218 @@ def clean_text(text, remove_stopwords=True, extra_stopwords=None):
     text = text.strip()
 
     # 4. Remove punctuation safely
-    # Define punctuation characters explicitly to avoid regex errors
-    extra_punct = "¿¡…“”«»—–−–"  # Spanish marks
-    all_punct = string.punctuation + extra_punct
-    text = re.sub(r"[{}]".format(re.escape(all_punct)), " ", text)
-    text = re.sub(r"\s+", " ", text)  # normalize spaces
+    text = _PUNCT_RE.sub(" ", text)
+    text = _SPACES_RE.sub(" ", text)  # normalize spaces
 
     # 5. Remove stopwords
     if remove_stopwords:
-        stop_words = SPANISH_STOPWORDS.copy()
+        stop_words = SPANISH_STOPWORDS
         if extra_stopwords:
-            stop_words.update(extra_stopwords)
+            stop_words = stop_words | set(extra_stopwords)
 
         tokens = [t for t in text.split() if t not in stop_words]
         text = " ".join(tokens)
 
     return text
 
-def get_topics_by_week(df, topics: dict):
+def clean_text_series(series, remove_stopwords=True, extra_stopwords=None):
+    """
+    Apply clean_text to a whole pandas Series at once.
+
+    Gives exactly the same output as `series.apply(clean_text)`, but:
+    - each distinct text is cleaned only once,
+    - accents are replaced through a per-character lookup table and
+      punctuation with a str.translate table, instead of running
+      unidecode and the punctuation regex on every row,
+    - the stopword set is built once for the whole batch.
+
+    Args:
+        series (pd.Series): Texts to clean (non-strings become "").
+        remove_stopwords (bool): Whether to remove stopwords.
+        extra_stopwords (list): Optional list of additional stopwords.
+
+    Returns:
+        pd.Series: Cleaned texts, with the same index as the input.
+    """
+    stop_words = SPANISH_STOPWORDS
+    if extra_stopwords:
+        stop_words = stop_words | set(extra_stopwords)
+
+    # Clean each distinct value once, then broadcast back to the rows
+    codes, uniques = pd.factorize(series)
+    lowered = [t.lower() if isinstance(t, str) else None for t in uniques]
+
+    # Extend the accent table with any new non-ASCII characters
+    chars = set()
+    for text in lowered:
+        if text is not None and not text.isascii():
+            chars.update(text)
+    for c in chars:
+        if ord(c) > 127 and c not in _ASCII_TABLE:
+            _ASCII_TABLE[c] = unidecode.unidecode(c)
+
+    cleaned = []
+    for text in lowered:
+        if text is None:
+            cleaned.append("")
+            continue
+        # Same steps as clean_text (lowercasing already done above)
+        if not text.isascii():
+            text = _NON_ASCII_RE.sub(_to_ascii, text)
+        text = text.strip().translate(_PUNCT_TABLE)
+        if remove_stopwords:
+            text = " ".join([t for t in text.split() if t not in stop_words])
+        else:
+            text = _SPACES_RE.sub(" ", text)
+        cleaned.append(text)
+
+    # Missing values get code -1, which picks the trailing "" below
+    cleaned.append("")
+    values = np.array(cleaned, dtype=object)[codes]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+def compile_topics(topics: dict, whole_words=False):
+    """
+    Compile a topics mapping into a single multi-pattern (Aho–Corasick) matcher.
+
+    All keywords of all topics go into one automaton, so each text is scanned
+    once no matter how many topics or keywords there are.
+
+    Args:
+        topics (dict): Mapping of topic names to lists of keywords.
+        whole_words (bool): If True, only count keywords that start and end
+            at word boundaries ("sep" does not match inside "septiembre").
+            If False, count substrings, like `text.count(keyword)`.
+            Empty keywords are ignored (`text.count("")` would count every
+            position).
+    Returns:
+        dict: Matcher to pass to count_topic_matrix.
+    """
+    goto = [{}]        # state -> {char: next state}
+    outputs = [[]]     # state -> keyword ids ending at this state
+    kw_topic, kw_len = [], []
+
+    # 1. Build the keyword trie
+    for topic_idx, words in enumerate(topics.values()):
+        for word in words:
+            if not word:
+                continue
+            state = 0
+            for ch in word:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(len(kw_topic))
+            kw_topic.append(topic_idx)
+            kw_len.append(len(word))
+
+    # 2. Failure links (breadth first), merging outputs of suffix states
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(ch, 0)
+            outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+
+    return {
+        "topics": list(topics),
+        "goto": goto,
+        "fail": fail,
+        "outputs": outputs,
+        "kw_topic": kw_topic,
+        "kw_len": kw_len,
+        "whole_words": whole_words,
+    }
+
+def count_topic_matrix(texts, matcher):
+    """
+    Count topic keyword mentions in each text with a compiled matcher.
+
+    Occurrences of the same keyword never overlap (as with str.count), and a
+    text matching several keywords of a topic adds up all of them.
+
+    Args:
+        texts (iterable of str): Texts, usually clean_text output.
+        matcher (dict): Output of compile_topics.
+    Returns:
+        np.ndarray: (n_texts, n_topics) int64 matrix of mention counts.
+    """
+    texts = list(texts)
+    goto, fail, outputs = matcher["goto"], matcher["fail"], matcher["outputs"]
+    kw_topic, kw_len = matcher["kw_topic"], matcher["kw_len"]
+    whole_words = matcher["whole_words"]
+    n_topics = len(matcher["topics"])
+
+    counts = np.zeros((len(texts), n_topics), dtype=np.int64)
+    for row, text in enumerate(texts):
+        if not isinstance(text, str):
+            continue
+        row_counts = [0] * n_topics
+        last_end = {}  # keyword id -> end of its last counted occurrence
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not outputs[state]:
+                continue
+            end = i + 1
+            for kw in outputs[state]:
+                start = end - kw_len[kw]
+                if start < last_end.get(kw, 0):
+                    continue
+                if whole_words and (
+                    (start > 0 and text[start - 1].isalnum())
+                    or (end < len(text) and text[end].isalnum())
+                ):
+                    continue
+                last_end[kw] = end
+                row_counts[kw_topic[kw]] += 1
+        counts[row] = row_counts
+    return counts
+
+def get_topics_by_week(df, topics: dict, whole_words=False):
     """
     Analyze topic mentions in speeches over time.
     Args:
-        df (pd.DataFrame): Must contain 'date' and 'text' columns.
+        df (pd.DataFrame): Must contain 'date' and 'text' columns,
+            or aggregate partials holding these topics (see update_aggregate_store).
         topics (dict): Mapping of topic names to lists of keywords.
+        whole_words (bool): Match keywords as whole words only (see compile_topics).
     Returns:
         pd.DataFrame: Tidy DataFrame with weekly topic shares and smoothed values.
     """
 
-    # Create a copy and clean text
-    pres_df = df
-    pres_df["clean_text"] = pres_df["text"].apply(clean_text)
-    
-    def count_topic_mentions(text, topic_words):
-        """Count occurrences of any topic words in the given text."""
-        return sum(text.count(w) for w in topic_words)
-    
-    # Count mentions per topic
-    topic_counts = []
-    for topic, words in topics.items():
-        pres_df[f"{topic}_count"] = pres_df["clean_text"].apply(lambda t: count_topic_mentions(t, words))
-   
+    if is_aggregate_partials(df):
+        # Daily counts and cleaned words, summed from the conference partials
+        count_cols = _stored_topic_columns(df, topics, whole_words)
+        daily_topics = (
+            df.groupby("date", as_index=False)[count_cols + ["clean_words"]].sum()
+            .rename(columns={"clean_words": "n_words"})
+        )
+        return _weekly_topic_shares(daily_topics, topics)
+
+    # Datetime dates (tables loaded by older code hold datetime.date objects)
+    dates = df["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
+
+    # Clean text (into a separate frame, so the input is left untouched)
+    pres_df = pd.DataFrame({"date": dates, "clean_text": clean_text_series(df["text"])})
+
+    # Count mentions per topic (one scan per paragraph for all topics)
+    counts = count_topic_matrix(pres_df["clean_text"], compile_topics(topics, whole_words))
+    pres_df[[f"{t}_count" for t in topics]] = counts
+
     # Aggregate daily counts
     daily_topics = pres_df.groupby("date", as_index=False)[[f"{t}_count" for t in topics]].sum()
 
@@ -646,11 +1838,15 @@ def get_topics_by_week(df, topics: dict):
     pres_df["n_words"] = pres_df["clean_text"].str.split().apply(len)
     daily_total = pres_df.groupby("date", as_index=False)["n_words"].sum()
     daily_topics = daily_topics.merge(daily_total, on="date", how="left")
-    # Compute share per topic
-    for topic in topics:
-        daily_topics[f"{topic}_share"] = daily_topics[f"{topic}_count"] / daily_topics["n_words"]
-    # Convert date to datetime and extract week/year
-    daily_topics["date"] = pd.to_datetime(daily_topics["date"], errors="coerce")
+    return _weekly_topic_shares(daily_topics, topics)
+
+def _weekly_topic_shares(daily_topics, topics):
+    """Weekly mean topic shares (long format, smoothed) from daily counts and words."""
+    # Compute share per topic (all columns at once, so many topics don't fragment the frame)
+    daily_topics = pd.concat([daily_topics, pd.DataFrame({
+        f"{topic}_share": daily_topics[f"{topic}_count"] / daily_topics["n_words"] for topic in topics
+    })], axis=1)
+    # Extract week/year
     daily_topics["year"] = daily_topics["date"].dt.isocalendar().year
     daily_topics["week"] = daily_topics["date"].dt.isocalendar().week
     # Aggregate to weekly level (mean share per week)
@@ -682,57 +1878,67 @@ def get_topics_by_week(df, topics: dict):
 
     return topic_long_weekly
 
-def get_topics_by_week_by_group(df, topics: dict):
+def get_topics_by_week_by_group(df, topics: dict, whole_words=False):
     """
     Analyze weekly topic mentions separately for each speaker group (President/Officials vs Journalists).
 
     Args:
-        df (pd.DataFrame): Must contain 'date', 'text', and 'speaker_group' columns.
+        df (pd.DataFrame): Must contain 'date', 'text', and 'speaker_group' columns,
+            or aggregate partials holding these topics (see update_aggregate_store).
         topics (dict): Mapping of topic names to lists of keywords.
+        whole_words (bool): Match keywords as whole words only (see compile_topics).
 
     Returns:
         pd.DataFrame: Tidy DataFrame with weekly topic shares and smoothed values by group.
     """
 
-    # Clean text
-    df = df.copy()
-    df["clean_text"] = df["text"].apply(clean_text)
-
-    def count_topic_mentions(text, topic_words):
-        """Count occurrences of any topic words in the given text."""
-        return sum(text.count(w) for w in topic_words)
+    if is_aggregate_partials(df):
+        # Daily totals by speaker group, summed from the conference partials
+        count_cols = _stored_topic_columns(df, topics, whole_words)
+        daily_topics = (
+            df.groupby(["date", "speaker_group"], as_index=False, observed=True)
+            .agg({col: "sum" for col in count_cols} | {"clean_words": "sum"})
+            .rename(columns={"clean_words": "n_words"})
+        )
+        return _weekly_topic_shares_by_group(daily_topics, topics)
 
-    # Count mentions per topic
-    for topic, words in topics.items():
-        df[f"{topic}_count"] = df["clean_text"].apply(lambda t: count_topic_mentions(t, words))
+    # Speaker grouping, then clean text into a separate (narrow) frame
+    df = _ensure_enriched(df)
+    topic_df = pd.DataFrame({
+        "date": df["date"],
+        "speaker_group": df["speaker_group"],
+        "clean_text": clean_text_series(df["text"])
+    })
 
-    # Word count per intervention
-    df["n_words"] = df["clean_text"].str.split().apply(len)
+    # Count mentions per topic (one scan per paragraph for all topics)
+    counts = count_topic_matrix(topic_df["clean_text"], compile_topics(topics, whole_words))
+    topic_df[[f"{t}_count" for t in topics]] = counts
 
-    # Define speaker grouping
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
-    df["speaker_group"] = df["speaker_clean"].apply(
-    lambda s: "Journalist" if s == "PERIODISTA/PREGUNTA" else "President/Official"
-    )
+    # Word count per intervention (after cleaning)
+    topic_df["n_words"] = topic_df["clean_text"].str.split().apply(len)
 
     # Aggregate daily totals by speaker group
     daily_topics = (
-        df.groupby(["date", "speaker_group"], as_index=False)
+        topic_df.groupby(["date", "speaker_group"], as_index=False, observed=True)
         .agg({f"{t}_count": "sum" for t in topics} | {"n_words": "sum"})
     )
+    return _weekly_topic_shares_by_group(daily_topics, topics)
 
-    # Compute topic shares
-    for topic in topics:
-        daily_topics[f"{topic}_share"] = daily_topics[f"{topic}_count"] / daily_topics["n_words"].replace(0, pd.NA)
+def _weekly_topic_shares_by_group(daily_topics, topics):
+    """Weekly mean topic shares per speaker group (long format, smoothed)."""
+    # Compute topic shares (all columns at once, so many topics don't fragment the frame)
+    words = daily_topics["n_words"].replace(0, pd.NA)
+    daily_topics = pd.concat([daily_topics, pd.DataFrame({
+        f"{topic}_share": daily_topics[f"{topic}_count"] / words for topic in topics
+    })], axis=1)
 
-    # Convert date to datetime
-    daily_topics["date"] = pd.to_datetime(daily_topics["date"], errors="coerce")
+    # Extract week/year
     daily_topics["year"] = daily_topics["date"].dt.isocalendar().year
     daily_topics["week"] = daily_topics["date"].dt.isocalendar().week
 
     # Weekly averages
     weekly_topics = (
-        daily_topics.groupby(["year", "week", "speaker_group"], as_index=False)
+        daily_topics.groupby(["year", "week", "speaker_group"], as_index=False, observed=True)
         .agg({col: "mean" for col in daily_topics.columns if col.endswith("_share")})
     )
 
@@ -754,12 +1960,306 @@ def get_topics_by_week_by_group(df, topics: dict):
 
     # Rolling smoothing (per topic and group)
     topic_long_weekly["share_smooth"] = (
-        topic_long_weekly.groupby(["topic", "speaker_group"])["share"]
+        topic_long_weekly.groupby(["topic", "speaker_group"], observed=True)["share"]
         .transform(lambda x: x.rolling(3, min_periods=1).mean())
     )
 
     return topic_long_weekly
 
+# Sparse document-term index of the cleaned paragraphs (see build_term_index).
+# Bump TERM_INDEX_VERSION when the stored arrays change.
+TERM_INDEX_VERSION = 1
+
+def build_term_index(df, index_path=None):
+    """
+    Clean every paragraph once and index its words, for ad-hoc topic queries.
+
+    The index holds:
+        - matrix: CSR (paragraphs x terms) word counts of clean_text output
+        - terms / vocab: the vocabulary (term -> column)
+        - tokens, token_indptr: the cleaned paragraphs as term ids (in CSR
+          layout), used to count multi-word keywords
+        - date, speaker_group: per paragraph, for the weekly tables
+    so topics are answered by index_topic_matrix and the *_from_index
+    functions without cleaning or scanning the texts again.
+
+    Args:
+        df (pd.DataFrame): Flattened (or enriched) paragraphs.
+        index_path (str, optional): Save the index to this .npz file
+            (read it back with load_term_index).
+    Returns:
+        dict: The term index.
+    """
+    import scipy.sparse as sp
+
+    df = _ensure_enriched(df)
+    words = clean_text_series(df["text"]).str.split()
+    token_indptr = np.zeros(len(words) + 1, dtype=np.int64)
+    np.cumsum(words.str.len().to_numpy(), out=token_indptr[1:])
+
+    codes, terms = pd.factorize(pd.Series(
+        [word for row in words for word in row], dtype=object
+    ))
+    tokens = codes.astype(np.int32)
+    # sum_duplicates sorts the indices in place, so the matrix gets its own copies
+    matrix = sp.csr_matrix(
+        (np.ones(len(tokens), dtype=np.int32), tokens.copy(), token_indptr.copy()),
+        shape=(len(words), len(terms))
+    )
+    matrix.sum_duplicates()
+
+    arrays = {
+        "version": np.array(TERM_INDEX_VERSION),
+        "data": matrix.data, "indices": matrix.indices, "indptr": matrix.indptr,
+        "terms": np.array(terms, dtype=str),
+        "tokens": tokens, "token_indptr": token_indptr,
+        "date": df["date"].to_numpy(dtype="datetime64[ns]"),
+        "speaker_group": df["speaker_group"].cat.codes.to_numpy(dtype=np.int8),
+    }
+    if index_path is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial index
+        tmp_path = f"{index_path}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, index_path)
+    return _term_index(arrays)
+
+def load_term_index(index_path):
+    """
+    Read a term index saved by build_term_index.
+
+    Args:
+        index_path (str): The .npz file.
+    Returns:
+        dict: The term index.
+    """
+    with np.load(index_path) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    if int(arrays["version"]) != TERM_INDEX_VERSION:
+        raise ValueError(f"{index_path} is an outdated term index; rebuild it with build_term_index")
+    return _term_index(arrays)
+
+def _term_index(arrays):
+    """Assemble the index dict from its stored arrays."""
+    import scipy.sparse as sp
+
+    terms = arrays["terms"]
+    return {
+        "matrix": sp.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=(len(arrays["indptr"]) - 1, len(terms))
+        ),
+        "terms": terms,
+        "vocab": {term: i for i, term in enumerate(terms.tolist())},
+        "tokens": arrays["tokens"],
+        "token_indptr": arrays["token_indptr"],
+        "date": arrays["date"],
+        "speaker_group": arrays["speaker_group"],
+    }
+
+def _phrase_rows(index, ids):
+    """Paragraph of every occurrence of the term-id sequence ids (within one paragraph)."""
+    tokens, indptr = index["tokens"], index["token_indptr"]
+    k = len(ids)
+    starts = np.flatnonzero(tokens[:max(len(tokens) - k + 1, 0)] == ids[0])
+    for offset, term in enumerate(ids[1:], start=1):
+        starts = starts[tokens[starts + offset] == term]
+    rows = np.searchsorted(indptr, starts, side="right") - 1
+    return rows[starts + k <= indptr[rows + 1]]
+
+def index_topic_matrix(index, topics: dict):
+    """
+    Count topic mentions in each paragraph of a term index.
+
+    Keywords are cleaned with clean_text (like compile_phrase_matcher), so
+    "Secretaría de Educación" looks for the words "secretaria educacion",
+    and they match whole words only. Single-word keywords are a column
+    selection of the term matrix (one sparse product for all topics);
+    multi-word keywords are counted on the token sequence.
+
+    Args:
+        index (dict): Output of build_term_index or load_term_index.
+        topics (dict): Mapping of topic names to lists of keywords.
+    Returns:
+        np.ndarray: (n_paragraphs, n_topics) int64 matrix of mention counts.
+    """
+    import scipy.sparse as sp
+
+    vocab = index["vocab"]
+    n_rows, n_terms = index["matrix"].shape
+    term_ids, term_topics = [], []
+    phrase_rows, phrase_topics = [], []
+    for j, words in enumerate(topics.values()):
+        for word in words:
+            ids = [vocab.get(w) for w in clean_text(word).split()]
+            if not ids or None in ids:
+                continue
+            if len(ids) == 1:
+                term_ids.append(ids[0])
+                term_topics.append(j)
+            else:
+                rows = _phrase_rows(index, ids)
+                phrase_rows.append(rows)
+                phrase_topics.append(np.full(len(rows), j))
+
+    # Terms x topics weights (a keyword listed twice counts twice, as in compile_topics)
+    weights = sp.csr_matrix(
+        (np.ones(len(term_ids), dtype=np.int64), (term_ids, term_topics)),
+        shape=(n_terms, len(topics))
+    )
+    counts = (index["matrix"] @ weights).toarray().astype(np.int64)
+    if phrase_rows:
+        np.add.at(counts, (np.concatenate(phrase_rows), np.concatenate(phrase_topics)), 1)
+    return counts
+
+def _index_daily_topics(index, topics, by_group):
+    """Daily (and per group) topic counts and cleaned words, as sparse products."""
+    import scipy.sparse as sp
+
+    counts = index_topic_matrix(index, topics)
+    n_words = np.diff(index["token_indptr"])
+    date = index["date"]
+    keep = ~np.isnat(date)
+
+    # Each paragraph goes to its (date, group) cell: cells x paragraphs indicator
+    key = date.astype(np.int64) * len(SPEAKER_GROUPS)
+    if by_group:
+        key = key + index["speaker_group"]
+    cells, cell = np.unique(key[keep], return_inverse=True)
+    cell_of = sp.csr_matrix(
+        (np.ones(len(cell), dtype=np.int64), (cell, np.flatnonzero(keep))),
+        shape=(len(cells), len(date))
+    )
+
+    daily_topics = pd.DataFrame({"date": (cells // len(SPEAKER_GROUPS)).astype("datetime64[ns]")})
+    if by_group:
+        daily_topics["speaker_group"] = pd.Categorical.from_codes(
+            cells % len(SPEAKER_GROUPS), categories=SPEAKER_GROUPS
+        )
+    daily_topics[[f"{t}_count" for t in topics]] = cell_of @ counts
+    daily_topics["n_words"] = cell_of @ n_words
+    return daily_topics
+
+def get_topics_by_week_from_index(index, topics: dict):
+    """
+    get_topics_by_week answered from a term index (see index_topic_matrix
+    for how keywords match).
+
+    Args:
+        index (dict): Output of build_term_index or load_term_index.
+        topics (dict): Mapping of topic names to lists of keywords.
+    Returns:
+        pd.DataFrame: Tidy DataFrame with weekly topic shares and smoothed values.
+    """
+    return _weekly_topic_shares(_index_daily_topics(index, topics, by_group=False), topics)
+
+def get_topics_by_week_by_group_from_index(index, topics: dict):
+    """
+    get_topics_by_week_by_group answered from a term index (see
+    index_topic_matrix for how keywords match).
+
+    Args:
+        index (dict): Output of build_term_index or load_term_index.
+        topics (dict): Mapping of topic names to lists of keywords.
+    Returns:
+        pd.DataFrame: Tidy DataFrame with weekly topic shares and smoothed values by group.
+    """
+    return _weekly_topic_shares_by_group(_index_daily_topics(index, topics, by_group=True), topics)
+
+def compile_phrase_matcher(phrases, remove_stopwords=True):
+    """
+    Build a word-level trie for counting phrases in cleaned text.
+
+    Phrases are cleaned with clean_text and split into words, so matches
+    always start and end on word boundaries. The texts to scan must be
+    cleaned with the same remove_stopwords setting.
+
+    Args:
+        phrases (list of str): Phrases to look for (e.g., MEXICO_STATES).
+        remove_stopwords (bool): Whether stopwords are removed from the phrases.
+    Returns:
+        dict: Nested {word: {...}} trie; the key None marks the end of a
+        phrase and holds its index in `phrases`.
+    """
+    trie = {}
+    for idx, phrase in enumerate(phrases):
+        words = clean_text(phrase, remove_stopwords=remove_stopwords).split()
+        if not words:
+            continue
+        node = trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node.setdefault(None, idx)
+    return trie
+
+def count_phrase_matrix(texts, trie, n_phrases):
+    """
+    Count phrase matches in each cleaned text, in a single pass per text.
+
+    At every position the longest matching phrase wins and the scan resumes
+    after it, so "baja california sur" is not also counted as
+    "baja california".
+
+    Args:
+        texts (iterable of str): Cleaned texts (see clean_text_series).
+        trie (dict): Output of compile_phrase_matcher.
+        n_phrases (int): Number of phrases the trie was built from.
+    Returns:
+        np.ndarray: (n_texts, n_phrases) int64 matrix of match counts.
+    """
+    texts = list(texts)
+    counts = np.zeros((len(texts), n_phrases), dtype=np.int64)
+    for row, text in enumerate(texts):
+        if not isinstance(text, str):
+            continue
+        words = text.split()
+        i = 0
+        while i < len(words):
+            node = trie.get(words[i])
+            best, best_end = None, i + 1
+            j = i + 1
+            while node is not None:
+                if None in node:
+                    best, best_end = node[None], j
+                if j == len(words):
+                    break
+                node = node.get(words[j])
+                j += 1
+            if best is None:
+                i += 1
+            else:
+                counts[row, best] += 1
+                i = best_end
+    return counts
+
+@lru_cache(maxsize=1)
+def _state_matcher():
+    """
+    Phrase trie for MEXICO_STATES (built on first use).
+
+    Stopwords are kept: without them "Estado de Mexico" would be just
+    "mexico" and match every "Gobierno de México".
+    """
+    return compile_phrase_matcher(MEXICO_STATES, remove_stopwords=False)
+
+def state_mention_matrix(df, text_col="text"):
+    """
+    Count Mexican state mentions in each row of a text column.
+
+    Each paragraph is cleaned and scanned on its own (the corpus is never
+    joined into one string), so the per-row counts can be summed by any
+    grouping.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing a text column.
+        text_col (str): Name of the column containing text data.
+    Returns:
+        pd.DataFrame: One row per input row (same index), one column per state.
+    """
+    clean = clean_text_series(df[text_col], remove_stopwords=False)
+    counts = count_phrase_matrix(clean, _state_matcher(), len(MEXICO_STATES))
+    return pd.DataFrame(counts, index=df.index, columns=MEXICO_STATES)
+
 def count_state_mentions(df, text_col="text"):
     """
     Count the number of times each Mexican state is mentioned in the given text column.
@@ -771,18 +2271,10 @@ def count_state_mentions(df, text_col="text"):
     Returns:
         pd.DataFrame: Tidy dataframe with columns ['state', 'mentions'].
     """
-    # Combine all text into one large normalized string
-    full_text = " ".join(df[text_col].dropna().astype(str))
-    full_text = clean_text(full_text)
+    # Per-paragraph state counts, summed over the whole corpus
+    totals = state_mention_matrix(df, text_col).sum()
 
-    results = []
-    for state in MEXICO_STATES:
-        # Normalize state name
-        state_norm = clean_text(state)
-        # Count occurrences (with word boundaries)
-        pattern = r"\b" + re.escape(state_norm) + r"\b"
-        count = len(re.findall(pattern, full_text))
-        results.append({"state": state, "mentions": count})
+    results = [{"state": state, "mentions": int(totals[state])} for state in MEXICO_STATES]
 
     # Convert to DataFrame and sort
     df_states = pd.DataFrame(results).sort_values("mentions", ascending=False).reset_index(drop=True)
@@ -806,25 +2298,18 @@ def count_state_mentions_by_group(df, text_col="text"):
     assert text_col in df.columns, f"Missing text column: {text_col}"
 
     # Define speaker grouping
-    df["speaker_clean"] = df["speaker"].apply(clean_speaker)
-    df["speaker_group"] = df["speaker_clean"].apply(
-    lambda s: "Journalist" if s == "PERIODISTA/PREGUNTA" else "President/Official"
-    )
+    df = _ensure_enriched(df)
 
-    # Loop through each group (President/Official vs Journalist)
-    for group, subset in df.groupby("speaker_group"):
-        # Combine and clean all text for that group
-        full_text = " ".join(subset[text_col].dropna().astype(str))
-        full_text = clean_text(full_text)
+    # Per-paragraph state counts, summed by group (President/Official vs Journalist)
+    mentions = state_mention_matrix(df, text_col)
+    group_totals = mentions.groupby(df["speaker_group"], observed=True).sum()
 
+    for group, totals in group_totals.iterrows():
         for state in MEXICO_STATES:
-            state_norm = clean_text(state)
-            pattern = r"\b" + re.escape(state_norm) + r"\b"
-            count = len(re.findall(pattern, full_text))
             results.append({
                 "state": state,
                 "speaker_group": group,
-                "mentions": count
+                "mentions": int(totals[state])
             })
 
     df_states = (
@@ -857,11 +2342,421 @@ def _predict_sentiment(text: str) -> tuple[str, float, dict]:
     """
     if not isinstance(text, str) or not text.strip():
         return "NEU", 0.0, {"POS": 0.0, "NEU": 1.0, "NEG": 0.0}
-    pred = _analyzer_es.predict(text)
+    pred = get_analyzer().predict(text)
     label = pred.output  # 'POS' | 'NEU' | 'NEG'
     score = _LABEL_TO_SCORE[label]
     return label, score, pred.probas  # dict like {'NEG': p1, 'NEU': p2, 'POS': p3}
 
+# Default number of interventions per forward pass
+SENTIMENT_BATCH_SIZE = 32
+
+# Column order of the probability arrays returned by _predict_sentiment_batch
+_SENTIMENT_CLASSES = ("POS", "NEU", "NEG")
+
+def _sentiment_windows(tokenizer, texts, split_long=True):
+    """
+    Tokenize preprocessed texts into model inputs.
+
+    With split_long, a text longer than the model limit is cut into
+    consecutive, non-overlapping windows of at most
+    model_max_length - (special tokens) tokens, so no token is dropped.
+    Otherwise each text is truncated to the limit, as analyzer.predict does
+    (a text that fits gives the same input either way).
+
+    Returns:
+        tuple: (input_ids per window, index of the text each window belongs
+        to, content tokens per window, content tokens per text)
+    """
+    size = tokenizer.model_max_length - tokenizer.num_special_tokens_to_add()
+    tokens = tokenizer(texts, add_special_tokens=False, verbose=False)["input_ids"]
+
+    input_ids, owners, weights = [], [], []
+    for k, ids in enumerate(tokens):
+        starts = range(0, max(len(ids), 1), size) if split_long else [0]
+        for start in starts:
+            window = ids[start:start + size]
+            input_ids.append(tokenizer.build_inputs_with_special_tokens(window))
+            owners.append(k)
+            weights.append(len(window))
+    return input_ids, owners, weights, [len(ids) for ids in tokens]
+
+def sentiment_token_stats(texts):
+    """
+    Report how many tokens the sentiment model would not see.
+
+    Compares plain truncation at the model limit (what analyzer.predict
+    does) with the window splitting used by _predict_sentiment_batch.
+
+    Args:
+        texts (iterable of str): Interventions.
+    Returns:
+        dict: texts, long_texts (over the limit), tokens, windows,
+        dropped_truncation and dropped_windows (tokens never scored).
+    """
+    from pysentimiento.preprocessing import preprocess_tweet
+
+    analyzer = get_analyzer()
+    texts = [t for t in texts if isinstance(t, str) and t.strip()]
+    preprocessed = [preprocess_tweet(t, **analyzer.preprocessing_args) for t in texts]
+    _, owners, weights, lengths = _sentiment_windows(analyzer.tokenizer, preprocessed)
+
+    size = analyzer.tokenizer.model_max_length - analyzer.tokenizer.num_special_tokens_to_add()
+    return {
+        "texts": len(texts),
+        "long_texts": sum(n > size for n in lengths),
+        "tokens": sum(lengths),
+        "windows": len(owners),
+        "dropped_truncation": sum(max(n - size, 0) for n in lengths),
+        "dropped_windows": sum(lengths) - sum(weights),
+    }
+
+def _predict_sentiment_batch(
+    texts,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    split_long: bool = True
+) -> tuple[list[str], np.ndarray]:
+    """
+    Batched version of _predict_sentiment.
+
+    Texts are preprocessed and tokenized as analyzer.predict(text) does,
+    then sorted by token length so each batch pads to a similar length, and
+    run through the model batch_size at a time.
+
+    Interventions longer than the model limit (128 tokens) are split into
+    windows (see _sentiment_windows) scored in the same batches, and their
+    probabilities are combined weighted by window length:
+
+        p(text) = sum_w n_w * p(w) / sum_w n_w
+
+    where n_w is the number of tokens in window w. The label is the most
+    likely class of p(text). With split_long=False long texts are truncated
+    instead, as in _predict_sentiment.
+
+    Results come back in input order whatever the batch size. For texts
+    within the limit (or with split_long=False), probabilities equal those of
+    analyzer.predict(text) up to float32 rounding, i.e. within 1e-6 absolute,
+    since padded batches sum in a different order; labels are the same
+    unless the two most likely classes are within that rounding.
+
+    Args:
+        texts (iterable of str): Interventions. Empty or missing texts are NEU.
+        batch_size (int): Windows per forward pass.
+        num_threads (int, optional): If given, torch intra-op threads to use
+            (torch.set_num_threads, which applies to the whole process).
+        split_long (bool): Split long texts into windows instead of truncating.
+    Returns:
+        tuple[list[str], np.ndarray]: labels ('POS'|'NEU'|'NEG') and an
+        (n, 3) float64 array of probabilities, columns POS, NEU, NEG.
+    """
+    texts = list(texts)
+    labels = ["NEU"] * len(texts)
+    probs = np.zeros((len(texts), len(_SENTIMENT_CLASSES)))
+    probs[:, _SENTIMENT_CLASSES.index("NEU")] = 1.0
+
+    todo = [i for i, t in enumerate(texts) if isinstance(t, str) and t.strip()]
+    if not todo:
+        return labels, probs
+
+    analyzer = get_analyzer()
+    import torch
+    from pysentimiento.preprocessing import preprocess_tweet
+
+    if num_threads:
+        torch.set_num_threads(num_threads)
+
+    tokenizer = analyzer.tokenizer
+    input_ids, owners, weights, _ = _sentiment_windows(
+        tokenizer,
+        [preprocess_tweet(texts[i], **analyzer.preprocessing_args) for i in todo],
+        split_long=split_long,
+    )
+
+    # Model outputs are in id2label order; map them to _SENTIMENT_CLASSES at the end
+    model_labels = [analyzer.id2label[i] for i in range(len(analyzer.id2label))]
+    columns = [model_labels.index(c) for c in _SENTIMENT_CLASSES]
+
+    # Length-weighted sum of window probabilities, per text
+    weighted = np.zeros((len(todo), len(model_labels)))
+    total_weight = np.zeros(len(todo))
+
+    device = analyzer.eval_trainer.args.device
+    order = sorted(range(len(input_ids)), key=lambda w: len(input_ids[w]))
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            inputs = tokenizer.pad({"input_ids": [input_ids[w] for w in batch]},
+                                   return_tensors="pt").to(device)
+            batch_probs = torch.softmax(analyzer.model(**inputs).logits, dim=1).cpu().numpy()
+            for w, row in zip(batch, batch_probs):
+                # A text that tokenizes to nothing still gets its one (empty) window
+                weight = max(weights[w], 1)
+                weighted[owners[w]] += weight * row.astype(np.float64)
+                total_weight[owners[w]] += weight
+
+    combined = weighted / total_weight[:, None]
+    for k, i in enumerate(todo):
+        # argmax keeps the first label on ties, like AnalyzerOutput.output
+        labels[i] = model_labels[int(combined[k].argmax())]
+        probs[i] = combined[k, columns]
+
+    return labels, probs
+
+# Interventions per task sent to a sentiment worker process
+SENTIMENT_CHUNK_SIZE = 512
+
+def _sentiment_worker_init(num_threads, backend, onnx_path):
+    """Process-pool initializer: load the model once per worker process."""
+    global _sentiment_backend, _sentiment_onnx_path
+    # Copy the parent's configuration as is (not through set_sentiment_backend,
+    # which raises): an initializer that raises breaks the whole pool and
+    # hides the error, while get_analyzer() keeps it for the first task
+    _sentiment_backend, _sentiment_onnx_path = backend, onnx_path
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+    try:
+        get_analyzer()
+    except RuntimeError:
+        # Re-raised (with its cause) by the first task, in the parent process
+        pass
+
+def _sentiment_worker_score(texts, batch_size):
+    """Score one chunk in a worker; returns compact arrays instead of Python objects."""
+    labels, probs = _predict_sentiment_batch(texts, batch_size=batch_size)
+    codes = np.array([_SENTIMENT_CLASSES.index(lab) for lab in labels], dtype=np.int8)
+    return codes, probs
+
+def _iter_sentiment_chunks(
+    texts,
+    chunk_size: int = SENTIMENT_CHUNK_SIZE,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    workers: int = 1
+):
+    """
+    Score texts in contiguous chunks, yielding (start, labels, probs) in order.
+
+    With workers > 1, chunks are scored by a pool of worker processes that
+    each load the model once. At most 2 * workers chunks are in flight, so
+    memory stays flat however long the input is, and results are yielded in
+    input order. Each worker uses num_threads torch threads (default: the
+    CPU count divided by workers).
+    """
+    texts = list(texts)
+    if workers <= 1:
+        for start in range(0, len(texts), chunk_size):
+            labels, probs = _predict_sentiment_batch(
+                texts[start:start + chunk_size], batch_size=batch_size, num_threads=num_threads
+            )
+            yield start, labels, probs
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A bad configuration fails here, not as a broken pool
+    _check_sentiment_backend()
+    threads = num_threads or max(1, (os.cpu_count() or 1) // workers)
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_sentiment_worker_init,
+        initargs=(threads, *get_sentiment_backend()),
+    )
+    with pool:
+        pending = deque()
+        for start in range(0, len(texts), chunk_size):
+            if len(pending) >= 2 * workers:
+                yield _collect_sentiment_chunk(*pending.popleft())
+            future = pool.submit(_sentiment_worker_score, texts[start:start + chunk_size], batch_size)
+            pending.append((start, future))
+        while pending:
+            yield _collect_sentiment_chunk(*pending.popleft())
+
+def _collect_sentiment_chunk(start, future):
+    """Wait for a worker chunk and decode its label codes."""
+    codes, probs = future.result()
+    return start, [_SENTIMENT_CLASSES[c] for c in codes], probs
+
+def _score_sentiment(
+    texts,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    workers: int = 1
+) -> tuple[list[str], np.ndarray]:
+    """_predict_sentiment_batch, optionally spread over worker processes."""
+    texts = list(texts)
+    if workers <= 1:
+        return _predict_sentiment_batch(texts, batch_size=batch_size, num_threads=num_threads)
+
+    labels = []
+    probs = np.zeros((len(texts), len(_SENTIMENT_CLASSES)))
+    for start, chunk_labels, chunk_probs in _iter_sentiment_chunks(
+        texts, batch_size=batch_size, num_threads=num_threads, workers=workers
+    ):
+        labels.extend(chunk_labels)
+        probs[start:start + len(chunk_labels)] = chunk_probs
+    return labels, probs
+
+# Persistent sentiment results, one row per distinct (model, normalized text).
+# Bump SENTIMENT_MODEL_ID when the model changes, and _SENTIMENT_SCORING when
+# the way texts are scored changes, so old results are not reused.
+SENTIMENT_MODEL_ID = "pysentimiento/robertuito-sentiment-analysis"
+_SENTIMENT_SCORING = "windows-length-weighted"
+_SQLITE_MAX_VARIABLES = 900
+
+@lru_cache(maxsize=8)
+def _onnx_model_digest(path, size, mtime):
+    """Content hash of an ONNX model file (cached per file version)."""
+    return _file_digest(path)
+
+def _sentiment_model_id():
+    """Model id used in cache keys: the model name plus the backend."""
+    if _sentiment_backend == "torch":
+        return SENTIMENT_MODEL_ID
+    if _sentiment_backend == "onnx":
+        stat = os.stat(_sentiment_onnx_path)
+        digest = _onnx_model_digest(_sentiment_onnx_path, stat.st_size, stat.st_mtime)
+        return f"{SENTIMENT_MODEL_ID}+onnx:{digest}"
+    return f"{SENTIMENT_MODEL_ID}+{_sentiment_backend}"
+
+def normalize_sentiment_text(text):
+    """Unicode-normalize and collapse whitespace, so trivially different copies share a cache entry."""
+    if not isinstance(text, str):
+        return ""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def _sentiment_key(text, model_id=SENTIMENT_MODEL_ID):
+    """Cache key of an already normalized text."""
+    return hashlib.sha256(f"{model_id}\0{_SENTIMENT_SCORING}\0{text}".encode("utf-8")).hexdigest()
+
+def _open_sentiment_cache(cache_path):
+    """Open (creating if needed) the SQLite sentiment cache."""
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    os.makedirs(directory, exist_ok=True)
+    con = sqlite3.connect(cache_path)
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS sentiment ("
+        "key TEXT PRIMARY KEY, label TEXT NOT NULL, "
+        "p_pos REAL NOT NULL, p_neu REAL NOT NULL, p_neg REAL NOT NULL)"
+    )
+    return con
+
+def _cached_sentiment(
+    texts,
+    cache_path: str,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    workers: int = 1,
+    commit_every: int = SENTIMENT_CHUNK_SIZE
+) -> tuple[list[str], np.ndarray]:
+    """
+    _score_sentiment backed by the on-disk cache.
+
+    Each distinct normalized text is looked up by its key; only texts not in
+    the cache are run through the model, and their results are stored (in
+    commits of commit_every texts, so an interrupted run keeps its progress).
+    The model is not loaded at all when every text is already cached.
+
+    The normalized text only builds the key: the model scores the raw text
+    (the first one of each key), as _score_sentiment does, so a run with
+    the cache gives the same results as one without.
+
+    Returns:
+        tuple[list[str], np.ndarray]: as _predict_sentiment_batch.
+    """
+    texts = list(texts)
+    normalized = [normalize_sentiment_text(t) for t in texts]
+    codes, uniques = pd.factorize(pd.Series(normalized, dtype=object))
+    # Position of the first raw text of each key
+    _, first = np.unique(codes, return_index=True)
+    model_id = _sentiment_model_id()
+    keys = [_sentiment_key(t, model_id) for t in uniques]
+
+    labels = [None] * len(uniques)
+    probs = np.zeros((len(uniques), len(_SENTIMENT_CLASSES)))
+    con = _open_sentiment_cache(cache_path)
+    try:
+        # 1) Look up what we already have
+        position = {key: i for i, key in enumerate(keys)}
+        for start in range(0, len(keys), _SQLITE_MAX_VARIABLES):
+            chunk = keys[start:start + _SQLITE_MAX_VARIABLES]
+            rows = con.execute(
+                "SELECT key, label, p_pos, p_neu, p_neg FROM sentiment "
+                f"WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for key, label, *row in rows:
+                i = position[key]
+                labels[i] = label
+                probs[i] = row
+
+        # 2) Score and store the rest
+        missing = [i for i, label in enumerate(labels) if label is None]
+        for start, new_labels, new_probs in _iter_sentiment_chunks(
+            [texts[first[i]] for i in missing], chunk_size=commit_every,
+            batch_size=batch_size, num_threads=num_threads, workers=workers
+        ):
+            chunk = missing[start:start + len(new_labels)]
+            for i, label, row in zip(chunk, new_labels, new_probs):
+                labels[i] = label
+                probs[i] = row
+            with con:
+                con.executemany(
+                    "INSERT OR REPLACE INTO sentiment VALUES (?, ?, ?, ?, ?)",
+                    [(keys[i], labels[i], *map(float, probs[i])) for i in chunk]
+                )
+    finally:
+        con.close()
+
+    return [labels[c] for c in codes], probs[codes]
+
+def compute_sentiment_corpus(
+    df: pd.DataFrame,
+    cache_path: str,
+    *,
+    text_col: str = "text",
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    workers: int = 1
+) -> pd.DataFrame:
+    """
+    Compute sentiment for every paragraph of the corpus, through the on-disk cache.
+
+    Results are keyed by a hash of the model id and the normalized text, so
+    re-runs only score paragraphs that are new or whose text changed (e.g.
+    a nightly run only scores the newly scraped conference). The same cache
+    is read by compute_sentiment_for_date(..., cache_path=...).
+
+    With workers > 1, uncached paragraphs are scored by that many worker
+    processes, each loading the model once (num_threads torch threads each).
+
+    Returns a DataFrame indexed like df with:
+      - date
+      - intervention_order (1..n within each date, in df order)
+      - speaker_group
+      - text
+      - sentiment_label (Positive / Neutral / Negative)
+      - sentiment_score (1 / 0 / -1)
+      - p_pos, p_neu, p_neg (model probabilities)
+    """
+    df = _ensure_enriched(df)
+
+    labels, probs = _cached_sentiment(
+        df[text_col].tolist(), cache_path, batch_size=batch_size,
+        num_threads=num_threads, workers=workers
+    )
+
+    result = df[["date", "speaker_group", text_col]].copy()
+    result.insert(1, "intervention_order", result.groupby("date").cumcount() + 1)
+    result["sentiment_label"] = [_SPANISH_LABEL[lab] for lab in labels]
+    result["sentiment_score"] = [_LABEL_TO_SCORE[lab] for lab in labels]
+    result["p_pos"] = probs[:, 0]
+    result["p_neu"] = probs[:, 1]
+    result["p_neg"] = probs[:, 2]
+    return result
+
 def compute_sentiment_for_date(
     df: pd.DataFrame,
     target_date: str,
@@ -870,7 +2765,11 @@ def compute_sentiment_for_date(
     date_col: str = "date",
     speaker_col: str = "speaker_group",
     keep_columns: Optional[list[str]] = None,
-    after_first_journalist: bool = True
+    after_first_journalist: bool = True,
+    batch_size: int = SENTIMENT_BATCH_SIZE,
+    num_threads: Optional[int] = None,
+    cache_path: Optional[str] = None,
+    workers: int = 1
 ) -> pd.DataFrame:
     """
     Filter a single conference (date == target_date), compute sentiment per intervention.
@@ -885,16 +2784,25 @@ def compute_sentiment_for_date(
       - sentiment_label (Positive / Neutral / Negative)
       - sentiment_score (1 / 0 / -1)
       - p_pos, p_neu, p_neg (model probabilities)
-    """
-    if _analyzer_es is None:
-        raise RuntimeError("Spanish sentiment analyzer not available. "
-                           "Install/verify pysentimiento, transformers, and torch.")
 
-    # 1) Filter that single conference
-    d = df.copy()
-    d[date_col] = pd.to_datetime(d[date_col], errors="coerce")
+    Interventions are scored batch_size at a time (see _predict_sentiment_batch);
+    num_threads sets the torch intra-op thread count. With cache_path, results
+    are read from (and new ones added to) the compute_sentiment_corpus cache.
+    With workers > 1, interventions are scored by worker processes.
+    """
+    # Fail fast (before filtering) if the analyzer cannot be loaded.
+    # With a cache the model may not be needed at all, and with workers it
+    # is loaded in the worker processes instead.
+    if cache_path is None and workers <= 1:
+        get_analyzer()
+
+    # 1) Filter that single conference (only its rows are copied)
+    dates = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors="coerce")
     target_dt = pd.to_datetime(target_date)
-    conf = d.loc[d[date_col] == target_dt].copy()
+    conf = df.loc[dates == target_dt].copy()
+    conf[date_col] = target_dt
 
     if conf.empty:
         return pd.DataFrame(columns=[
@@ -906,13 +2814,14 @@ def compute_sentiment_for_date(
     conf = conf.reset_index(drop=True)
     conf["intervention_order"] = conf.index + 1
 
-    # 3) Speaker grouping
-    if "speaker_clean" not in conf.columns:
-        conf["speaker_clean"] = conf["speaker"].apply(clean_speaker)
+    # 3) Speaker grouping (already there if df went through enrich())
+    if not is_enriched(conf):
+        if "speaker_clean" not in conf.columns:
+            conf["speaker_clean"] = clean_speakers(conf["speaker"])
 
-    conf["speaker_group"] = conf["speaker_clean"].apply(
-        lambda s: "Journalist" if s == "PERIODISTA/PREGUNTA" else "President/Official"
-    )
+        conf["speaker_group"] = np.where(
+            conf["speaker_clean"] == "PERIODISTA/PREGUNTA", "Journalist", "President/Official"
+        )
 
     # 4) Keep only after first journalist if requested
     if after_first_journalist:
@@ -923,20 +2832,19 @@ def compute_sentiment_for_date(
             conf["intervention_order"] = conf.index + 1
 
     # 5) Run sentiment analysis
-    labels, scores, p_pos, p_neu, p_neg = [], [], [], [], []
-    for txt in conf[text_col].fillna("").astype(str):
-        lab, sc, prob = _predict_sentiment(txt)
-        labels.append(_SPANISH_LABEL[lab])
-        scores.append(sc)
-        p_pos.append(prob.get("POS", 0.0))
-        p_neu.append(prob.get("NEU", 0.0))
-        p_neg.append(prob.get("NEG", 0.0))
-
-    conf["sentiment_label"] = labels
-    conf["sentiment_score"] = scores
-    conf["p_pos"] = p_pos
-    conf["p_neu"] = p_neu
-    conf["p_neg"] = p_neg
+    texts = conf[text_col].fillna("").astype(str)
+    if cache_path is None:
+        labels, probs = _score_sentiment(texts, batch_size=batch_size,
+                                         num_threads=num_threads, workers=workers)
+    else:
+        labels, probs = _cached_sentiment(texts, cache_path, batch_size=batch_size,
+                                          num_threads=num_threads, workers=workers)
+
+    conf["sentiment_label"] = [_SPANISH_LABEL[lab] for lab in labels]
+    conf["sentiment_score"] = [_LABEL_TO_SCORE[lab] for lab in labels]
+    conf["p_pos"] = probs[:, 0]
+    conf["p_neu"] = probs[:, 1]
+    conf["p_neg"] = probs[:, 2]
 
     # 6) Select columns
     base_cols = [
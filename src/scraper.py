@@ -0,0 +1,987 @@
+import asyncio
+import gzip
+import hashlib
+import html
+import importlib.util
+import json
+import os
+import random
+import re
+import sqlite3
+import time
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from tqdm import tqdm
+
+from typing import Callable, Optional
+
+# Base parameters for Web Scrapping
+BASE_URL = "https://www.gob.mx"
+ARCHIVE_PATH = "/presidencia/es/archivo/articulos?filter_origin=archive&idiom=es&order=DESC&page="
+ARCHIVE_URL = f"{BASE_URL}{ARCHIVE_PATH}"
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; MañanerasScraper/1.0)"}
+
+# Article cards are appended to the archive page by inline JavaScript
+_FRAGMENT_RE = re.compile(r"\$\('#prensa'\)\.append\('(.+?)'\);", flags=re.DOTALL)
+# JavaScript escapes in the fragments: \n is dropped, any other backslash removed
+_JS_ESCAPE_RE = re.compile(r"\\n?")
+
+# HTML parser for the scraped pages:
+#   - "lxml": libxml2; only the article body of transcript pages is parsed,
+#     streamed into the speaker/text entries without building a tree
+#   - "html.parser": BeautifulSoup with Python's html.parser (reference)
+# Both give the same entries on well-formed pages. Configured with the
+# SCRAPER_HTML_PARSER environment variable or set_html_parser(); lxml is
+# used when it is installed.
+HTML_PARSERS = ("lxml", "html.parser")
+_html_parser = os.environ.get("SCRAPER_HTML_PARSER") or (
+    "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+)
+
+def set_html_parser(parser):
+    """
+    Choose the HTML parser of parse_articles_page / parse_transcript (see HTML_PARSERS).
+
+    Args:
+        parser (str): 'lxml' or 'html.parser'.
+    """
+    global _html_parser
+    if parser not in HTML_PARSERS:
+        raise ValueError(f"Unknown HTML parser {parser!r}, expected one of {HTML_PARSERS}")
+    _html_parser = parser
+
+def get_html_parser():
+    """Return the configured HTML parser."""
+    return _html_parser
+
+def _check_html_parser():
+    if _html_parser not in HTML_PARSERS:
+        raise ValueError(f"Unknown HTML parser {_html_parser!r}, expected one of {HTML_PARSERS}")
+    return _html_parser
+
+def parse_articles_page(text, base_url=BASE_URL):
+    """
+    Extract clean titles, URLs, and dates from the HTML of an archive page.
+    Args:
+        text (str): HTML of an archive page (see ARCHIVE_URL).
+        base_url (str): Site the relative article links point to.
+    Returns:
+        list of dict: Each dict contains 'title', 'url', and 'date' keys
+    """
+    if _check_html_parser() == "lxml":
+        return _parse_articles_page_lxml(text, base_url)
+    return _parse_articles_page_soup(text, base_url)
+
+def _article_href(href, base_url):
+    # Some hrefs may end with ?idiom=es
+    href = href.strip('"')
+    if href.startswith("/"):
+        href = base_url + href
+    return href
+
+def _parse_articles_page_lxml(text, base_url):
+    """parse_articles_page with one lxml parse of all the cards."""
+    from lxml import etree
+
+    fragments = _FRAGMENT_RE.findall(text)
+    if not fragments:
+        return []
+    # Same decoding as the html.parser path, in one pass over all fragments
+    # (joined by a newline, so an escape never spans two fragments)
+    cards = _JS_ESCAPE_RE.sub("", html.unescape("\n".join(fragments)))
+    root = etree.fromstring(cards, etree.HTMLParser())
+    if root is None:
+        return []
+
+    def first_text(el, tag):
+        found = next(el.iter(tag), None)
+        return "".join(s.strip() for s in found.itertext()) if found is not None else None
+
+    articles_out = []
+    for art in root.iter("article"):
+        title = first_text(art, "h2")
+        date = first_text(art, "time")
+        href = None
+        for link in art.iter("a"):
+            if "small-link" in (link.get("class") or "").split():
+                if link.get("href") is not None:
+                    href = _article_href(link.get("href"), base_url)
+                break
+        if title or href:
+            articles_out.append({"title": title, "url": href, "date": date})
+    return articles_out
+
+def _parse_articles_page_soup(text, base_url):
+    """parse_articles_page with BeautifulSoup, one soup per fragment."""
+    # Extract JS-embedded HTML fragments
+    fragments = _FRAGMENT_RE.findall(text)
+
+    articles_out = []
+
+    for frag in fragments:
+        # Step 1: Decode HTML entities (e.g. &lt;, &quot;)
+        frag_clean = html.unescape(frag)
+        # Step 2: Replace escaped quotes \" → "
+        frag_clean = frag_clean.replace('\\"', '"').replace("\\'", "'")
+        # Step 3: Remove stray backslashes that break tags
+        frag_clean = frag_clean.replace("\\n", "").replace("\\", "")
+        # Step 4: Parse
+        soup = BeautifulSoup(frag_clean, "html.parser")
+
+        # Extract all article cards
+        for art in soup.find_all("article"):
+            title_el = art.find("h2")
+            link_el = art.find("a", class_="small-link")
+            date_el = art.find("time")
+
+            title = title_el.get_text(strip=True) if title_el else None
+            date = date_el.get_text(strip=True) if date_el else None
+
+            if link_el and link_el.has_attr("href"):
+                href = _article_href(link_el["href"], base_url)
+            else:
+                href = None
+
+            if title or href:
+                articles_out.append({
+                    "title": title,
+                    "url": href,
+                    "date": date
+                })
+    return articles_out
+
+def get_articles_from_page(page_num, base_url=BASE_URL):
+    """
+    Extract clean titles, URLs, and dates from Gob.mx dynamic HTML.
+    Args:
+        page_num (int): Page number to scrape.
+        base_url (str): Site to scrape (gob.mx, or a local copy).
+    Returns:
+        list of dict: Each dict contains 'title', 'url', and 'date' keys
+    """
+    url = f"{base_url}{ARCHIVE_PATH}{page_num}"
+    r = requests.get(url)
+    r.raise_for_status()
+    return parse_articles_page(r.text, base_url)
+
+def parse_transcript(text, url=None):
+    """
+    Extract the speech segments of a conference page.
+
+    Args:
+        text (str): HTML of the article page.
+        url (str, optional): Page URL, for the warning when there is no body.
+    Returns:
+        list[dict]: [{'speaker': ..., 'text': ...}, ...], one per non-empty
+        <p> of the article body; the speaker is the text of its <strong>.
+    """
+    if _check_html_parser() == "lxml":
+        entries = _parse_transcript_lxml(text)
+    else:
+        entries = _parse_transcript_soup(text)
+    if entries is None:
+        print(f"No <div class='article-body'> found for {url}")
+        return []
+    return entries
+
+# Start of the article body, and the div tags to find where it ends
+_ARTICLE_BODY_RE = re.compile(
+    r"""<div\b[^>]*?(?<![\w-])class\s*=\s*["']?(?:[^"'>]*?\s)?article-body(?=[\s"'>])""",
+    flags=re.IGNORECASE,
+)
+_DIV_TAG_RE = re.compile(r"<(/?)div\b", flags=re.IGNORECASE)
+
+def _article_body_slice(text):
+    """The <div class="article-body">...</div> part of a page, or None if not found."""
+    start = _ARTICLE_BODY_RE.search(text)
+    if not start:
+        return None
+    depth = 0
+    for tag in _DIV_TAG_RE.finditer(text, start.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = text.find(">", tag.end())
+            return text[start.start():end + 1 if end >= 0 else len(text)]
+    return text[start.start():]
+
+class _TranscriptTarget:
+    """
+    lxml parser target that collects the entries of the first
+    div.article-body from the parse events, like _parse_transcript_soup:
+    each string of a <p> (and of its first <strong>) is stripped and the
+    non-empty ones joined.
+    """
+
+    def __init__(self):
+        self.found = False
+        self.depth = 0      # elements open inside the article body
+        self.done = False
+        self.paragraphs = []
+        self.open = []      # paragraphs being read, innermost last
+        self.buffer = []    # text since the last event
+
+    def start(self, tag, attrib):
+        self._flush()
+        if self.done:
+            return
+        if not self.found:
+            if tag == "div" and "article-body" in (attrib.get("class") or "").split():
+                self.found = True
+                self.depth = 1
+            return
+        self.depth += 1
+        if tag == "p":
+            paragraph = {"strings": [], "speaker": None, "strong": 0}
+            self.paragraphs.append(paragraph)
+            self.open.append(paragraph)
+        elif tag == "strong":
+            for paragraph in self.open:
+                if paragraph["strong"]:
+                    paragraph["strong"] += 1
+                elif paragraph["speaker"] is None:
+                    paragraph["speaker"] = []
+                    paragraph["strong"] = 1
+
+    def end(self, tag):
+        self._flush()
+        if not self.found or self.done:
+            return
+        self.depth -= 1
+        if self.depth == 0:
+            self.done = True
+        elif tag == "p" and self.open:
+            self.open.pop()
+        elif tag == "strong":
+            for paragraph in self.open:
+                if paragraph["strong"]:
+                    paragraph["strong"] -= 1
+
+    def data(self, data):
+        self.buffer.append(data)
+
+    def comment(self, text):
+        self._flush()
+
+    def _flush(self):
+        if not self.buffer:
+            return
+        string = "".join(self.buffer).strip()
+        self.buffer = []
+        if not string:
+            return
+        for paragraph in self.open:
+            paragraph["strings"].append(string)
+            if paragraph["strong"]:
+                paragraph["speaker"].append(string)
+
+    def close(self):
+        self._flush()
+        if not self.found:
+            return None
+        entries = []
+        for paragraph in self.paragraphs:
+            text = " ".join(paragraph["strings"])
+            if text:
+                speaker = paragraph["speaker"]
+                entries.append({"speaker": "".join(speaker) if speaker is not None else None,
+                                "text": text})
+        return entries
+
+def _parse_transcript_lxml(text):
+    """Entries of a page with lxml, or None without an article body."""
+    from lxml import etree
+
+    # Parse only the article body when it can be cut out of the page
+    body = _article_body_slice(text)
+    parser = etree.HTMLParser(target=_TranscriptTarget())
+    parser.feed(body if body is not None else text)
+    return parser.close()
+
+def _parse_transcript_soup(text):
+    """Entries of a page with BeautifulSoup, or None without an article body."""
+    soup = BeautifulSoup(text, "html.parser")
+
+    content = soup.find("div", class_="article-body")
+    if not content:
+        return None
+
+    entries = []
+    for p in content.find_all("p"):
+        strong = p.find("strong")
+        speaker = strong.get_text(strip=True) if strong else None
+        text = p.get_text(" ", strip=True)
+        if text:
+            entries.append({"speaker": speaker, "text": text})
+    return entries
+
+class ResponseCache:
+    """
+    Local cache of raw HTTP responses, to parse pages again without
+    downloading them.
+
+    Bodies are stored gzip-compressed under root/objects, named by the
+    SHA-256 of the body, so identical pages are stored once. An SQLite index
+    (root/index.sqlite) maps each URL to its body, its text encoding, and the
+    ETag / Last-Modified headers sent back with a conditional GET, so a page
+    that has not changed costs a 304 instead of a full download.
+
+    Use as a context manager, or call close().
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self._con = sqlite3.connect(os.path.join(root, "index.sqlite"))
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, digest TEXT NOT NULL, encoding TEXT, "
+            "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL)"
+        )
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest[2:]}.gz")
+
+    def __len__(self):
+        return self._con.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __contains__(self, url):
+        return self._con.execute("SELECT 1 FROM responses WHERE url = ?", (url,)).fetchone() is not None
+
+    def urls(self):
+        """All cached URLs."""
+        return [url for url, in self._con.execute("SELECT url FROM responses ORDER BY url")]
+
+    def validators(self, url):
+        """Headers for a conditional GET of url ({} if it is not cached)."""
+        row = self._con.execute(
+            "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        headers = {}
+        if row is not None:
+            etag, last_modified = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, url):
+        """Decoded body of url, or None if it is not cached."""
+        row = self._con.execute(
+            "SELECT digest, encoding FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        digest, encoding = row
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return _decode(f.read(), encoding)
+
+    def put(self, url, body, encoding=None, etag=None, last_modified=None):
+        """Store the body (bytes) of a 200 response for url."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(body))
+            os.replace(tmp_path, path)
+        with self._con:
+            self._con.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, encoding, etag, last_modified, time.time()),
+            )
+
+    def touch(self, url):
+        """Record that url was revalidated (a 304 response)."""
+        with self._con:
+            self._con.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def close(self):
+        self._con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _decode(body, encoding):
+    return body.decode(encoding or "utf-8", errors="replace")
+
+def _backoff(attempt, backoff_factor):
+    """Seconds to wait before retrying after failed attempt number `attempt` (0-based)."""
+    return backoff_factor * (2 ** attempt) + random.uniform(0, 1)
+
+def get_transcript_structured(url, retries=3, backoff_factor=2, cache=None):
+    """
+    Extract structured transcript with speaker & text, with retry logic.
+
+    Timeouts and connection errors are retried with exponential backoff;
+    HTTP errors and pages without an article body give an empty transcript.
+
+    Args:
+        url (str): Article URL.
+        retries (int): Max number of retry attempts on failure.
+        backoff_factor (int): Multiplier for exponential backoff.
+        cache (ResponseCache, optional): Store the page, and revalidate an
+            already cached one with a conditional GET.
+    Returns:
+        list[dict]: [{'speaker': ..., 'text': ...}, ...]
+    """
+    attempt = 0
+    headers = dict(HEADERS, **cache.validators(url)) if cache is not None else HEADERS
+
+    while attempt < retries:
+        try:
+            r = requests.get(url, headers=headers, timeout=20)
+            if cache is None:
+                r.raise_for_status()
+                return parse_transcript(r.text, url)  # success — exit function
+            if r.status_code == 304:
+                cache.touch(url)
+            else:
+                r.raise_for_status()
+                cache.put(url, r.content, r.encoding or r.apparent_encoding,
+                          r.headers.get("ETag"), r.headers.get("Last-Modified"))
+            return parse_transcript(cache.get(url), url)
+
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            wait = _backoff(attempt, backoff_factor)
+            print(f"Timeout or connection error on {url} — retry {attempt+1}/{retries} after {wait:.1f}s")
+            time.sleep(wait)
+            attempt += 1
+            continue
+
+        except requests.exceptions.HTTPError as e:
+            print(f"HTTP error {e} on {url} — skipping")
+            return []
+
+        except Exception as e:
+            print(f"Unexpected error for {url}: {e}")
+            return []
+
+    print(f"Failed after {retries} retries: {url}")
+    return []
+
+# Concurrent fetching (fetch_transcripts). The defaults keep gob.mx at about
+# 2 requests per second, against one every 2-5 s in the sequential loop.
+FETCH_RATE = 2.0
+FETCH_BURST = 4
+FETCH_CONCURRENCY = 8
+FETCH_TIMEOUT = 20
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio tasks: on average `rate` acquisitions
+    per second, with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def _is_permanent_http_error(status):
+    """Whether an HTTP error status will not change by asking again (404, 410, ...)."""
+    # 408 (request timeout) and 429 (too many requests) are worth another try
+    return 400 <= status < 500 and status not in (408, 429)
+
+async def _fetch_transcript(session, url, bucket, semaphore, stats, retries, backoff_factor,
+                            cache=None):
+    """
+    get_transcript_structured on a shared aiohttp session (same retry rules),
+    but a page that could not be fetched or parsed gives None, not [].
+    The status of an HTTP error is kept in stats["http_status"][url].
+    """
+    import aiohttp
+
+    headers = cache.validators(url) if cache is not None else None
+    for attempt in range(retries):
+        await bucket.acquire()
+        sent = {"requests": 0}
+        try:
+            async with semaphore, session.get(url, headers=headers, trace_request_ctx=sent) as r:
+                if cache is not None and r.status == 304:
+                    stats["not_modified"] += 1
+                    cache.touch(url)
+                    text = cache.get(url)
+                elif cache is not None:
+                    r.raise_for_status()
+                    body = await r.read()
+                    cache.put(url, body, r.get_encoding(),
+                              r.headers.get("ETag"), r.headers.get("Last-Modified"))
+                    text = _decode(body, r.get_encoding())
+                else:
+                    r.raise_for_status()
+                    text = await r.text()
+            return parse_transcript(text, url)
+
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            if attempt + 1 == retries:
+                break
+            stats["retries"] += 1
+            wait = _backoff(attempt, backoff_factor)
+            print(f"Timeout or connection error on {url} — retry {attempt+1}/{retries} after {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+        except aiohttp.ClientResponseError as e:
+            stats["http_errors"] += 1
+            stats["http_status"][url] = e.status
+            print(f"HTTP error {e.status} on {url} — skipping")
+            return None
+
+        except Exception as e:
+            stats["failed"] += 1
+            print(f"Unexpected error for {url}: {e}")
+            return None
+
+        finally:
+            # aiohttp resends a request by itself when the connection drops
+            # before the response; those resends are retries as well
+            stats["retries"] += max(sent["requests"] - 1, 0)
+
+    stats["failed"] += 1
+    print(f"Failed after {retries} retries: {url}")
+    return None
+
+async def _count_request(session, context, params):
+    """aiohttp trace hook: count each request sent (see _fetch_transcript)."""
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx["requests"] += 1
+
+async def fetch_transcripts_async(
+    urls,
+    rate: float = FETCH_RATE,
+    burst: int = FETCH_BURST,
+    concurrency: int = FETCH_CONCURRENCY,
+    retries: int = 3,
+    backoff_factor: float = 2,
+    timeout: float = FETCH_TIMEOUT,
+    on_result: Optional[Callable] = None,
+    cache_path: Optional[str] = None
+) -> tuple[list, dict]:
+    """
+    Download and parse many transcript pages concurrently.
+
+    Requests go through one pooled aiohttp session. Each host gets its own
+    token bucket (rate requests per second, bursts of burst), and at most
+    concurrency requests are in flight at once. Retries follow
+    get_transcript_structured: timeouts and connection errors are retried
+    with exponential backoff. Pages that still fail (HTTP errors, retries
+    exhausted, parse errors) give None instead of a transcript, so callers
+    can tell them from pages with an empty transcript.
+
+    Args:
+        urls (list of str): Article URLs.
+        rate (float): Requests per second per host.
+        burst (int): Token bucket capacity.
+        concurrency (int): Maximum requests in flight.
+        retries (int): Max number of attempts per page.
+        backoff_factor (float): Multiplier for exponential backoff.
+        timeout (float): Seconds per request.
+        on_result (callable, optional): Called as on_result(i, url, entries)
+            as soon as page i is done (in completion order); entries is
+            None if the page failed.
+        cache_path (str, optional): ResponseCache directory. Pages are
+            stored there, and cached pages are revalidated with a
+            conditional GET (a 304 is parsed from the cache).
+    Returns:
+        tuple[list, dict]: the transcript of each URL (in input order, as
+        get_transcript_structured returns them, or None if it failed), and
+        stats with pages, seconds, pages_per_sec, retries, http_errors,
+        failed, not_modified and http_status (url -> status of each page
+        that failed with an HTTP error). retries counts every request sent
+        again, including the ones aiohttp resends by itself after a dropped
+        connection.
+    """
+    import aiohttp
+
+    stats = {"pages": len(urls), "retries": 0, "http_errors": 0, "failed": 0, "not_modified": 0,
+             "http_status": {}}
+    buckets = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    # Sees the resends aiohttp makes on its own, so they count as retries
+    trace = aiohttp.TraceConfig()
+    trace.on_request_headers_sent.append(_count_request)
+
+    async def fetch(i, url):
+        host = urlsplit(url).netloc
+        if host not in buckets:
+            buckets[host] = TokenBucket(rate, burst)
+        entries = await _fetch_transcript(session, url, buckets[host], semaphore, stats,
+                                          retries, backoff_factor, cache)
+        if on_result is not None:
+            on_result(i, url, entries)
+        return entries
+
+    cache = ResponseCache(cache_path) if cache_path is not None else None
+    start = time.perf_counter()
+    try:
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector,
+                                         timeout=client_timeout,
+                                         trace_configs=[trace]) as session:
+            results = await asyncio.gather(*(fetch(i, url) for i, url in enumerate(urls)))
+    finally:
+        if cache is not None:
+            cache.close()
+
+    stats["seconds"] = time.perf_counter() - start
+    stats["pages_per_sec"] = len(urls) / stats["seconds"] if stats["seconds"] else 0.0
+    return list(results), stats
+
+def fetch_transcripts(urls, **kwargs):
+    """
+    Blocking wrapper of fetch_transcripts_async (same arguments).
+
+    Inside Jupyter, where an event loop is already running, use
+    `await fetch_transcripts_async(urls)` instead.
+    """
+    return asyncio.run(fetch_transcripts_async(urls, **kwargs))
+
+# Scraped data, relative to the repository root
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METADATA_PATH = os.path.join(_REPO_ROOT, "data", "raw", "article_metadata.csv")
+TRANSCRIPTS_PATH = os.path.join(_REPO_ROOT, "data", "processed", "article_transcripts.json")
+CHECKPOINT_PATH = os.path.join(_REPO_ROOT, "data", "raw", "article_transcripts_checkpoint.jsonl")
+RESPONSE_CACHE_PATH = os.path.join(_REPO_ROOT, "data", "raw", "responses")
+
+def _write_atomic(path, write):
+    """Call write(f) on a temporary file, then move it to path."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _save_metadata(df, path):
+    _write_atomic(path, lambda f: df.to_csv(f, index=False))
+
+def _save_transcripts(data, path):
+    _write_atomic(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=2))
+
+class CheckpointWriter:
+    """
+    Append-only JSON Lines checkpoint: one article per line, flushed and
+    fsynced as soon as it is written, so a crash loses at most the article
+    being written and never the ones before it.
+
+    Use as a context manager; see read_checkpoint to resume from the file.
+    """
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, article):
+        self._f.write(json.dumps(article, ensure_ascii=False) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_checkpoint(path):
+    """
+    Read the articles of a JSON Lines checkpoint (see CheckpointWriter).
+
+    A last line cut short by a crash is dropped from the file, so the
+    checkpoint can be appended to again.
+
+    Returns:
+        list[dict]: The articles, in the order they were written ([] if the
+        file does not exist).
+    """
+    if not os.path.exists(path):
+        return []
+    articles = []
+    good_size = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                articles.append(json.loads(line))
+            except ValueError:
+                break
+            good_size += len(line)
+    if good_size < os.path.getsize(path):
+        print(f"Dropping a partial record at the end of {path}")
+        with open(path, "r+b") as f:
+            f.truncate(good_size)
+    return articles
+
+def _get_archive_page(page, retries, base_url):
+    """get_articles_from_page with retries; None if every attempt failed."""
+    for attempt in range(retries):
+        try:
+            return get_articles_from_page(page, base_url)
+        # Consider Error Codes:
+        except requests.exceptions.HTTPError as e:
+            print(f"HTTP error on page {page}: {e}. Retrying ({attempt+1}/{retries})...")
+            time.sleep(random.uniform(5, 10))  # wait before retry
+        except Exception as e:
+            print(f"Other error on page {page}: {e}. Retrying...")
+            time.sleep(random.uniform(5, 10))
+    return None
+
+def scrape_all_articles(max_pages=50, retries=3, output_path=METADATA_PATH,
+                        incremental=False, base_url=BASE_URL, delay=(2, 5)):
+    """
+    Scrape articles from multiple pages and save metadata to CSV.
+
+    With incremental=True the articles already in output_path are kept, only
+    articles with new URLs are added (in front, as the archive lists the
+    newest first), and the walk stops at the first page without any new
+    article. A daily refresh then reads one or two pages instead of all.
+
+    Args:
+        max_pages (int): Maximum number of pages to scrape.
+        retries (int): Attempts per page.
+        output_path (str): Metadata CSV (read back in incremental mode).
+        incremental (bool): Only add articles that are not in output_path yet.
+        base_url (str): Site to scrape (gob.mx, or a local copy).
+        delay (tuple): Random polite delay between pages, in seconds.
+
+    Returns:
+        pd.DataFrame: DataFrame containing all scraped articles.
+    """
+    known = None
+    if incremental and os.path.exists(output_path):
+        known = pd.read_csv(output_path)
+    known_urls = set(known["url"].dropna()) if known is not None else set()
+
+    def merged(new):
+        df = pd.DataFrame(new, columns=["title", "url", "date"])
+        return df if known is None else pd.concat([df, known], ignore_index=True)
+
+    # Define a list to store all data
+    all_data = []
+
+    # Loop through all the pages that are paginated in the site
+    for page in tqdm(range(1, max_pages + 1)):
+        # Get all the transcriptions from a single page
+        page_data = _get_archive_page(page, retries, base_url)
+        # If not successful, after retires
+        if page_data is None:
+            print(f"Failed to fetch page {page} after {retries} retries. Skipping...")
+            continue
+        if not page_data:
+            print(f"No more data after page {page}.")
+        if incremental:
+            page_data = [a for a in page_data if a["url"] not in known_urls]
+            known_urls.update(a["url"] for a in page_data)
+            if not page_data:
+                print(f"No new articles on page {page}; stopping.")
+                break
+        all_data.extend(page_data)
+
+        # Random polite delay between pages
+        time.sleep(random.uniform(*delay))
+
+        # Save progress every 5 pages
+        if page % 5 == 0:
+            _save_metadata(merged(all_data), output_path)
+            print(f"Checkpoint saved at page {page}")
+
+    # Final save
+    df = merged(all_data)
+    _save_metadata(df, output_path)
+    print(f"\nSaved {len(df)} articles to {output_path} ({len(all_data)} new)")
+
+    return df
+
+async def scrape_transcripts_async(
+    metadata,
+    output_path: str = TRANSCRIPTS_PATH,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    incremental: bool = False,
+    resume: bool = True,
+    cache_path: Optional[str] = RESPONSE_CACHE_PATH,
+    **fetch_kwargs
+) -> list:
+    """
+    Download the transcripts of the articles in metadata and save them.
+
+    Every downloaded article is appended to checkpoint_path as it arrives
+    (see CheckpointWriter). With resume=True, URLs already in the checkpoint
+    are not downloaded again, so an interrupted run picks up where it
+    stopped. At the end the checkpoint is compacted into output_path (written
+    to a temporary file and renamed) and removed.
+
+    With incremental=True the articles already in output_path are kept and
+    only URLs that are not there yet are downloaded; the new articles are
+    merged in, in metadata order.
+
+    Pages that are gone for good (an HTTP 4xx other than 408 and 429, such
+    as 404 or 410) are saved with an empty transcript and their status in
+    http_status, so incremental and resumed runs do not ask for them again
+    (a run with incremental=False does). Other failures (timeouts, dropped
+    connections, 5xx, 408, 429) are neither checkpointed nor saved, so the
+    next run downloads them again.
+
+    The raw pages are kept in a ResponseCache at cache_path: pages already
+    there are revalidated with conditional GETs (unchanged pages cost a 304)
+    and reparse_transcripts parses them again without any download.
+
+    Args:
+        metadata (pd.DataFrame): Articles with date, title and url
+            (see scrape_all_articles); rows without url are skipped.
+        output_path (str): JSON array of articles (read back in incremental mode).
+        checkpoint_path (str): JSON Lines file of the articles downloaded so far.
+        incremental (bool): Only download articles that are not in output_path yet.
+        resume (bool): Keep the articles of an earlier, interrupted run's checkpoint.
+        cache_path (str, optional): ResponseCache directory (None to not cache pages).
+        **fetch_kwargs: Passed to fetch_transcripts_async (rate, concurrency, ...).
+    Returns:
+        list[dict]: All articles, with date, title, url and transcript
+        (and http_status for pages that are gone).
+    """
+    metadata = metadata[metadata["url"].notna()].drop_duplicates("url").reset_index(drop=True)
+    known = {}
+    if incremental and os.path.exists(output_path):
+        with open(output_path, encoding="utf-8") as f:
+            known = {article["url"]: article for article in json.load(f)}
+
+    if not resume and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    new = {article["url"]: article for article in read_checkpoint(checkpoint_path)}
+    if new:
+        print(f"Resuming: {len(new)} articles already in {checkpoint_path}")
+    todo = metadata[~metadata["url"].isin(known) & ~metadata["url"].isin(new)].reset_index(drop=True)
+
+    with CheckpointWriter(checkpoint_path) as checkpoint:
+        def save(i, url, transcript, **extra):
+            row = todo.iloc[i]
+            article = {"date": row["date"], "title": row["title"], "url": row["url"],
+                       "transcript": transcript, **extra}
+            checkpoint.write(article)
+            new[url] = article
+
+        failed_rows = {}
+
+        def on_result(i, url, transcript):
+            if transcript is None:
+                failed_rows[url] = i
+            else:
+                save(i, url, transcript)
+
+        _, stats = await fetch_transcripts_async(
+            todo["url"].tolist(), on_result=on_result, cache_path=cache_path, **fetch_kwargs
+        )
+        # Pages that are gone are recorded, so later runs skip them
+        gone = 0
+        for url, status in stats["http_status"].items():
+            if _is_permanent_http_error(status):
+                save(failed_rows[url], url, [], http_status=status)
+                gone += 1
+    failed = len(failed_rows) - gone
+    print(f"{len(todo)} new of {len(metadata)} articles: {stats['pages_per_sec']:.2f} pages/s, "
+          f"{stats['not_modified']} not modified, {stats['retries']} retries, "
+          f"{gone} gone (HTTP 4xx, recorded), {failed} failed (left for the next run)")
+
+    data = compact_checkpoint(checkpoint_path, output_path, metadata["url"], known, new)
+    print(f"Saved {sum('http_status' not in a for a in data)} full transcripts.")
+    return data
+
+def compact_checkpoint(checkpoint_path, output_path=TRANSCRIPTS_PATH, order=None,
+                       known=None, new=None):
+    """
+    Merge checkpointed articles into a JSON array file, then drop the checkpoint.
+
+    output_path is written to a temporary file and renamed, so it holds
+    either the old or the new articles, never a partial file.
+
+    Args:
+        checkpoint_path (str): JSON Lines checkpoint (see CheckpointWriter).
+        output_path (str): JSON array of articles to write.
+        order (iterable of str, optional): URLs in the order to save the
+            articles in; articles not listed go last. Defaults to the
+            order of known, then of the checkpoint.
+        known (dict, optional): url -> article already saved; checkpointed
+            articles replace them.
+        new (dict, optional): url -> article of the checkpoint, if already read.
+    Returns:
+        list[dict]: The articles written.
+    """
+    known = known or {}
+    if new is None:
+        new = {article["url"]: article for article in read_checkpoint(checkpoint_path)}
+    merged = {**known, **new}
+    order = list(order) if order is not None else list(merged)
+    listed = set(order)
+    data = [merged[url] for url in order if url in merged]
+    data += [article for url, article in merged.items() if url not in listed]
+
+    _save_transcripts(data, output_path)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return data
+
+def scrape_transcripts(metadata, **kwargs):
+    """
+    Blocking wrapper of scrape_transcripts_async (same arguments).
+
+    Inside Jupyter, use `await scrape_transcripts_async(...)` instead.
+    """
+    return asyncio.run(scrape_transcripts_async(metadata, **kwargs))
+
+def reparse_transcripts(output_path=TRANSCRIPTS_PATH, cache_path=RESPONSE_CACHE_PATH):
+    """
+    Parse the transcripts in output_path again from the response cache.
+
+    Nothing is downloaded: after a change to parse_transcript, this brings
+    the saved transcripts up to date from the pages kept by
+    scrape_transcripts. Articles whose page is not cached keep their
+    transcript. output_path is rewritten through a temporary file.
+
+    Args:
+        output_path (str): JSON array of articles (see scrape_transcripts).
+        cache_path (str): ResponseCache directory.
+    Returns:
+        list[dict]: The articles, with the new transcripts.
+    """
+    with open(output_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    missing = 0
+    with ResponseCache(cache_path) as cache:
+        for article in data:
+            text = cache.get(article["url"])
+            if text is None:
+                missing += 1
+                continue
+            article["transcript"] = parse_transcript(text, article["url"])
+
+    _save_transcripts(data, output_path)
+    print(f"Re-parsed {len(data) - missing} transcripts from {cache_path}"
+          f" ({missing} not cached, kept as they were)")
+    return data
@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+SCRIPTS_DIR = os.path.join(REPO_ROOT, "scripts")
+# Scraped sample committed with the repo (one row per article)
+CHECKPOINT_CSV = os.path.join(REPO_ROOT, "data", "raw", "article_transcripts_checkpoint.csv")
+
+# src first: scripts/ has an older data_processing.py of its own
+for path in (SCRIPTS_DIR, SRC_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def transcripts_json(tmp_path_factory):
+    """The checkpoint sample as data/processed/article_transcripts.json would be."""
+    from data_processing import iter_articles
+
+    path = tmp_path_factory.mktemp("data") / "article_transcripts.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(list(iter_articles(CHECKPOINT_CSV)), f, ensure_ascii=False, indent=2)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def fixture_pages(tmp_path_factory):
+    """gob.mx-like transcript pages of the checkpoint sample: (pages dir, articles)."""
+    from data_processing import iter_articles
+    from stub_server import write_fixture_pages
+
+    root = str(tmp_path_factory.mktemp("pages"))
+    return root, write_fixture_pages(iter_articles(CHECKPOINT_CSV), root, n_pages=30)
+
+
+@pytest.fixture
+def pages(fixture_pages, tmp_path):
+    """A copy of the fixture pages that the test can change."""
+    root, articles = fixture_pages
+    copy = str(tmp_path / "pages")
+    shutil.copytree(root, copy)
+    return copy, articles
+
+
+@pytest.fixture
+def stub_server():
+    """Start stub servers with start_stub_server(root, **options); stopped after the test."""
+    from stub_server import start_stub_server
+
+    servers = []
+
+    def start(root, **options):
+        server, base_url = start_stub_server(root, **options)
+        servers.append(server)
+        return server, base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,66 @@
+import pytest
+
+import data_processing as dp
+
+TOPICS = {"security": ["seguridad", "violencia"], "health": ["salud", "hospital"]}
+OTHER_TOPICS = {"education": ["educacion", "escuela"]}
+
+
+@pytest.fixture(scope="module")
+def paragraphs(transcripts_json):
+    return dp.enrich(dp.load_transcripts(transcripts_json))
+
+
+def aggregations(df, topics, whole_words=False):
+    """The tables the aggregate store serves in place of the paragraphs."""
+    return [
+        dp.get_conference_lengths(df),
+        dp.get_daily_lengths_by_actor(df),
+        dp.get_avg_length_by_weekday(df),
+        *dp.get_turn_taking_tables(df),
+        dp.get_topics_by_week(df, topics, whole_words=whole_words),
+        dp.get_topics_by_week_by_group(df, topics, whole_words=whole_words),
+    ]
+
+
+def assert_same_tables(df, partials, topics, whole_words=False):
+    for expected, derived in zip(aggregations(df, topics, whole_words),
+                                 aggregations(partials, topics, whole_words)):
+        assert expected.equals(derived)
+
+
+def test_partials_match_the_paragraph_table(paragraphs, tmp_path):
+    partials = dp.update_aggregate_store(paragraphs, tmp_path / "store.sqlite", TOPICS)
+    assert dp.is_aggregate_partials(partials)
+    assert_same_tables(paragraphs, partials, TOPICS)
+
+
+def test_appended_conference_matches_a_full_build(paragraphs, tmp_path):
+    store_path = tmp_path / "store.sqlite"
+    # The first conference plays the one that just arrived
+    newest = paragraphs["url"] == paragraphs["url"].iloc[0]
+    before = dp.update_aggregate_store(paragraphs[~newest], store_path, TOPICS)
+    after = dp.update_aggregate_store(paragraphs, store_path, TOPICS)
+
+    # Conferences already stored keep their ids and partials
+    old = after[after["conf_id"].isin(before["conf_id"])].reset_index(drop=True)
+    assert old.equals(before)
+    assert_same_tables(paragraphs, after, TOPICS)
+
+
+def test_changed_settings_rebuild_the_store(paragraphs, tmp_path):
+    store_path = tmp_path / "store.sqlite"
+    dp.update_aggregate_store(paragraphs, store_path, TOPICS)
+
+    partials = dp.update_aggregate_store(paragraphs, store_path, OTHER_TOPICS)
+    assert partials.attrs["topics"] == OTHER_TOPICS
+    assert "security_count" not in partials.columns
+    assert_same_tables(paragraphs, partials, OTHER_TOPICS)
+    with pytest.raises(ValueError):
+        dp.get_topics_by_week(partials, TOPICS)
+
+    partials = dp.update_aggregate_store(paragraphs, store_path, OTHER_TOPICS, whole_words=True)
+    assert partials.attrs["whole_words"] is True
+    assert_same_tables(paragraphs, partials, OTHER_TOPICS, whole_words=True)
+    with pytest.raises(ValueError):
+        dp.get_topics_by_week(partials, OTHER_TOPICS)
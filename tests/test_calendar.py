@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+
+
+def old_calendar(table):
+    """The columns the heatmap helpers derived row by row before get_calendar."""
+    table = table.copy()
+    table["week"] = table["date"].dt.isocalendar().week
+    table["year"] = table["date"].dt.isocalendar().year
+    table["yearweek"] = table["year"].astype(str) + "-" + table["week"].astype(str).str.zfill(2)
+    table["day_of_week"] = table["date"].dt.day_name()
+    table["day_idx"] = table["day_of_week"].map({d: i for i, d in enumerate(DAY_ORDER)})
+    table["month"] = pd.Categorical(table["date"].dt.strftime("%B"), categories=MONTHS, ordered=True)
+    return table
+
+
+def assert_same_columns(got, expected, columns):
+    for col in columns:
+        assert got[col].tolist() == expected[col].tolist(), col
+    if "month" in columns:
+        assert got["month"].cat.categories.tolist() == MONTHS and got["month"].cat.ordered
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2025-10-01", "2025-10-31"),
+    # ISO years that start in December and end in January, and a week 53
+    ("2019-12-23", "2021-01-12"),
+    ("2024-12-28", "2025-01-06"),
+    ("2025-03-05", "2025-03-05"),
+])
+def test_calendar_matches_row_by_row_labels(start, end):
+    days = pd.Series(pd.date_range(start, end, freq="D"))
+    # Unsorted, repeated and missing dates only set the range
+    dates = pd.concat([days.iloc[::-1], days.iloc[:3], pd.Series([pd.NaT])], ignore_index=True)
+    calendar = dp.get_calendar(dates)
+    assert calendar["date"].tolist() == days.tolist()
+    assert_same_columns(calendar, old_calendar(pd.DataFrame({"date": days})),
+                        ["week", "year", "yearweek", "day_of_week", "day_idx", "month"])
+
+
+def test_empty_dates():
+    calendar = dp.get_calendar(pd.Series([pd.NaT], dtype="datetime64[ns]"))
+    assert calendar.empty and "yearweek" in calendar.columns
+
+
+def old_slices(table):
+    table["x0"] = table["day_idx"] + (table["conf_rank"] - 1) / table["n_conf"]
+    table["x1"] = table["day_idx"] + table["conf_rank"] / table["n_conf"]
+    return table
+
+
+@pytest.fixture(scope="module")
+def paragraphs(transcripts_json):
+    df = dp.enrich(dp.load_transcripts(transcripts_json))
+    # A second conference on the first day, so the day cells are split
+    first = df[df["url"] == df["url"].iloc[0]]
+    return pd.concat([df, first.assign(url="/otra", title="Otra conferencia")], ignore_index=True)
+
+
+def test_heatmap_tables_match_the_old_labels(paragraphs):
+    daily = dp.get_daily_lengths(paragraphs)
+    assert (daily["n_conf"] > 1).any()
+    expected = old_slices(old_calendar(daily[["date", "conf_rank", "n_conf"]]))
+    assert_same_columns(daily, expected,
+                        ["week", "year", "yearweek", "day_of_week", "day_idx"])
+    np.testing.assert_allclose(daily[["x0", "x1"]], expected[["x0", "x1"]], rtol=1e-15)
+
+    by_actor = dp.get_daily_lengths_by_actor(paragraphs)
+    expected = old_slices(old_calendar(by_actor[["date", "conf_rank", "n_conf"]]))
+    assert_same_columns(by_actor, expected,
+                        ["week", "year", "yearweek", "day_of_week", "day_idx", "month"])
+    np.testing.assert_allclose(by_actor[["x0", "x1"]], expected[["x0", "x1"]], rtol=1e-15)
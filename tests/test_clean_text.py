@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+EDGE_CASES = [
+    None, np.nan, 42, "", "   ", "¿Qué pasó? ¡Nada!", "PRESIDENTA: «Buenos días»",
+    "Niñas, niños y adolescentes…", "“comillas” ‘simples’ — guiones – y ‐", "El 100% de 2025/10/08",
+    "Ça va, Zürich, São Paulo, Øresund", "emoji 🙂 y símbolos € ° ²", "tab\tsalto\nlínea",
+    "de la de la de", "Mañanera", "Mañanera",
+]
+
+
+@pytest.fixture(scope="module")
+def texts(transcripts_json):
+    corpus = dp.load_transcripts(transcripts_json)["text"]
+    return pd.concat([corpus, pd.Series(EDGE_CASES, dtype=object)], ignore_index=True)
+
+
+@pytest.mark.parametrize("options", [
+    {}, {"remove_stopwords": False}, {"extra_stopwords": ["presidenta", "mexico"]},
+])
+def test_series_matches_row_wise_clean_text(texts, options):
+    expected = texts.apply(lambda t: dp.clean_text(t, **options))
+    assert dp.clean_text_series(texts, **options).equals(expected)
+
+
+def test_index_is_kept():
+    series = pd.Series(["Sí", None, "Sí"], index=[10, 3, 7])
+    assert dp.clean_text_series(series).equals(pd.Series(["si", "", "si"], index=[10, 3, 7]))
@@ -0,0 +1,53 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+import data_processing as dp
+
+RAW_DATES = [
+    "jueves, 16 de octubre de 2025Fecha de publicación",
+    "Jueves, 16 de Octubre de 2025",
+    "lunes, 1 de setiembre de 2025",
+    "1 de septiembre de 2025 Fecha de publicación: 2 de septiembre de 2025",
+    "martes 30 de febrero de 2025",  # no such day
+    "16 de brumario de 2025",  # no such month
+    "16/10/2025",
+    "",
+    None,
+    np.nan,
+    20251016,
+]
+
+
+def test_column_matches_one_date_at_a_time():
+    raw = pd.Series(RAW_DATES * 3, index=range(100, 100 + 3 * len(RAW_DATES)), name="date")
+    parsed = dp.parse_spanish_dates(raw)
+    assert parsed.dtype == "datetime64[ns]"
+    assert parsed.index.equals(raw.index) and parsed.name == "date"
+    expected = pd.Series([dp.parse_spanish_date(d) for d in raw], index=raw.index, dtype=object)
+    assert parsed.isna().equals(expected.isna())
+    assert [d.date() for d in parsed.dropna()] == expected.dropna().tolist()
+    assert parsed.iloc[:4].dt.date.tolist() == [
+        datetime.date(2025, 10, 16), datetime.date(2025, 10, 16),
+        datetime.date(2025, 9, 1), datetime.date(2025, 9, 1),
+    ]
+
+
+def test_corpus_dates(transcripts_json):
+    articles = list(dp.iter_articles(transcripts_json))
+    raw = [article["date"] for article in articles]
+    parsed = dp.parse_spanish_dates(raw)
+    assert parsed.notna().all()
+    assert parsed.dt.date.tolist() == [dp.parse_spanish_date(d) for d in raw]
+
+
+def test_topics_by_week_accepts_date_objects(transcripts_json):
+    # flatten_data used to return datetime.date objects in an object column
+    df = dp.load_transcripts(transcripts_json)
+    old = df.assign(date=df["date"].dt.date)
+    topics = {"security": ["seguridad", "violencia"], "health": ["salud", "hospital"]}
+    assert dp.get_topics_by_week(old, topics).equals(dp.get_topics_by_week(df, topics))
+    assert dp.get_topics_by_week_by_group(old, topics).equals(
+        dp.get_topics_by_week_by_group(df, topics)
+    )
@@ -0,0 +1,135 @@
+import html
+import os
+import random
+
+import pytest
+
+import scraper
+from stub_server import ARCHIVE_PAGE_SIZE, page_filename
+
+pytest.importorskip("lxml")
+
+WORDS = ["Presidenta", "México", "seguridad", "año", "niñas", "“salud”", "O'Higgins",
+         "a\\b", "<menos>", "&", "100%", "—", "política"]
+
+
+@pytest.fixture
+def parse_with():
+    """parse_with(parser, func, pages): func applied to every page with that HTML parser."""
+    previous = scraper.get_html_parser()
+
+    def parse(parser, func, pages):
+        scraper.set_html_parser(parser)
+        return [func(page) for page in pages]
+
+    yield parse
+    scraper.set_html_parser(previous)
+
+
+def assert_same_output(parse_with, func, pages):
+    reference = parse_with("html.parser", func, pages)
+    assert parse_with("lxml", func, pages) == reference
+    return reference
+
+
+def phrase(rng, n=None):
+    return " ".join(rng.choice(WORDS) for _ in range(n or rng.randint(1, 6)))
+
+
+def inline(rng, depth=0, in_link=False):
+    """Escaped text with random (well-formed) inline markup, entities and whitespace."""
+    parts = []
+    for _ in range(rng.randint(1, 4)):
+        kind = rng.random()
+        if kind < 0.15 and depth < 2:
+            # No link inside a link: the parsers repair that differently
+            tag = rng.choice(["em", "span", "b", "strong"] + ([] if in_link else ["a"]))
+            parts.append(f"<{tag}>{inline(rng, depth + 1, in_link or tag == 'a')}</{tag}>")
+        elif kind < 0.25:
+            parts.append(rng.choice(["<br>", "<br/>", "&nbsp;", "&amp;", "&#233;", "<!-- nota -->"]))
+        else:
+            parts.append(html.escape(phrase(rng)))
+        parts.append(rng.choice(["", " ", "  ", "\n", "\t "]))
+    return "".join(parts)
+
+
+def random_transcript_page(rng):
+    paragraphs = []
+    for _ in range(rng.randint(0, 12)):
+        kind = rng.random()
+        if kind < 0.4:
+            speaker = html.escape(phrase(rng, 2).upper()) + rng.choice([":", ""])
+            paragraphs.append(f"<p><strong>{speaker}</strong>{inline(rng)}</p>")
+        elif kind < 0.5:
+            paragraphs.append(rng.choice(["<p></p>", "<p> </p>", "<p>&nbsp;</p>", "<p><br></p>"]))
+        elif kind < 0.6:
+            paragraphs.append(f"<div class=\"quote\"><p>{inline(rng)}</p></div>")
+        else:
+            paragraphs.append(f"<p class=\"texto\">{inline(rng)}</p>")
+    body_class = rng.choice(["article-body", "article-body main", "main article-body"])
+    outside = f"<div class=\"aside\"><p><strong>FUERA</strong> {html.escape(phrase(rng))}</p></div>"
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"></head><body>\n"
+        + outside + f"<main><div class=\"{body_class}\">\n" + "\n".join(paragraphs)
+        + "\n</div></main>\n" + outside + "</body></html>\n"
+    )
+
+
+def random_archive_page(rng):
+    appends = []
+    for _ in range(rng.randint(0, ARCHIVE_PAGE_SIZE)):
+        title = f"<h2>{html.escape(phrase(rng))}</h2>" if rng.random() < 0.9 else ""
+        date = f"<time> {rng.randint(1, 28)} de octubre </time>" if rng.random() < 0.9 else ""
+        link_class = rng.choice(["small-link", "btn small-link", "big-link"])
+        link = (f"<a class=\"{link_class}\" href=\"/presidencia/es/articulos/{rng.randint(1, 999)}"
+                f"?idiom=es\">Leer más</a>") if rng.random() < 0.9 else ""
+        card = f"<article>{title}{date}{link}</article>"
+        if rng.random() < 0.5:
+            card = html.escape(card, quote=False)
+        card = card.replace("\\", "\\\\").replace('"', '\\"').replace("'", "\\'")
+        appends.append(f"$('#prensa').append('{card}');")
+    return "<html><body><script>\n" + "\n".join(appends) + "\n</script></body></html>"
+
+
+def read_pages(root, urls):
+    pages = []
+    for url in urls:
+        with open(os.path.join(root, page_filename(url)), encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def test_fixture_pages(parse_with, fixture_pages):
+    root, articles = fixture_pages
+    transcripts = read_pages(root, [article["url"] for article in articles])
+    entries = assert_same_output(parse_with, scraper.parse_transcript, transcripts)
+    assert sum(map(len, entries)) > 0
+
+    n_archive = -(-len(articles) // ARCHIVE_PAGE_SIZE)
+    archives = read_pages(root, [f"{scraper.ARCHIVE_PATH}{page}" for page in range(1, n_archive + 2)])
+    cards = assert_same_output(parse_with, scraper.parse_articles_page, archives)
+    assert [card["title"] for page in cards for card in page] == [a["title"] for a in articles]
+
+
+def test_random_transcript_pages(parse_with):
+    rng = random.Random(0)
+    pages = [random_transcript_page(rng) for _ in range(300)]
+    entries = assert_same_output(parse_with, scraper.parse_transcript, pages)
+    assert any(entry["speaker"] for page in entries for entry in page)
+
+
+def test_random_archive_pages(parse_with):
+    rng = random.Random(0)
+    pages = [random_archive_page(rng) for _ in range(300)]
+    cards = assert_same_output(parse_with, scraper.parse_articles_page, pages)
+    assert any(page for page in cards)
+
+
+def test_page_without_article_body(parse_with):
+    page = "<html><body><div class=\"article\"><p>Texto</p></div></body></html>"
+    assert assert_same_output(parse_with, scraper.parse_transcript, [page]) == [[]]
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError):
+        scraper.set_html_parser("html5lib")
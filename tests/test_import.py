@@ -0,0 +1,47 @@
+"""Importing data_processing must be cheap and must not touch the network."""
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SRC_DIR
+
+# Runs in a fresh interpreter: records every socket created and every host
+# name resolved while `import data_processing` runs.
+_IMPORT_PROBE = f"""
+import socket, sys
+sys.path.insert(0, {SRC_DIR!r})
+net_calls = []
+_socket_init = socket.socket.__init__
+def _init(self, *a, **kw):
+    net_calls.append("socket")
+    _socket_init(self, *a, **kw)
+socket.socket.__init__ = _init
+for name in ("getaddrinfo", "gethostbyname", "create_connection"):
+    def _wrap(*a, _name=name, _orig=getattr(socket, name), **kw):
+        net_calls.append(_name)
+        return _orig(*a, **kw)
+    setattr(socket, name, _wrap)
+import data_processing
+print(" ".join(net_calls) or "-")
+print(data_processing.analyzer_status()[0], "torch" in sys.modules)
+"""
+
+
+@pytest.fixture(scope="module")
+def probe():
+    result = subprocess.run([sys.executable, "-c", _IMPORT_PROBE],
+                            capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split("\n")[:2]
+
+
+def test_import_opens_no_socket_and_resolves_no_host(probe):
+    net_calls = probe[0]
+    assert net_calls == "-", f"network used during import: {net_calls}"
+
+
+def test_import_does_not_load_the_sentiment_model(probe):
+    state, torch_loaded = probe[1].split()
+    assert state == "not_loaded"
+    assert torch_loaded == "False"
@@ -0,0 +1,38 @@
+import json
+
+import pandas as pd
+
+import data_processing as dp
+
+TOPICS = {"security": ["seguridad", "violencia"], "health": ["salud", "hospital"]}
+
+
+def test_load_transcripts_matches_flatten_data(transcripts_json):
+    with open(transcripts_json, encoding="utf-8") as f:
+        expected = dp.flatten_data(json.load(f))
+    assert expected.equals(dp.load_transcripts(transcripts_json))
+
+
+def test_batches_concatenate_to_the_whole_table(transcripts_json):
+    whole = dp.load_transcripts(transcripts_json)
+    batches = list(dp.load_transcripts(transcripts_json, chunksize=500))
+    assert len(batches) > 1
+    assert whole.equals(pd.concat(batches, ignore_index=True))
+    # No article is split between two batches
+    urls = [set(batch["url"]) for batch in batches]
+    assert sum(len(u) for u in urls) == len(set().union(*urls))
+
+
+def test_aggregate_store_from_batches(transcripts_json, tmp_path):
+    whole = dp.update_aggregate_store(dp.load_transcripts(transcripts_json),
+                                      tmp_path / "whole.sqlite", TOPICS)
+    chunked = dp.update_aggregate_store(dp.load_transcripts(transcripts_json, chunksize=500),
+                                        tmp_path / "chunked.sqlite", TOPICS)
+    assert whole.equals(chunked)
+
+
+def test_json_array_read_in_small_blocks(transcripts_json):
+    with open(transcripts_json, encoding="utf-8") as f:
+        expected = json.load(f)
+    # Every article spans several blocks
+    assert list(dp._iter_json_array(transcripts_json, block_size=64)) == expected
@@ -0,0 +1,99 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import scraper
+from stub_server import page_filename
+
+# No waiting between attempts beyond the backoff jitter, and no rate limit
+FAST = {"backoff_factor": 0, "rate": 1000, "burst": 100}
+
+
+def add_paragraph(root, url, html):
+    """Append a paragraph to the article body of a saved page."""
+    path = os.path.join(root, page_filename(url))
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page.replace("\n</div></main>", f"\n{html}\n</div></main>"))
+
+
+def test_put_get_and_validators(tmp_path):
+    root = str(tmp_path / "responses")
+    body = "<p>Niñas y niños</p>".encode("latin-1")
+    with scraper.ResponseCache(root) as cache:
+        assert cache.get("https://a") is None
+        assert cache.validators("https://a") == {}
+        cache.put("https://a", body, "latin-1", '"abc"', "Mon, 06 Oct 2025 12:00:00 GMT")
+        cache.put("https://b", body, "latin-1")
+        cache.put("https://b", body, "latin-1", '"abc"')
+
+    # Everything is on disk; identical bodies are stored once
+    with scraper.ResponseCache(root) as cache:
+        assert len(cache) == 2 and "https://a" in cache and "https://c" not in cache
+        assert cache.urls() == ["https://a", "https://b"]
+        assert cache.get("https://a") == cache.get("https://b") == "<p>Niñas y niños</p>"
+        assert cache.validators("https://a") == {
+            "If-None-Match": '"abc"', "If-Modified-Since": "Mon, 06 Oct 2025 12:00:00 GMT"
+        }
+        assert cache.validators("https://b") == {"If-None-Match": '"abc"'}
+    objects = [name for _, _, names in os.walk(os.path.join(root, "objects")) for name in names]
+    assert len(objects) == 1
+
+
+def test_unchanged_pages_are_revalidated(pages, stub_server, tmp_path):
+    root, articles = pages
+    server, base_url = stub_server(root)
+    urls = [base_url + article["url"] for article in articles]
+    cache_path = str(tmp_path / "responses")
+
+    downloaded, cold = scraper.fetch_transcripts(urls, cache_path=cache_path, **FAST)
+    assert cold["not_modified"] == 0 and server.not_modified == 0
+
+    # A second fetch costs one 304 per page and parses the cached bodies
+    revalidated, warm = scraper.fetch_transcripts(urls, cache_path=cache_path, **FAST)
+    assert revalidated == downloaded
+    assert warm["not_modified"] == server.not_modified == len(urls)
+
+    # A changed page is downloaded again, and replaces the cached one
+    add_paragraph(root, articles[0]["url"], "<p><strong>NUEVO:</strong> texto</p>")
+    changed, stats = scraper.fetch_transcripts(urls, cache_path=cache_path, **FAST)
+    assert stats["not_modified"] == len(urls) - 1
+    assert changed[0] == downloaded[0] + [{"speaker": "NUEVO:", "text": "NUEVO: texto"}]
+    assert changed[1:] == downloaded[1:]
+    with scraper.ResponseCache(cache_path) as cache:
+        assert scraper.parse_transcript(cache.get(urls[0])) == changed[0]
+
+    # The sequential fetcher revalidates the same way
+    with scraper.ResponseCache(cache_path) as cache:
+        not_modified = server.not_modified
+        assert scraper.get_transcript_structured(urls[0], cache=cache) == changed[0]
+        assert server.not_modified == not_modified + 1
+
+
+def test_reparse_without_downloading(pages, stub_server, tmp_path):
+    root, articles = pages
+    server, base_url = stub_server(root)
+    meta = pd.DataFrame([{"date": a["date"], "title": a["title"], "url": base_url + a["url"]}
+                         for a in articles])
+    output_path = str(tmp_path / "article_transcripts.json")
+    cache_path = str(tmp_path / "responses")
+    expected = scraper.scrape_transcripts(meta, output_path=output_path, cache_path=cache_path,
+                                          checkpoint_path=str(tmp_path / "checkpoint.jsonl"), **FAST)
+    server.shutdown()
+
+    # Stale transcripts (as after a parser change), and one article not in the cache
+    with open(output_path, encoding="utf-8") as f:
+        saved = json.load(f)
+    for article in saved:
+        article["transcript"] = []
+    uncached = dict(saved[0], url=base_url + "/not-cached", transcript=[{"speaker": None, "text": "x"}])
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(saved + [uncached], f)
+
+    data = scraper.reparse_transcripts(output_path, cache_path)
+    assert data == expected + [uncached]
+    with open(output_path, encoding="utf-8") as f:
+        assert json.load(f) == data
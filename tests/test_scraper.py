@@ -0,0 +1,118 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import scraper
+from stub_server import page_filename
+
+# No waiting between attempts beyond the backoff jitter, and no rate limit
+FAST = {"backoff_factor": 0, "rate": 1000, "burst": 100}
+
+
+def metadata(base_url, articles):
+    return pd.DataFrame([{"date": a["date"], "title": a["title"], "url": base_url + a["url"]}
+                         for a in articles])
+
+
+def saved_urls(path):
+    with open(path, encoding="utf-8") as f:
+        return [article["url"] for article in json.load(f)]
+
+
+def test_dropped_requests_count_as_retries(fixture_pages, stub_server):
+    root, articles = fixture_pages
+    server, base_url = stub_server(root)
+    urls = [base_url + article["url"] for article in articles]
+    expected, _ = scraper.fetch_transcripts(urls, **FAST)
+
+    server, base_url = stub_server(root, drop_every=4)
+    urls = [base_url + article["url"] for article in articles]
+    results, stats = scraper.fetch_transcripts(urls, **FAST)
+
+    assert results == expected
+    assert stats["failed"] == 0
+    # Every request beyond one per page was a retry, whoever sent it
+    assert server.requests > len(urls)
+    assert stats["retries"] == server.requests - len(urls)
+
+
+def test_failed_pages_are_fetched_on_the_next_refresh(pages, stub_server, tmp_path):
+    root, articles = pages
+    server, base_url = stub_server(root)
+    meta = metadata(base_url, articles)
+    output_path = str(tmp_path / "article_transcripts.json")
+    options = dict(output_path=output_path, checkpoint_path=str(tmp_path / "checkpoint.jsonl"),
+                   cache_path=None, incremental=True, **FAST)
+
+    # On the first run one page is unavailable (503) and one is gone (404)
+    server.statuses[articles[3]["url"]] = 503
+    missing = os.path.join(root, page_filename(articles[4]["url"]))
+    os.rename(missing, missing + ".away")
+    first = scraper.scrape_transcripts(meta, **options)
+    assert [a["url"] for a in first] == [url for url in meta["url"] if url != meta["url"][3]]
+    assert first[3] == dict(meta.iloc[4].to_dict(), transcript=[], http_status=404)
+    assert saved_urls(output_path) == [a["url"] for a in first]
+
+    # The next refresh downloads the unavailable page, and only it
+    del server.statuses[articles[3]["url"]]
+    os.rename(missing + ".away", missing)
+    requests = server.requests
+    second = scraper.scrape_transcripts(meta, **options)
+    assert server.requests - requests == 1
+    assert saved_urls(output_path) == meta["url"].tolist()
+    expected, _ = scraper.fetch_transcripts(meta["url"].tolist(), **FAST)
+    assert [a["transcript"] for a in second] == expected[:4] + [[]] + expected[5:]
+    assert second[4]["http_status"] == 404
+
+    # A full run asks for every page again
+    third = scraper.scrape_transcripts(meta, **dict(options, incremental=False))
+    assert [a["transcript"] for a in third] == expected
+    assert not any("http_status" in a for a in third)
+
+
+@pytest.mark.parametrize("status, gone", [(404, True), (410, True), (400, True),
+                                          (408, False), (429, False), (500, False), (503, False)])
+def test_only_client_errors_are_permanent(pages, stub_server, tmp_path, status, gone):
+    root, articles = pages
+    server, base_url = stub_server(root, statuses={articles[0]["url"]: status})
+    meta = metadata(base_url, articles[:2])
+    data = scraper.scrape_transcripts(meta, output_path=str(tmp_path / "article_transcripts.json"),
+                                      checkpoint_path=str(tmp_path / "checkpoint.jsonl"),
+                                      cache_path=None, **FAST)
+    assert (data[0].get("http_status") == status) == gone
+    assert len(data) == (2 if gone else 1)
+
+
+def test_resume_refetches_only_failed_pages(pages, stub_server, tmp_path, monkeypatch):
+    root, articles = pages
+    server, base_url = stub_server(root)
+    meta = metadata(base_url, articles)
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    options = dict(output_path=str(tmp_path / "article_transcripts.json"),
+                   checkpoint_path=checkpoint_path, cache_path=None, **FAST)
+
+    # A run that fails on two pages (one for good) and is interrupted before compacting
+    server.statuses[articles[5]["url"]] = 503
+    server.statuses[articles[6]["url"]] = 410
+
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(scraper, "compact_checkpoint", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        scraper.scrape_transcripts(meta, **options)
+    monkeypatch.undo()
+    checkpointed = {a["url"]: a for a in scraper.read_checkpoint(checkpoint_path)}
+    assert sorted(checkpointed) == sorted(url for url in meta["url"] if url != meta["url"][5])
+    assert checkpointed[meta["url"][6]]["http_status"] == 410
+
+    # Resuming downloads the page that failed, and only that one
+    server.statuses.clear()
+    requests = server.requests
+    data = scraper.scrape_transcripts(meta, resume=True, **options)
+    assert server.requests - requests == 1
+    assert [a["url"] for a in data] == meta["url"].tolist()
+    assert data[6]["transcript"] == [] and data[6]["http_status"] == 410
+    assert not os.path.exists(checkpoint_path)
@@ -0,0 +1,154 @@
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import data_processing as dp
+
+torch = pytest.importorskip("torch")
+
+# Tokens per model input, special tokens included (the real model takes 128)
+MAX_LENGTH = 8
+PAD, CLS, SEP = 0, 1, 2
+
+
+class Inputs(dict):
+    def to(self, device):
+        return self
+
+
+class Tokenizer:
+    """One token per word, and BERT-style [CLS] ... [SEP] inputs."""
+
+    model_max_length = MAX_LENGTH
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def __call__(self, texts, add_special_tokens=False, verbose=False):
+        return {"input_ids": [[3 + sum(map(ord, word)) % 97 for word in text.split()]
+                              for text in texts]}
+
+    def build_inputs_with_special_tokens(self, ids):
+        return [CLS] + ids + [SEP]
+
+    def pad(self, encoded, return_tensors=None):
+        rows = encoded["input_ids"]
+        width = max(map(len, rows))
+        return Inputs(
+            input_ids=torch.tensor([row + [PAD] * (width - len(row)) for row in rows]),
+            attention_mask=torch.tensor([[1] * len(row) + [0] * (width - len(row)) for row in rows]),
+        )
+
+
+def model(input_ids, attention_mask):
+    """Logits from the mean of per-token features, ignoring padding."""
+    x = input_ids.to(torch.float32)
+    features = torch.stack([torch.sin(x * k) for k in (0.7, 1.3, 2.1)], dim=-1)
+    mask = attention_mask.unsqueeze(-1).to(torch.float32)
+    return SimpleNamespace(logits=3 * (features * mask).sum(1) / mask.sum(1))
+
+
+class Analyzer:
+    """pysentimiento-like analyzer whose predict takes a text or a list of texts."""
+
+    # Model order differs from _SENTIMENT_CLASSES, as in pysentimiento
+    id2label = {0: "NEG", 1: "NEU", 2: "POS"}
+    preprocessing_args = {}
+    eval_trainer = SimpleNamespace(args=SimpleNamespace(device="cpu"))
+
+    def __init__(self):
+        self.tokenizer = Tokenizer()
+        self.model = model
+
+    def predict(self, texts):
+        single = isinstance(texts, str)
+        outputs = []
+        for text in [texts] if single else texts:
+            # Truncated to the model limit, one text per forward pass
+            ids = self.tokenizer([text])["input_ids"][0][:MAX_LENGTH - 2]
+            inputs = self.tokenizer.pad({"input_ids": [self.tokenizer.build_inputs_with_special_tokens(ids)]})
+            row = torch.softmax(self.model(**inputs).logits, dim=1)[0].tolist()
+            probas = {self.id2label[i]: p for i, p in enumerate(row)}
+            outputs.append(SimpleNamespace(output=max(probas, key=probas.get), probas=probas))
+        return outputs[0] if single else outputs
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    stub = Analyzer()
+    monkeypatch.setattr(dp, "_analyzer_es", stub)
+    monkeypatch.setattr(dp, "_analyzer_state", dp._ANALYZER_LOADED)
+    preprocessing = types.ModuleType("pysentimiento.preprocessing")
+    preprocessing.preprocess_tweet = lambda text, **kwargs: text
+    monkeypatch.setitem(sys.modules, "pysentimiento", types.ModuleType("pysentimiento"))
+    monkeypatch.setitem(sys.modules, "pysentimiento.preprocessing", preprocessing)
+    return stub
+
+
+WORDS = ["hola", "seguridad", "mañanera", "pregunta", "presidenta", "salud", "país", "gracias"]
+
+
+def texts(n=40, seed=0):
+    """Texts of unsorted lengths, 1 to 12 words (over the limit from 7), and some blanks."""
+    rng = np.random.default_rng(seed)
+    out = [" ".join(rng.choice(WORDS, rng.integers(1, 13))) for _ in range(n)]
+    out[3], out[17], out[30] = "", "   ", None
+    return out
+
+
+def expected(analyzer, items):
+    """One analyzer.predict per text, as _predict_sentiment does."""
+    labels, probs = [], []
+    for text, pred in zip(items, analyzer.predict([t or "" for t in items])):
+        if not isinstance(text, str) or not text.strip():
+            labels.append("NEU")
+            probs.append([0.0, 1.0, 0.0])
+        else:
+            labels.append(pred.output)
+            probs.append([pred.probas[c] for c in dp._SENTIMENT_CLASSES])
+    return labels, np.array(probs)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 7, 64])
+def test_truncated_batches_match_predict(analyzer, batch_size):
+    items = texts()
+    labels, probs = dp._predict_sentiment_batch(items, batch_size=batch_size, split_long=False)
+    expected_labels, expected_probs = expected(analyzer, items)
+    assert labels == expected_labels
+    np.testing.assert_allclose(probs, expected_probs, rtol=0, atol=1e-6)
+
+
+def test_long_texts_average_their_windows(analyzer):
+    items = texts()
+    labels, probs = dp._predict_sentiment_batch(items, batch_size=5)
+    size = MAX_LENGTH - 2
+    for text, label, row in zip(items, labels, probs):
+        if not isinstance(text, str) or not text.strip():
+            assert label == "NEU" and row.tolist() == [0.0, 1.0, 0.0]
+            continue
+        # Windows of size words, weighted by their number of words
+        words = text.split()
+        windows = [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+        window_labels, window_probs = expected(analyzer, windows)
+        weights = np.array([len(w.split()) for w in windows], dtype=float)
+        combined = weights @ window_probs / weights.sum()
+        np.testing.assert_allclose(row, combined, rtol=0, atol=1e-6)
+        assert label == dp._SENTIMENT_CLASSES[int(combined.argmax())]
+        if len(windows) == 1:
+            assert label == window_labels[0]
+
+
+def test_order_does_not_depend_on_batching(analyzer):
+    items = texts(seed=1)
+    reference = dp._predict_sentiment_batch(items, batch_size=len(items))
+    for batch_size in (1, 2, 5):
+        labels, probs = dp._predict_sentiment_batch(items, batch_size=batch_size)
+        assert labels == reference[0]
+        np.testing.assert_allclose(probs, reference[1], rtol=0, atol=1e-6)
+    # Reversing the input reverses the output
+    labels, probs = dp._predict_sentiment_batch(items[::-1], batch_size=4)
+    assert labels == reference[0][::-1]
+    np.testing.assert_allclose(probs, reference[1][::-1], rtol=0, atol=1e-6)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+
+def _fake_batch(texts, batch_size=None, num_threads=None):
+    """Stand-in for the model whose output depends on the exact raw text."""
+    labels = ["POS" if "  " in t else "NEG" if "́" in t else "NEU" for t in texts]
+    probs = np.array([[len(t) / 100, 0.5, 1 - len(t) / 100] for t in texts])
+    return labels, probs
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    calls = []
+
+    def batch(texts, **kwargs):
+        calls.append(list(texts))
+        return _fake_batch(texts, **kwargs)
+
+    monkeypatch.setattr(dp, "_predict_sentiment_batch", batch)
+    return calls
+
+
+def test_cached_results_equal_uncached(fake_model, tmp_path):
+    texts = pd.Series(["Buenos  días", "Café y pan", "Hola", "Hola", ""])
+    expected = dp._score_sentiment(texts)
+    got = dp._cached_sentiment(texts, str(tmp_path / "sentiment.sqlite"))
+    assert got[0] == expected[0]
+    np.testing.assert_array_equal(got[1], expected[1])
+    # The model saw the raw texts, not their normalized keys
+    assert "Buenos  días" in fake_model[-1] and "Café y pan" in fake_model[-1]
+
+
+def test_second_run_is_served_from_the_cache(fake_model, tmp_path):
+    texts = ["Buenos  días", "Hola", "Hola"]
+    cache = str(tmp_path / "sentiment.sqlite")
+    first = dp._cached_sentiment(texts, cache)
+    n_calls = len(fake_model)
+    second = dp._cached_sentiment(texts, cache)
+    assert len(fake_model) == n_calls
+    assert first[0] == second[0]
+    np.testing.assert_array_equal(first[1], second[1])
+    # Each distinct text was scored once
+    assert sorted(sum(fake_model, [])) == ["Buenos  días", "Hola"]
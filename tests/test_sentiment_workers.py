@@ -0,0 +1,51 @@
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import data_processing as dp
+
+
+@pytest.fixture
+def analyzer_state(monkeypatch):
+    """Restore the module's analyzer state after the test."""
+    for name in ("_sentiment_backend", "_sentiment_onnx_path",
+                 "_analyzer_es", "_analyzer_state", "_analyzer_error"):
+        monkeypatch.setattr(dp, name, getattr(dp, name))
+
+
+@pytest.fixture
+def onnx_without_model(analyzer_state, monkeypatch):
+    # As with SENTIMENT_BACKEND=onnx and no SENTIMENT_ONNX_PATH
+    monkeypatch.setattr(dp, "_sentiment_backend", "onnx")
+    monkeypatch.setattr(dp, "_sentiment_onnx_path", None)
+    monkeypatch.setattr(dp, "_analyzer_es", None)
+    monkeypatch.setattr(dp, "_analyzer_state", dp._ANALYZER_NOT_LOADED)
+    monkeypatch.setattr(dp, "_analyzer_error", None)
+
+
+def test_bad_backend_fails_before_the_pool_starts(onnx_without_model):
+    with pytest.raises(FileNotFoundError, match="ONNX sentiment model not found"):
+        list(dp._iter_sentiment_chunks(["hola"], workers=2))
+
+
+def test_worker_initializer_keeps_the_error_for_the_first_task(onnx_without_model):
+    dp._sentiment_worker_init(1, "onnx", None)
+    state, error = dp.analyzer_status()
+    assert state == dp._ANALYZER_FAILED
+    assert isinstance(error, FileNotFoundError)
+    with pytest.raises(RuntimeError) as info:
+        dp.get_analyzer()
+    assert isinstance(info.value.__cause__, FileNotFoundError)
+
+
+def test_pool_reports_why_the_model_could_not_load(analyzer_state):
+    if dp.analyzer_status()[0] == dp._ANALYZER_LOADED or dp.warmup():
+        pytest.skip("the sentiment model loads here")
+    try:
+        list(dp._iter_sentiment_chunks(["hola", "adiós"], chunk_size=1, workers=2))
+    except BrokenProcessPool:
+        pytest.fail("worker error was lost in a BrokenProcessPool")
+    except RuntimeError as e:
+        assert "sentiment analyzer not available" in str(e)
+    else:
+        pytest.fail("scoring without a model did not raise")
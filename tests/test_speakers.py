@@ -0,0 +1,91 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+# Corpus speaker labels (up to 80 characters) and what the original
+# if/elif cascade of clean_speaker returned for them
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "data", "clean_speaker_baseline.json")
+
+# Labels picked for the rule order (first match wins) and the cleaning steps,
+# with what the original cascade returned. "PREGUNTA SECRETARIA" is a
+# secretary because the anywhere-rules for SECRETARI and DIRECTOR come first,
+# and SUBSECRETARIA/O never reaches its own rule.
+SPEAKER_CASES = [
+    ('PRESIDENTA CLAUDIA SHEINBAUM PARDO:', 'CLAUDIA SHEINBAUM PARDO'),
+    ('PRESIDENTA', 'CLAUDIA SHEINBAUM PARDO'),
+    ('presidenta claudia sheinbaum pardo', 'CLAUDIA SHEINBAUM PARDO'),
+    ('PREGUNTA:', 'PERIODISTA/PREGUNTA'),
+    ('PREGUNTA', 'PERIODISTA/PREGUNTA'),
+    ('PREGUNTA SECRETARIA', 'SECRETARIA/SECRETARIO'),
+    ('PREGUNTA DIRECTOR', 'DIRECTOR/DIRECTORA'),
+    ('PREGUNTA (INAUDIBLE):', 'PERIODISTA/PREGUNTA'),
+    ('INTERLOCUTORA:', 'INTERLOCUTOR/INTERLOCUTORA'),
+    ('—000—', None),
+    ('-000-', None),
+    ('— 000 —', None),
+    ('0', None),
+    ('___0___', None),
+    ('—', 'Unknown'),
+    ('---', 'Unknown'),
+    ('–', 'Unknown'),
+    ('SECRETARIO DE SEGURIDAD OMAR GARCÍA HARFUCH:', 'SECRETARIA/SECRETARIO'),
+    ('SUBSECRETARIA DE SALUD:', 'SECRETARIA/SECRETARIO'),
+    ('SUBSECRETARIO', 'SECRETARIA/SECRETARIO'),
+    ('CONSEJERA JURÍDICA:', 'CONSEJERA/CONSEJERO'),
+    ('PROCURADORA FEDERAL:', 'PROCURADOR/PROCURADORA'),
+    ('DIRECTORA GENERAL DEL IMSS:', 'DIRECTOR/DIRECTORA'),
+    ('COORDINADOR DE DIRECTORES:', 'DIRECTOR/DIRECTORA'),
+    ('TITULAR DE LA AGENCIA:', 'TITULAR'),
+    ('FISCAL GENERAL:', 'FISCAL'),
+    ('DIVULGADORA:', 'DIVULGADOR/DIVULGADORA'),
+    ('JEFA DE GOBIERNO:', 'JRFE/JEFA'),
+    ('JEFE DEL ESTADO MAYOR:', 'JRFE/JEFA'),
+    ('COMANDANTE DE LA GUARDIA:', 'COMANDANTE/COMANDANTA'),
+    ('VOCAL EJECUTIVO:', 'VOCAL'),
+    ('GOBERNADORA DE BAJA CALIFORNIA:', 'GOBERNADOR/GOEBERNADORA'),
+    ('GOBERNADOR SECRETARIO:', 'SECRETARIA/SECRETARIO'),
+    ('COORDINADORA NACIONAL:', 'COORDINADOR/COORDINADORA'),
+    ('VOZ DE MUJER:', 'VOZ ANÓNIMA'),
+    ('VOZ HOMBRE:', 'VOZ ANÓNIMA'),
+    ('VOZ DE NIÑO:', 'VOZ DE NIÑO'),
+    ('INTERVENCIÓN:', 'VOZ ANÓNIMA'),
+    ('INTERVENCION:', 'INTERVENCION'),
+    ('MODERADOR:', 'MODERADOR'),
+    ('MODERADORA:', 'MODERADOR'),
+    ('(FIRMA DE DECRETO)', None),
+    ('FIRMA DE DECRETOS', 'FIRMA DE DECRETOS'),
+    ('(FINALIZA VIDEO)', None),
+    ('(INICIA VIDEO)', None),
+    ('REINICIA VIDEO', None),
+    ('Gracias.', None),
+    ('GRACIAS, PRESIDENTA', None),
+    ('Muchas gracias:', None),
+    ('  JOSÉ   MERINO  :', 'JOSÉ MERINO '),
+    ('José Merino:', 'José Merino'),
+    ('PRESIDENTA::', 'CLAUDIA SHEINBAUM PARDO'),
+    ('ARTURO ZALDÍVAR (DIRECTOR):', 'DIRECTOR/DIRECTORA'),
+    ('EX SECRETARIA:', 'SECRETARIA/SECRETARIO'),
+    ('  ', None),
+    (':', ''),
+    (None, None),
+    (np.nan, None),
+]
+
+
+@pytest.mark.parametrize("raw, expected", SPEAKER_CASES)
+def test_rule_order_and_edge_cases(raw, expected):
+    assert dp.clean_speaker(raw) == expected
+
+
+def test_corpus_labels_match_the_original_cascade():
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        baseline = json.load(f)
+    raw = [label for label, _ in baseline]
+    expected = [group for _, group in baseline]
+    assert [dp.clean_speaker(label) for label in raw] == expected
+    assert dp.clean_speakers(pd.Series(raw)).tolist() == expected
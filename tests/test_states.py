@@ -0,0 +1,46 @@
+import pandas as pd
+
+import data_processing as dp
+
+
+def _mentions(texts):
+    df = pd.DataFrame({"text": texts})
+    return dict(zip(*dp.count_state_mentions(df)[["state", "mentions"]].T.values))
+
+
+def test_gobierno_de_mexico_is_not_estado_de_mexico():
+    counts = _mentions(["El Gobierno de México informa.", "Viajamos a Ciudad de México."])
+    assert counts["Estado de Mexico"] == 0
+    assert counts["Ciudad de Mexico"] == 1
+
+
+def test_multi_word_states_keep_their_words():
+    counts = _mentions([
+        "Visitamos el Estado de México y Baja California Sur.",
+        "En Baja California, y en San Luis Potosí.",
+        "Baja la inflación en California.",
+    ])
+    assert counts["Estado de Mexico"] == 1
+    assert counts["Baja California Sur"] == 1
+    # Longest match: "Baja California Sur" is not also "Baja California"
+    assert counts["Baja California"] == 1
+    assert counts["San Luis Potosi"] == 1
+
+
+def test_counts_by_group_add_up():
+    df = pd.DataFrame({
+        "date": ["2025-10-01", "2025-10-01"],
+        "speaker": ["PRESIDENTA CLAUDIA SHEINBAUM PARDO:", "PREGUNTA:"],
+        "text": ["Vamos a Sonora y a Sonora.", "¿Y el Estado de México?"],
+    })
+    by_group = dp.count_state_mentions_by_group(df)
+    assert set(by_group["speaker_group"]) == {"President/Official", "Journalist"}
+    totals = by_group.groupby("state")["mentions"].sum()
+    assert totals["Sonora"] == 2
+    assert totals["Estado de Mexico"] == 1
+
+
+def test_longest_match_wins():
+    counts = _mentions(["Visité Baja California Sur y Baja California."])
+    assert counts["Baja California Sur"] == 1
+    assert counts["Baja California"] == 1
@@ -0,0 +1,95 @@
+import random
+import re
+
+import numpy as np
+import pytest
+
+import data_processing as dp
+
+TOPICS = {
+    "security": ["seguridad", "violencia", "Guardia Nacional"],
+    "education": ["educación", "escuela", "Secretaría de Educación"],
+    # A keyword listed twice counts twice; unknown words count nothing
+    "repeated": ["salud", "salud", "palabrainexistente"],
+}
+
+
+@pytest.fixture(scope="module")
+def paragraphs(transcripts_json):
+    return dp.enrich(dp.load_transcripts(transcripts_json))
+
+
+@pytest.fixture(scope="module")
+def clean(paragraphs):
+    return dp.clean_text_series(paragraphs["text"]).tolist()
+
+
+@pytest.fixture(scope="module")
+def index(paragraphs):
+    return dp.build_term_index(paragraphs)
+
+
+def corpus_topics(clean, n_topics=6, n_keywords=20, seed=0):
+    """Topics of corpus words and two-word phrases."""
+    rng = random.Random(seed)
+    tokens = " ".join(clean).split()
+    vocab = sorted(set(tokens))
+    topics = {}
+    for t in range(n_topics):
+        words = []
+        for _ in range(n_keywords):
+            if rng.random() < 0.3:
+                i = rng.randrange(len(tokens) - 1)
+                words.append(f"{tokens[i]} {tokens[i + 1]}")
+            else:
+                words.append(rng.choice(vocab))
+        topics[f"topic_{t}"] = words
+    return topics
+
+
+def regex_counts(clean, topics):
+    """Whole-word (possibly overlapping) matches of the cleaned keywords, one regex each."""
+    counts = np.zeros((len(clean), len(topics)), dtype=np.int64)
+    for j, words in enumerate(topics.values()):
+        for word in words:
+            pattern = re.compile(rf"(?=(?<!\S){re.escape(dp.clean_text(word))}(?!\S))")
+            counts[:, j] += [len(pattern.findall(text)) for text in clean]
+    return counts
+
+
+def cleaned(topics):
+    return {name: [dp.clean_text(w) for w in words] for name, words in topics.items()}
+
+
+@pytest.mark.parametrize("make_topics", [lambda clean: TOPICS, corpus_topics])
+def test_index_counts_match_regex(index, clean, make_topics):
+    topics = make_topics(clean)
+    counts = dp.index_topic_matrix(index, topics)
+    assert counts.any()
+    assert np.array_equal(counts, regex_counts(clean, topics))
+
+
+def test_weekly_tables_match_the_scan(paragraphs, index):
+    # The scan matches keywords as given, so it gets them cleaned
+    topics = cleaned(TOPICS)
+    assert dp.get_topics_by_week(paragraphs, topics, whole_words=True).equals(
+        dp.get_topics_by_week_from_index(index, TOPICS)
+    )
+    assert dp.get_topics_by_week_by_group(paragraphs, topics, whole_words=True).equals(
+        dp.get_topics_by_week_by_group_from_index(index, TOPICS)
+    )
+
+
+def test_saved_index_loads_back(paragraphs, index, tmp_path):
+    path = tmp_path / "term_index.npz"
+    dp.build_term_index(paragraphs, path)
+    loaded = dp.load_term_index(path)
+    assert np.array_equal(dp.index_topic_matrix(loaded, TOPICS), dp.index_topic_matrix(index, TOPICS))
+
+    # An index written by another version is refused
+    with np.load(path) as npz:
+        arrays = dict(npz)
+    arrays["version"] = np.array(dp.TERM_INDEX_VERSION + 1)
+    np.savez(path, **arrays)
+    with pytest.raises(ValueError):
+        dp.load_term_index(path)
@@ -0,0 +1,95 @@
+import random
+import re
+
+import numpy as np
+import pytest
+
+import data_processing as dp
+
+
+@pytest.fixture(scope="module")
+def clean(transcripts_json):
+    return dp.clean_text_series(dp.load_transcripts(transcripts_json)["text"]).tolist()
+
+
+def corpus_topics(clean, n_topics=8, n_keywords=30, seed=0):
+    """Topics of corpus words, word pieces and two-word phrases."""
+    rng = random.Random(seed)
+    tokens = " ".join(clean).split()
+    topics = {}
+    for t in range(n_topics):
+        words = []
+        for _ in range(n_keywords):
+            i = rng.randrange(len(tokens) - 1)
+            kind = rng.random()
+            if kind < 0.2:
+                words.append(f"{tokens[i]} {tokens[i + 1]}")
+            elif kind < 0.4:
+                words.append(tokens[i][:3])
+            else:
+                words.append(tokens[i])
+        topics[f"topic_{t}"] = words
+    return topics
+
+
+def str_count(texts, topics):
+    """The original per-keyword `text.count(keyword)` sums (empty keywords left out)."""
+    return np.array([[sum(t.count(w) for w in words if w) for words in topics.values()]
+                     for t in texts], dtype=np.int64).reshape(len(texts), len(topics))
+
+
+def whole_word_count(texts, topics):
+    """Non-overlapping matches of each keyword between word boundaries."""
+    # One scan of all texts joined by newlines; matches never span two texts
+    starts = np.cumsum([0] + [len(t) + 1 for t in texts])
+    joined = "\n".join(texts)
+    counts = np.zeros((len(texts), len(topics)), dtype=np.int64)
+    for j, words in enumerate(topics.values()):
+        for w in filter(None, words):
+            # Clean text is [a-z0-9 ], where \b is the alphanumeric boundary
+            pattern = re.compile(rf"\b{re.escape(w)}\b")
+            positions = [m.start() for m in pattern.finditer(joined)]
+            np.add.at(counts[:, j], np.searchsorted(starts, positions, side="right") - 1, 1)
+    return counts
+
+
+def test_matcher_matches_str_count_on_the_corpus(clean):
+    topics = corpus_topics(clean)
+    counts = dp.count_topic_matrix(clean, dp.compile_topics(topics))
+    assert counts.any()
+    assert np.array_equal(counts, str_count(clean, topics))
+
+
+def test_whole_words_on_the_corpus(clean):
+    # Fewer keywords: the regex reference is slow on frequent words
+    topics = corpus_topics(clean, n_topics=4, n_keywords=15)
+    counts = dp.count_topic_matrix(clean, dp.compile_topics(topics, whole_words=True))
+    assert np.array_equal(counts, whole_word_count(clean, topics))
+    assert (counts <= dp.count_topic_matrix(clean, dp.compile_topics(topics))).all()
+
+
+TEXTS = ["aaaa", "banana", "septiembre sep sep", "seguridad salud seguridad publica", "", "abc"]
+TOPICS = {
+    "overlap": ["aa", "ana"],                   # str.count never overlaps one keyword
+    "nested": ["seguridad", "seguridad publica", "dad"],
+    "repeated": ["sep", "sep"],                 # listed twice, counted twice
+    "shared": ["salud", "sep"],                 # a keyword in two topics
+    "empty": ["", "zzz"],
+}
+
+
+@pytest.mark.parametrize("whole_words", [False, True])
+def test_hand_picked_cases(whole_words):
+    counts = dp.count_topic_matrix(TEXTS, dp.compile_topics(TOPICS, whole_words))
+    expected = whole_word_count(TEXTS, TOPICS) if whole_words else str_count(TEXTS, TOPICS)
+    assert np.array_equal(counts, expected)
+
+
+def test_empty_keywords_count_nothing():
+    counts = dp.count_topic_matrix(TEXTS, dp.compile_topics({"empty": [""]}))
+    assert counts.sum() == 0
+
+
+def test_non_strings_count_nothing():
+    counts = dp.count_topic_matrix([None, float("nan"), "sep"], dp.compile_topics(TOPICS))
+    assert counts[:2].sum() == 0 and counts[2].sum() > 0
@@ -0,0 +1,61 @@
+import json
+
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def source(transcripts_json, tmp_path):
+    """A copy of the transcripts the test can modify."""
+    path = tmp_path / "article_transcripts.json"
+    path.write_bytes(open(transcripts_json, "rb").read())
+    return str(path)
+
+
+def test_cache_matches_the_parsed_table(source, tmp_path):
+    cache = str(tmp_path / "transcripts.parquet")
+    expected = dp.enrich(dp.load_transcripts(source))
+    pd.testing.assert_frame_equal(dp.load_transcript_table(source, cache), expected)
+    # Second read comes from the cache
+    assert dp.read_cache_fingerprint(cache) == dp._cache_fingerprint([source])
+    pd.testing.assert_frame_equal(dp.load_transcript_table(source, cache), expected)
+
+
+def test_filters_match_boolean_masks(source, tmp_path):
+    cache = str(tmp_path / "transcripts.parquet")
+    df = dp.enrich(dp.load_transcripts(source))
+    start, end = df["date"].sort_values().iloc[[len(df) // 4, len(df) // 2]]
+    got = dp.load_transcript_table(source, cache, start=start, end=end,
+                                   speaker_groups=["Journalist"])
+    mask = df["date"].between(start, end) & (df["speaker_group"] == "Journalist")
+    assert mask.any()
+    pd.testing.assert_frame_equal(got, df[mask])
+
+
+def test_changed_source_rebuilds_the_cache(source, tmp_path):
+    cache = str(tmp_path / "transcripts.parquet")
+    dp.load_transcript_table(source, cache)
+    old_fingerprint = dp.read_cache_fingerprint(cache)
+
+    with open(source, encoding="utf-8") as f:
+        articles = json.load(f)
+    articles[0]["transcript"].append({"speaker": "PREGUNTA:", "text": "PREGUNTA: ¿Algo nuevo?"})
+    with open(source, "w", encoding="utf-8") as f:
+        json.dump(articles, f, ensure_ascii=False)
+
+    df = dp.load_transcript_table(source, cache)
+    assert dp.read_cache_fingerprint(cache) != old_fingerprint
+    assert (df["text"] == "PREGUNTA: ¿Algo nuevo?").sum() == 1
+    pd.testing.assert_frame_equal(df, dp.enrich(dp.load_transcripts(source)))
+
+
+def test_unreadable_cache_is_rebuilt(source, tmp_path):
+    cache = tmp_path / "transcripts.parquet"
+    cache.write_bytes(b"not parquet")
+    assert dp.read_cache_fingerprint(str(cache)) is None
+    pd.testing.assert_frame_equal(dp.load_transcript_table(source, str(cache)),
+                                  dp.enrich(dp.load_transcripts(source)))
@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+import data_processing as dp
+
+P, S, Q = "PRESIDENTA CLAUDIA SHEINBAUM PARDO:", "SECRETARIO OMAR GARCÍA HARFUCH:", "PREGUNTA:"
+
+# (date, url, speaker) of each paragraph, in transcript order
+PARAGRAPHS = [
+    # Journalists from the fourth paragraph; None and '—000—' are not turns
+    *[("2025-10-01", "/a", s) for s in [P, S, P, Q, P, Q, Q, None, "—000—", S, P]],
+    # No journalist: left out of both tables
+    *[("2025-10-02", "/b", s) for s in [P, S, P]],
+    # Two conferences on one day: 'after' runs on into the second one
+    *[("2025-10-03", "/c", s) for s in [P, Q, P]],
+    *[("2025-10-03", "/d", s) for s in [P, S, Q, P]],
+]
+
+
+def paragraphs():
+    df = pd.DataFrame(PARAGRAPHS, columns=["date", "url", "speaker"])
+    return df.assign(date=pd.to_datetime(df["date"]), title=df["url"], text="uno dos tres")
+
+
+def table(rows):
+    df = pd.DataFrame(rows, columns=dp._TURN_COLUMNS[:-1])
+    df["date"] = pd.to_datetime(df["date"])
+    df["ratio_president_journalist"] = df["president_turns"] / df["journalist_turns"]
+    return df
+
+
+def assert_same_table(got, expected):
+    got = got.reset_index(drop=True)
+    assert got["date"].dtype == "datetime64[ns]"
+    assert got[["date", *dp._TURN_SUMS]].astype({c: int for c in dp._TURN_SUMS}).equals(
+        expected[["date", *dp._TURN_SUMS]]
+    )
+    assert got["ratio_president_journalist"].astype(float).tolist() == pytest.approx(
+        expected["ratio_president_journalist"].tolist()
+    )
+
+
+def test_turn_counts_by_hand(tmp_path):
+    df = paragraphs()
+    whole = table([("2025-10-01", 9, 4, 3), ("2025-10-03", 7, 4, 2)])
+    after = table([("2025-10-01", 6, 2, 3), ("2025-10-03", 6, 3, 2)])
+
+    assert_same_table(dp.get_turn_taking_stats(df), whole)
+    assert_same_table(dp.get_turn_taking_stats_interact(df), after)
+
+    # The aggregate store gives the same tables
+    partials = dp.update_aggregate_store(df, tmp_path / "store.sqlite", {})
+    for got, expected in zip(dp.get_turn_taking_tables(partials), [whole, after]):
+        assert_same_table(got, expected)
+
+
+def test_consecutive_paragraphs_count_as_one_turn(tmp_path):
+    df = paragraphs()
+    # Repeated speakers merge; a speaker going on in the next conference does not
+    whole = table([("2025-10-01", 8, 4, 2), ("2025-10-03", 7, 4, 2)])
+    after = table([("2025-10-01", 5, 2, 2), ("2025-10-03", 6, 3, 2)])
+
+    assert_same_table(dp.get_turn_taking_stats(df, turns=True), whole)
+    assert_same_table(dp.get_turn_taking_stats_interact(df, turns=True), after)
+    for got, expected in zip(dp.get_turn_taking_tables(dp.collapse_turns(df)), [whole, after]):
+        assert_same_table(got, expected)
+
+    partials = dp.update_aggregate_store(df, tmp_path / "store.sqlite", {})
+    with pytest.raises(ValueError):
+        dp.get_turn_taking_tables(partials, turns=True)
+
+
+def test_turn_table_points_into_the_paragraphs():
+    df = paragraphs().assign(text=[f"párrafo {i}" for i in range(len(PARAGRAPHS))])
+    turns = dp.collapse_turns(df, with_text=True)
+    assert dp.is_turn_table(turns)
+    assert turns["n_paragraphs"].tolist() == [1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+    assert turns["n_paragraphs"].sum() == len(df)
+    assert (turns["n_words"] == 2 * turns["n_paragraphs"]).all()
+    for turn in turns.itertuples():
+        texts = df["text"].iloc[turn.para_start:turn.para_end]
+        assert turn.text == dp.TURN_TEXT_SEP.join(texts)
+        assert set(df["url"].iloc[turn.para_start:turn.para_end]) == {turn.url}
+    assert turns["text"].equals(dp.turn_texts(turns, df))